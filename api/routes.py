@@ -1,40 +1,86 @@
+import hashlib
+import time
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Callable, List, Optional, Tuple, Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+import orjson
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 
 from db import get_db
 from models.thought import (
+    Thought,
     ThoughtCreate,
     ThoughtQuery,
     ThoughtResponse,
     ThoughtsListResponse,
     ThoughtUpdate,
 )
-from services import thought_logger
+from services import TTLCache, thought_logger
+
+router = APIRouter(
+    prefix="/api/v1",
+    tags=["thoughts"],
+    default_response_class=ORJSONResponse,
+)
+
+_CATEGORY_NAMES = ("perception", "reflection", "decision", "tick", "error")
+_VALID_CATEGORIES: frozenset[str] = frozenset(_CATEGORY_NAMES)
+_INVALID_CATEGORY_DETAIL = f"Invalid category. Must be one of: {', '.join(_CATEGORY_NAMES)}"
+
+
+def _to_response(thought: Thought) -> ThoughtResponse:
+    """Re-type an already validated Thought without another validation pass."""
+    return ThoughtResponse.model_construct(**dict(thought))
+
+
+def _etag(thought: Thought) -> str:
+    """Strong validator over every mutable field of a thought."""
+    fingerprint = (
+        f"{thought.id}:{thought.category}:{thought.emotion}:{thought.importance}:"
+        f"{','.join(thought.tags)}:{thought.content}"
+    )
+    return f'"{hashlib.blake2b(fingerprint.encode(), digest_size=8).hexdigest()}"'
 
-router = APIRouter(prefix="/api/v1", tags=["thoughts"])
+
+# Recently read thoughts, keyed by UUID; invalidated on update/delete through
+# this API only. Writes made by the CLI or the web dashboard do not touch it,
+# so API readers may see their changes up to ttl seconds late.
+thought_cache = TTLCache(maxsize=4096, ttl=30)
 
 
 @router.post("/thoughts", response_model=ThoughtResponse, status_code=201)
-async def create_thought(
+def create_thought(
     thought: ThoughtCreate,
     db: Session = Depends(get_db)
 ) -> ThoughtResponse:
     """Create a new thought."""
     try:
         created_thought = thought_logger.create_thought(db, thought)
-        return ThoughtResponse(**created_thought.model_dump())
+        return _to_response(created_thought)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/thoughts/bulk", response_model=List[ThoughtResponse], status_code=201)
+def create_thoughts_bulk(
+    thoughts: List[ThoughtCreate],
+    db: Session = Depends(get_db)
+) -> List[ThoughtResponse]:
+    """Create many thoughts in a single transaction."""
+    try:
+        created_thoughts = thought_logger.create_thoughts_bulk(db, thoughts)
+        return [_to_response(thought) for thought in created_thoughts]
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.get("/thoughts", response_model=ThoughtsListResponse)
-async def list_thoughts(
+def list_thoughts(
     category: Optional[str] = Query(None),
     tags: Optional[List[str]] = Query(None),
     emotion: Optional[str] = Query(None),
@@ -45,6 +91,7 @@ async def list_thoughts(
     search_term: Optional[str] = Query(None),
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
+    after: Optional[str] = Query(None, description="Cursor from a previous next_cursor"),
     order_by: str = Query("timestamp"),
     order_desc: bool = Query(True),
     db: Session = Depends(get_db)
@@ -52,13 +99,8 @@ async def list_thoughts(
     """List thoughts with optional filtering and pagination."""
     
     # Validate category if provided
-    if category is not None:
-        valid_categories = ["perception", "reflection", "decision", "tick", "error"]
-        if category not in valid_categories:
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Invalid category. Must be one of: {', '.join(valid_categories)}"
-            )
+    if category is not None and category not in _VALID_CATEGORIES:
+        raise HTTPException(status_code=400, detail=_INVALID_CATEGORY_DETAIL)
     
     try:
         query = ThoughtQuery(
@@ -72,6 +114,7 @@ async def list_thoughts(
             search_term=search_term,
             page=page,
             size=page_size,
+            cursor=after,
             order_by=order_by,
             order_desc=order_desc,
         )
@@ -83,133 +126,139 @@ async def list_thoughts(
 
 
 @router.get("/thoughts/{thought_id}", response_model=ThoughtResponse)
-async def get_thought(
+def get_thought(
     thought_id: UUID,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db)
-) -> ThoughtResponse:
-    """Get a specific thought by ID."""
-    thought = thought_logger.get_thought(db, thought_id)
-    if not thought:
-        raise HTTPException(status_code=404, detail="Thought not found")
-    return ThoughtResponse(**thought.model_dump())
+) -> Union[ThoughtResponse, Response]:
+    """Get a specific thought by ID.
+    
+    Responds 304 Not Modified when If-None-Match matches the current ETag.
+    """
+    thought = thought_cache.get(thought_id)
+    if thought is None:
+        thought = thought_logger.get_thought(db, thought_id)
+        if not thought:
+            raise HTTPException(status_code=404, detail="Thought not found")
+        thought_cache.set(thought_id, thought)
+    
+    etag = _etag(thought)
+    if if_none_match == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return _to_response(thought)
 
 
 @router.put("/thoughts/{thought_id}", response_model=ThoughtResponse)
-async def update_thought(
+def update_thought(
     thought_id: UUID,
     update_data: ThoughtUpdate,
     db: Session = Depends(get_db)
 ) -> ThoughtResponse:
     """Update an existing thought."""
+    # Popped on both sides of the write: a GET landing before the commit
+    # would otherwise re-cache the old row
+    thought_cache.pop(thought_id)
     thought = thought_logger.update_thought(db, thought_id, update_data)
+    thought_cache.pop(thought_id)
     if not thought:
         raise HTTPException(status_code=404, detail="Thought not found")
-    return ThoughtResponse(**thought.model_dump())
+    return _to_response(thought)
 
 
 @router.delete("/thoughts/{thought_id}", status_code=204)
-async def delete_thought(
+def delete_thought(
     thought_id: UUID,
     db: Session = Depends(get_db)
 ) -> None:
     """Delete a thought by ID."""
+    thought_cache.pop(thought_id)
     success = thought_logger.delete_thought(db, thought_id)
+    thought_cache.pop(thought_id)
     if not success:
         raise HTTPException(status_code=404, detail="Thought not found")
 
 
 # Convenience endpoints for specific thought categories
 
-@router.post("/thoughts/perception", response_model=ThoughtResponse, status_code=201)
-async def log_perception(
-    content: str,
-    tags: Optional[List[str]] = None,
-    emotion: Optional[str] = None,
-    importance: Optional[float] = None,
-    db: Session = Depends(get_db)
-) -> ThoughtResponse:
-    """Log a perception thought."""
-    try:
-        thought = thought_logger.log_perception(
-            db, content, tags=tags or [], emotion=emotion, importance=importance
-        )
-        return ThoughtResponse(**thought.model_dump())
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
-
-
-@router.post("/thoughts/reflection", response_model=ThoughtResponse, status_code=201)
-async def log_reflection(
-    content: str,
-    tags: Optional[List[str]] = None,
-    emotion: Optional[str] = None,
-    importance: Optional[float] = None,
-    db: Session = Depends(get_db)
-) -> ThoughtResponse:
-    """Log a reflection thought."""
-    try:
-        thought = thought_logger.log_reflection(
-            db, content, tags=tags or [], emotion=emotion, importance=importance
-        )
-        return ThoughtResponse(**thought.model_dump())
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+_CATEGORY_ROUTE_DOCS = {
+    "perception": "Log a perception thought.",
+    "reflection": "Log a reflection thought.",
+    "decision": "Log a decision thought.",
+    "tick": "Log a system tick thought.",
+    "error": "Log an error thought.",
+}
 
 
-@router.post("/thoughts/decision", response_model=ThoughtResponse, status_code=201)
-async def log_decision(
-    content: str,
-    tags: Optional[List[str]] = None,
-    emotion: Optional[str] = None,
-    importance: Optional[float] = None,
-    db: Session = Depends(get_db)
-) -> ThoughtResponse:
-    """Log a decision thought."""
-    try:
-        thought = thought_logger.log_decision(
-            db, content, tags=tags or [], emotion=emotion, importance=importance
-        )
-        return ThoughtResponse(**thought.model_dump())
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+def _make_category_route(category: str, with_emotion: bool) -> Callable[..., ThoughtResponse]:
+    """Build a POST handler with its category bound at import time."""
+    
+    def log_with_emotion(
+        content: str,
+        tags: Optional[List[str]] = None,
+        emotion: Optional[str] = None,
+        importance: Optional[float] = None,
+        db: Session = Depends(get_db)
+    ) -> ThoughtResponse:
+        return _log_category(db, content, tags, emotion, importance)
+    
+    def log_without_emotion(
+        content: str,
+        tags: Optional[List[str]] = None,
+        importance: Optional[float] = None,
+        db: Session = Depends(get_db)
+    ) -> ThoughtResponse:
+        return _log_category(db, content, tags, None, importance)
+    
+    def _log_category(
+        db: Session,
+        content: str,
+        tags: Optional[List[str]],
+        emotion: Optional[str],
+        importance: Optional[float],
+    ) -> ThoughtResponse:
+        try:
+            thought = thought_logger.create_thought(db, ThoughtCreate(
+                category=category,
+                content=content,
+                tags=tags or [],
+                emotion=emotion,
+                importance=importance,
+            ))
+            return _to_response(thought)
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
+    log_category = log_with_emotion if with_emotion else log_without_emotion
+    log_category.__name__ = f"log_{category}"
+    log_category.__doc__ = _CATEGORY_ROUTE_DOCS[category]
+    return log_category
 
 
-@router.post("/thoughts/tick", response_model=ThoughtResponse, status_code=201)
-async def log_tick(
-    content: str,
-    tags: Optional[List[str]] = None,
-    importance: Optional[float] = None,
-    db: Session = Depends(get_db)
-) -> ThoughtResponse:
-    """Log a system tick thought."""
-    try:
-        thought = thought_logger.log_tick(
-            db, content, tags=tags or [], importance=importance
-        )
-        return ThoughtResponse(**thought.model_dump())
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+for _category in _CATEGORY_NAMES:
+    router.add_api_route(
+        f"/thoughts/{_category}",
+        _make_category_route(_category, with_emotion=_category not in ("tick", "error")),
+        methods=["POST"],
+        response_model=ThoughtResponse,
+        status_code=201,
+    )
 
 
-@router.post("/thoughts/error", response_model=ThoughtResponse, status_code=201)
-async def log_error(
-    content: str,
-    tags: Optional[List[str]] = None,
-    importance: Optional[float] = None,
-    db: Session = Depends(get_db)
-) -> ThoughtResponse:
-    """Log an error thought."""
-    try:
-        thought = thought_logger.log_error(
-            db, content, tags=tags or [], importance=importance
-        )
-        return ThoughtResponse(**thought.model_dump())
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+# Health check endpoint; the encoded payload is reused for up to a second
+_last_health: Tuple[float, Optional[bytes]] = (0.0, None)
 
 
-# Health check endpoint
 @router.get("/health")
-async def health_check():
+async def health_check() -> Response:
     """Health check endpoint."""
-    return {"status": "healthy", "timestamp": datetime.now(timezone.utc).isoformat()}
+    global _last_health
+    now = time.monotonic()
+    built_at, body = _last_health
+    if body is None or now - built_at >= 1.0:
+        body = orjson.dumps(
+            {"status": "healthy", "timestamp": datetime.now(timezone.utc).isoformat()}
+        )
+        _last_health = (now, body)
+    return Response(content=body, media_type="application/json")
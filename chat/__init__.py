@@ -2,7 +2,7 @@
 
 from .interface import ChatInterface
 from .providers import AIProvider, GeminiProvider, OpenAIProvider
-from .utils import analyze_emotion, calculate_importance, format_timestamp
+from .utils import analyze_emotion, calculate_importance, extract_features, format_timestamp
 
 __all__ = [
     "ChatInterface",
@@ -11,5 +11,6 @@ __all__ = [
     "OpenAIProvider",
     "analyze_emotion",
     "calculate_importance", 
+    "extract_features",
     "format_timestamp"
 ]
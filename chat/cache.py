@@ -0,0 +1,115 @@
+"""Exact-match response cache for deterministic AI provider calls."""
+
+import functools
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional, TypeVar, cast
+
+import orjson
+
+
+class LLMCache:
+    """Thread-safe LRU mapping request fingerprints to provider responses."""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: Optional[str],
+        prompt: str,
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+    ) -> str:
+        """SHA-256 fingerprint of everything that determines the response."""
+        payload = orjson.dumps(
+            {
+                "provider": provider,
+                "model": model,
+                "prompt": prompt,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+            },
+            option=orjson.OPT_SORT_KEYS,
+        )
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, key: str) -> Any:
+        """Return the cached response for key, or None."""
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a response, evicting the least recently used one when full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+# Shared by all providers unless one is given its own cache
+default_cache = LLMCache()
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _cache_key(provider: Any, prompt: str) -> Optional[str]:
+    """Key for a provider call, or None when the call is not deterministic."""
+    if provider.cache is None or provider.temperature != 0:
+        return None
+    return LLMCache.make_key(
+        provider.provider_name,
+        getattr(provider, "model_name", None),
+        prompt,
+        provider.temperature,
+        provider.max_tokens,
+    )
+
+
+def cached_response(func: F) -> F:
+    """Serve repeated deterministic prompts from provider.cache."""
+    @functools.wraps(func)
+    def wrapper(self: Any, prompt: str, *args: Any, **kwargs: Any) -> Any:
+        key = _cache_key(self, prompt)
+        if key is not None:
+            hit = self.cache.get(key)
+            if hit is not None:
+                return hit
+        response = func(self, prompt, *args, **kwargs)
+        if key is not None:
+            self.cache.set(key, response)
+        return response
+    return cast(F, wrapper)
+
+
+def acached_response(func: F) -> F:
+    """Async counterpart of cached_response."""
+    @functools.wraps(func)
+    async def wrapper(self: Any, prompt: str, *args: Any, **kwargs: Any) -> Any:
+        key = _cache_key(self, prompt)
+        if key is not None:
+            hit = self.cache.get(key)
+            if hit is not None:
+                return hit
+        response = await func(self, prompt, *args, **kwargs)
+        if key is not None:
+            self.cache.set(key, response)
+        return response
+    return cast(F, wrapper)
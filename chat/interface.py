@@ -1,25 +1,32 @@
 """Main chat interface for conversational AI interaction."""
 
+import atexit
+import logging
+import queue
 import sys
+import threading
+import time
+from collections import deque
 from typing import Optional, List
 from datetime import datetime
 from rich.console import Console
+from rich.live import Live
 from rich.prompt import Prompt
 from rich.panel import Panel
 from rich.text import Text
 
 from chat.providers import AIProvider, get_provider
 from chat.utils import (
-    analyze_emotion, 
-    calculate_importance, 
-    extract_tags, 
+    extract_features,
     clean_ai_response,
     format_chat_display
 )
 from models.thought import ThoughtCreate
-from services.logger import ThoughtLogger
+from services.logger import ThoughtLogger, thought_logger as shared_thought_logger
 from db.session import DatabaseManager
 
+logger = logging.getLogger(__name__)
+
 
 class ChatInterface:
     """Main chat interface for AI conversation."""
@@ -47,12 +54,21 @@ class ChatInterface:
         
         # Conversation history for context
         self.enable_history = enable_history
-        self.conversation_history: List[dict] = []
         self.max_history_length = 10  # Keep last 10 exchanges
+        # *2 for user+assistant pairs; the deque drops the oldest itself
+        self.conversation_history: "deque[dict]" = deque(maxlen=self.max_history_length * 2)
         
         # Streaming support
         self.enable_streaming = enable_streaming
         
+        # Thought logging runs on a background writer so the chat loop never
+        # waits on a DB commit. The writer starts on the first queued message;
+        # close() (also run at exit) flushes it
+        self._logging_enabled = bool(self.db_manager and self.thought_logger)
+        self._log_queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._log_writer: Optional[threading.Thread] = None
+        self._log_writer_lock = threading.Lock()
+        
         # Display provider info
         provider_type = type(self.provider).__name__
         if provider_type == "MockProvider":
@@ -71,47 +87,96 @@ class ChatInterface:
         category: str, 
         is_ai_response: bool = False
     ) -> None:
-        """Log a chat message as a thought."""
-        if not (self.db_manager and self.thought_logger):
+        """Queue a chat message to be logged as a thought."""
+        if not self._logging_enabled:
             return  # Skip logging if no database connection
         
+        self._ensure_log_writer()
+        self._log_queue.put((content, category, is_ai_response))
+    
+    def _ensure_log_writer(self) -> None:
+        """Start the writer thread on first use and flush it at interpreter exit."""
+        with self._log_writer_lock:
+            if self._log_writer is not None:
+                return
+            self._log_writer = threading.Thread(
+                target=self._drain_log_queue, name="chat-thought-writer", daemon=True
+            )
+            self._log_writer.start()
+            atexit.register(self.close)
+    
+    def _drain_log_queue(self, batch_size: int = 32, wait: float = 0.1) -> None:
+        """Writer thread: batch queued chat messages into bulk inserts."""
+        stopping = False
+        while not stopping:
+            item = self._log_queue.get()
+            if item is None:
+                break
+            batch = [item]
+            # Collect whatever else arrives within the wait window
+            while len(batch) < batch_size:
+                try:
+                    item = self._log_queue.get(timeout=wait)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._write_log_batch(batch)
+    
+    def _write_log_batch(self, batch: List[tuple]) -> None:
+        """Analyze and insert a batch of queued chat messages."""
+        if self.db_manager is None or self.thought_logger is None:
+            return
         try:
-            with self.db_manager.get_session() as session:
-                # Analyze the message
-                emotion = analyze_emotion(content)
-                importance = calculate_importance(content, is_ai_response)
-                tags = extract_tags(content, is_ai_response)
-                
-                # Create thought
-                thought = ThoughtCreate(
+            thoughts = []
+            for content, category, is_ai_response in batch:
+                features = extract_features(content, is_ai_response)
+                thoughts.append(ThoughtCreate(
                     category=category,  # type: ignore
                     content=content,
-                    tags=tags,
-                    emotion=emotion,
-                    importance=importance
-                )
-                
-                # Log to database
-                self.thought_logger.create_thought(session, thought)
+                    tags=list(features.tags),
+                    emotion=features.emotion,
+                    importance=features.importance
+                ))
+            
+            with self.db_manager.get_session() as session:
+                self.thought_logger.create_thoughts_bulk(session, thoughts)
                 
         except Exception as e:
-            # Don't let logging errors break the chat
-            self.console.print(f"⚠️  Logging error: {e}", style="red dim")
+            # Don't let logging errors break the chat; this runs on the writer
+            # thread, so report through logging rather than the live console
+            logger.error(f"Chat thought logging error: {e}")
+    
+    def close(self) -> None:
+        """Flush pending thought logs and stop the writer thread."""
+        with self._log_writer_lock:
+            writer, self._log_writer = self._log_writer, None
+        if writer is None:
+            return
+        atexit.unregister(self.close)
+        self._log_queue.put(None)
+        writer.join()
+    
+    def __enter__(self) -> "ChatInterface":
+        return self
+    
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
     
     def add_to_history(self, role: str, content: str) -> None:
         """Add a message to conversation history."""
         if not self.enable_history:
             return
         
+        now = datetime.now()
         self.conversation_history.append({
             "role": role,
             "content": content,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now.isoformat(),
+            "time_str": now.strftime('%H:%M:%S'),
         })
-        
-        # Keep only the last N exchanges
-        if len(self.conversation_history) > self.max_history_length * 2:  # *2 for user+assistant pairs
-            self.conversation_history = self.conversation_history[-self.max_history_length * 2:]
     
     def get_context_for_ai(self, current_prompt: str) -> str:
         """Get conversation context for AI providers that don't support message history."""
@@ -120,7 +185,7 @@ class ChatInterface:
         
         # For providers that don't support message arrays, build context string
         context_parts = []
-        for msg in self.conversation_history[-6:]:  # Last 6 messages for context
+        for msg in list(self.conversation_history)[-6:]:  # Last 6 messages for context
             role = "User" if msg["role"] == "user" else "Assistant"
             context_parts.append(f"{role}: {msg['content']}")
         
@@ -144,18 +209,11 @@ class ChatInterface:
             return
         
         history_text = Text()
-        for i, msg in enumerate(self.conversation_history[-10:], 1):  # Show last 10
+        for i, msg in enumerate(list(self.conversation_history)[-10:], 1):  # Show last 10
             role = "👤 You" if msg["role"] == "user" else "🤖 AI"
-            timestamp = msg.get("timestamp", "")
-            if timestamp:
-                # Format timestamp nicely
-                from datetime import datetime
-                try:
-                    dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                    time_str = dt.strftime('%H:%M:%S')
-                    history_text.append(f"{role} ({time_str}):\n", style="bold")
-                except:
-                    history_text.append(f"{role}:\n", style="bold")
+            time_str = msg.get("time_str")
+            if time_str:
+                history_text.append(f"{role} ({time_str}):\n", style="bold")
             else:
                 history_text.append(f"{role}:\n", style="bold")
             
@@ -167,31 +225,34 @@ class ChatInterface:
     
     def get_streaming_response(self, prompt: str) -> str:
         """Get streaming AI response with real-time display."""
-        from rich.live import Live
-        from rich.text import Text
-        
         self.console.print("🤔 AI is thinking...", style="dim")
         
-        # Initialize response display
+        # Initialize response display; chunks are appended in place
         response_text = Text()
         response_text.append("AI: ", style="bold green")
         
-        full_response = ""
+        chunks: List[str] = []
+        pending = 0
+        last_refresh = time.monotonic()
         
         try:
-            with Live(response_text, console=self.console, refresh_per_second=10) as live:
+            with Live(response_text, console=self.console, auto_refresh=False) as live:
                 for chunk in self.provider.stream_ai_model(prompt):
                     if chunk:
-                        full_response += chunk
-                        # Update the displayed text
-                        new_text = Text()
-                        new_text.append("AI: ", style="bold green")
-                        new_text.append(full_response)
-                        live.update(new_text)
+                        chunks.append(chunk)
+                        response_text.append(chunk)
+                        pending += len(chunk)
+                        # Redraw in bursts rather than once per token
+                        now = time.monotonic()
+                        if pending > 32 or now - last_refresh >= 0.05:
+                            live.refresh()
+                            pending = 0
+                            last_refresh = now
+                live.refresh()
             
             # Final newline after streaming
             self.console.print()
-            return clean_ai_response(full_response)
+            return clean_ai_response("".join(chunks))
             
         except Exception as e:
             # Fall back to regular response
@@ -275,26 +336,20 @@ class ChatInterface:
         
         try:
             with self.db_manager.get_session() as session:
-                # Get recent thoughts from this chat session (rough estimate)
-                from models.thought import ThoughtQuery
-                query = ThoughtQuery(
-                    page=1,
-                    size=50,
-                    min_importance=None,
-                    max_importance=None,
-                    order_by="timestamp",
-                    order_desc=True
+                # Tag counts over recent thoughts from this chat session (rough estimate)
+                tag_counts = self.thought_logger.count_by_tag(
+                    session, ["user-input", "ai-response"], recent=50
                 )
-                response = self.thought_logger.list_thoughts(session, query)
+                total = self.thought_logger.count_thoughts(session)
                 
-                user_thoughts = len([t for t in response.thoughts if "user-input" in t.tags])
-                ai_thoughts = len([t for t in response.thoughts if "ai-response" in t.tags])
+                user_thoughts = tag_counts["user-input"]
+                ai_thoughts = tag_counts["ai-response"]
                 
                 stats_text = Text()
                 stats_text.append(f"Recent conversation activity:\n", style="bold")
                 stats_text.append(f"  User messages: {user_thoughts}\n")
                 stats_text.append(f"  AI responses: {ai_thoughts}\n")
-                stats_text.append(f"  Total logged thoughts: {response.total}\n")
+                stats_text.append(f"  Total logged thoughts: {total}\n")
                 
                 panel = Panel(stats_text, title="Statistics", border_style="cyan")
                 self.console.print(panel)
@@ -329,7 +384,8 @@ class ChatInterface:
                 # Add user input to history
                 self.add_to_history("user", user_input)
                 
-                # Log user message
+                # Log user message; queued before the model call so the
+                # writer thread's insert overlaps the provider round-trip
                 self.log_thought_from_chat(
                     content=user_input,
                     category="perception",
@@ -379,6 +435,7 @@ class ChatInterface:
         
         finally:
             self.conversation_active = False
+            self.close()
 
 
 def create_chat_interface(
@@ -397,7 +454,7 @@ def create_chat_interface(
     if database_url:
         try:
             db_manager = DatabaseManager(database_url)
-            thought_logger = ThoughtLogger()
+            thought_logger = shared_thought_logger
             
             # Test database connection
             with db_manager.get_session() as session:
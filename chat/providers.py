@@ -1,34 +1,151 @@
 """AI provider interfaces for different chat models."""
 
+import asyncio
+import functools
+import importlib.util
+import logging
 import os
+import time
 from abc import ABC, abstractmethod
-from typing import Optional, Any
-
-try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
-except ImportError:
-    genai = None  # type: ignore
-    GEMINI_AVAILABLE = False
-
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OpenAI = None  # type: ignore
-    OPENAI_AVAILABLE = False
-
-try:
-    import anthropic
-    CLAUDE_AVAILABLE = True
-except ImportError:
-    anthropic = None  # type: ignore
-    CLAUDE_AVAILABLE = False
+import weakref
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple, Any
+
+import httpx
+import orjson
+
+from chat.cache import LLMCache, acached_response, cached_response, default_cache
+from chat.retry import DEFAULT_MAX_RETRIES, retry_async, retry_sync
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=None)
+def _import_sdk(module_name: str) -> Optional[Any]:
+    """Import a provider SDK on first use; None when it is not installed.
+    
+    SDKs are heavy to import, so they are only loaded once a provider with
+    an API key is actually constructed.
+    """
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        return None
+
+
+# Per-provider rate-limit profile; max_concurrency caps in-flight async requests
+PROVIDER_PROFILES = {
+    "gemini": {"max_concurrency": 8},
+    "openai": {"max_concurrency": 10},
+    "claude": {"max_concurrency": 5},
+    "mock": {"max_concurrency": 100},
+}
+
+
+# HTTP clients shared by every SDK-backed provider so keep-alive connections
+# (and their TLS sessions) are reused; HTTP/2 is used when h2 is installed
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+HTTP_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_shared_http_client: Optional[httpx.Client] = None
+# An AsyncClient's connection pool is bound to the loop it first ran on
+_shared_async_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def shared_http_client() -> httpx.Client:
+    """Process-wide sync HTTP client, created on first use."""
+    global _shared_http_client
+    if _shared_http_client is None or _shared_http_client.is_closed:
+        _shared_http_client = httpx.Client(
+            http2=HTTP2_AVAILABLE, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT
+        )
+    return _shared_http_client
+
+
+def shared_async_http_client() -> httpx.AsyncClient:
+    """Async HTTP client shared within the running event loop, created on first use."""
+    loop = asyncio.get_running_loop()
+    client = _shared_async_http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT
+        )
+        _shared_async_http_clients[loop] = client
+    return client
+
+
+# Batch jobs complete within hours; poll gently with capped exponential backoff
+BATCH_POLL_INITIAL = 5.0
+BATCH_POLL_MAX = 300.0
+
+
+def _wait_for_batch(
+    retrieve: Callable[[], Any], is_done: Callable[[Any], bool], poll_interval: float = BATCH_POLL_INITIAL
+) -> Any:
+    """Poll retrieve() until is_done(job), backing off between polls."""
+    delay = poll_interval
+    while True:
+        job = retrieve()
+        if is_done(job):
+            return job
+        time.sleep(delay)
+        delay = min(delay * 2, BATCH_POLL_MAX)
 
 
 class AIProvider(ABC):
     """Abstract base class for AI model providers."""
     
+    provider_name = "mock"
+    
+    # Sampling defaults; responses are cached only when temperature is 0
+    default_temperature: Optional[float] = None
+    default_max_tokens: Optional[int] = None
+    
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        cache: Optional[LLMCache] = default_cache,
+    ):
+        self.max_concurrency = (
+            max_concurrency or PROVIDER_PROFILES[self.provider_name]["max_concurrency"]
+        )
+        # Retries on throttling/transient errors, with exponential backoff
+        self.max_retries = DEFAULT_MAX_RETRIES if max_retries is None else max_retries
+        self.temperature = self.default_temperature if temperature is None else temperature
+        self.max_tokens = self.default_max_tokens if max_tokens is None else max_tokens
+        # Exact-match cache for deterministic calls; pass cache=None to disable
+        self.cache = cache
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Builds the SDK async client around an httpx.AsyncClient; None when unavailable
+        self._aclient_factory: Optional[Callable[..., Any]] = None
+        self._aclient: Optional[Any] = None
+        self._aclient_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _concurrency_limit(self) -> asyncio.Semaphore:
+        """Semaphore bounding in-flight async calls, one per running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+    
+    @property
+    def aclient(self) -> Optional[Any]:
+        """SDK async client, one per running event loop."""
+        if self._aclient_factory is None:
+            return None
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient_loop is not loop:
+            self._aclient = self._aclient_factory(http_client=shared_async_http_client())
+            self._aclient_loop = loop
+        return self._aclient
+    
     @abstractmethod
     def call_ai_model(self, prompt: str) -> str:
         """Call the AI model with a prompt and return the response."""
@@ -44,16 +161,58 @@ class AIProvider(ABC):
         # Default implementation: yield the full response at once
         response = self.call_ai_model(prompt)
         yield response
+    
+    async def acall_ai_model(self, prompt: str) -> str:
+        """Async variant of call_ai_model, bounded by max_concurrency."""
+        async with self._concurrency_limit():
+            return await self._acall_ai_model(prompt)
+    
+    async def astream_ai_model(self, prompt: str) -> AsyncIterator[str]:
+        """Async variant of stream_ai_model, bounded by max_concurrency."""
+        async with self._concurrency_limit():
+            async for chunk in self._astream_ai_model(prompt):
+                yield chunk
+    
+    async def _acall_ai_model(self, prompt: str) -> str:
+        """Provider-specific async call. Override with a native async client."""
+        # Default implementation: run the blocking call in a worker thread
+        return await asyncio.to_thread(self.call_ai_model, prompt)
+    
+    async def _astream_ai_model(self, prompt: str) -> AsyncIterator[str]:
+        """Provider-specific async stream. Override in subclasses that support streaming."""
+        # Default implementation: yield the full response at once
+        yield await self._acall_ai_model(prompt)
 
 
 class GeminiProvider(AIProvider):
     """Google Gemini AI provider."""
     
-    def __init__(self, api_key: Optional[str] = None):
+    provider_name = "gemini"
+    
+    def _generation_config(self) -> Dict[str, Any]:
+        """Sampling overrides for generate_content; empty keeps model defaults."""
+        config: Dict[str, Any] = {}
+        if self.temperature is not None:
+            config["temperature"] = self.temperature
+        if self.max_tokens is not None:
+            config["max_output_tokens"] = self.max_tokens
+        return config
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        cache: Optional[LLMCache] = default_cache,
+    ):
+        super().__init__(max_concurrency, max_retries, temperature, max_tokens, cache)
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         self.model: Optional[Any] = None
         
-        if self.api_key and GEMINI_AVAILABLE and genai is not None:
+        genai = _import_sdk("google.generativeai") if self.api_key else None
+        if genai is not None:
             # Use getattr to avoid type checker issues with dynamic imports
             configure_func = getattr(genai, 'configure', None)
             model_class = getattr(genai, 'GenerativeModel', None)
@@ -63,6 +222,8 @@ class GeminiProvider(AIProvider):
                 # Use the current Gemini model name
                 self.model = model_class('gemini-1.5-flash')
     
+    @cached_response
+    @retry_sync
     def call_ai_model(self, prompt: str) -> str:
         """Call Gemini API with the given prompt."""
         if not self.is_available():
@@ -77,10 +238,10 @@ class GeminiProvider(AIProvider):
             if not generate_content:
                 raise RuntimeError("generate_content method not available")
                 
-            response = generate_content(prompt)
+            response = generate_content(prompt, generation_config=self._generation_config())
             return response.text.strip()
         except Exception as e:
-            raise RuntimeError(f"Gemini API call failed: {str(e)}")
+            raise RuntimeError(f"Gemini API call failed: {str(e)}") from e
     
     def stream_ai_model(self, prompt: str):
         """Stream Gemini API response token by token."""
@@ -98,42 +259,115 @@ class GeminiProvider(AIProvider):
             
             # Try streaming, fall back to regular if not supported
             try:
-                response = generate_content(prompt, stream=True)
-                current_text = ""
+                response = generate_content(
+                    prompt, generation_config=self._generation_config(), stream=True
+                )
+                # Gemini streams deltas; some models resend the cumulative
+                # text instead. Decide once, from the first two chunks.
+                first_text: Optional[str] = None
+                is_cumulative: Optional[bool] = None
+                emitted = 0
                 for chunk in response:
-                    if hasattr(chunk, 'text') and chunk.text:
-                        new_text = chunk.text
+                    if not (hasattr(chunk, 'text') and chunk.text):
+                        continue
+                    new_text = chunk.text
+                    if first_text is None:
+                        first_text = new_text
+                        emitted = len(new_text)
+                        yield new_text
+                        continue
+                    if is_cumulative is None:
+                        is_cumulative = new_text.startswith(first_text)
+                    if is_cumulative:
                         # Yield only the new part
-                        if new_text.startswith(current_text):
-                            yield new_text[len(current_text):]
-                            current_text = new_text
-                        else:
-                            yield new_text
-                            current_text = new_text
+                        yield new_text[emitted:]
+                        emitted = len(new_text)
+                    else:
+                        yield new_text
             except Exception:
                 # Fall back to non-streaming
-                response = generate_content(prompt)
+                response = generate_content(prompt, generation_config=self._generation_config())
                 yield response.text.strip()
                 
         except Exception as e:
-            raise RuntimeError(f"Gemini streaming failed: {str(e)}")
+            raise RuntimeError(f"Gemini streaming failed: {str(e)}") from e
+    
+    @acached_response
+    @retry_async
+    async def _acall_ai_model(self, prompt: str) -> str:
+        """Call Gemini API asynchronously with the given prompt."""
+        if not self.is_available():
+            raise RuntimeError("Gemini provider not available. Check API key and dependencies.")
+        
+        try:
+            generate_content_async = getattr(self.model, 'generate_content_async', None)
+            if not generate_content_async:
+                raise RuntimeError("generate_content_async method not available")
+            
+            response = await generate_content_async(
+                prompt, generation_config=self._generation_config()
+            )
+            return str(response.text).strip()
+        except Exception as e:
+            raise RuntimeError(f"Gemini API call failed: {str(e)}") from e
+    
+    async def _astream_ai_model(self, prompt: str) -> AsyncIterator[str]:
+        """Stream Gemini API response asynchronously."""
+        if not self.is_available():
+            raise RuntimeError("Gemini provider not available. Check API key and dependencies.")
+        
+        try:
+            generate_content_async = getattr(self.model, 'generate_content_async', None)
+            if not generate_content_async:
+                raise RuntimeError("generate_content_async method not available")
+            
+            response = await generate_content_async(
+                prompt, generation_config=self._generation_config(), stream=True
+            )
+            async for chunk in response:
+                if getattr(chunk, 'text', None):
+                    yield chunk.text
+        except Exception as e:
+            raise RuntimeError(f"Gemini streaming failed: {str(e)}") from e
     
     def is_available(self) -> bool:
         """Check if Gemini is available."""
-        return GEMINI_AVAILABLE and self.api_key is not None and self.model is not None
+        return self.api_key is not None and self.model is not None
 
 
 class OpenAIProvider(AIProvider):
     """OpenAI GPT provider."""
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-3.5-turbo"):
+    provider_name = "openai"
+    default_temperature = 0.7
+    default_max_tokens = 1000
+    # Stream deltas are buffered and yielded on newline or every N deltas
+    stream_flush_deltas = 8
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "gpt-3.5-turbo",
+        max_concurrency: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        cache: Optional[LLMCache] = default_cache,
+    ):
+        super().__init__(max_concurrency, max_retries, temperature, max_tokens, cache)
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         self.model_name = model
         self.client: Optional[Any] = None
+        # Total tokens reported by the most recent completed call
+        self.last_usage: Optional[int] = None
         
-        if self.api_key and OPENAI_AVAILABLE and OpenAI is not None:
-            self.client = OpenAI(api_key=self.api_key)
+        openai = _import_sdk("openai") if self.api_key else None
+        if openai is not None:
+            self.client = openai.OpenAI(api_key=self.api_key, http_client=shared_http_client())
+            self._aclient_factory = functools.partial(openai.AsyncOpenAI, api_key=self.api_key)
         
+    @cached_response
+    @retry_sync
     def call_ai_model(self, prompt: str) -> str:
         """Call OpenAI API with the given prompt."""
         if not self.is_available():
@@ -148,17 +382,37 @@ class OpenAIProvider(AIProvider):
                 messages=[
                     {"role": "user", "content": prompt}
                 ],
-                max_tokens=1000,
-                temperature=0.7
+                max_tokens=self.max_tokens,
+                temperature=self.temperature
             )
             
+            self._record_usage(response)
             if response.choices and response.choices[0].message.content:
                 return response.choices[0].message.content.strip()
             else:
                 raise RuntimeError("No response content received from OpenAI")
                 
         except Exception as e:
-            raise RuntimeError(f"OpenAI API call failed: {str(e)}")
+            raise RuntimeError(f"OpenAI API call failed: {str(e)}") from e
+    
+    def _record_usage(self, response: Any) -> None:
+        """Remember token usage for downstream rate-limit accounting."""
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            self.last_usage = usage.total_tokens
+    
+    def _consume_stream_chunk(self, chunk: Any, buffer: List[str]) -> Optional[str]:
+        """Buffer a stream chunk's delta; return joined text when it is time to flush."""
+        self._record_usage(chunk)
+        if not chunk.choices or not chunk.choices[0].delta.content:
+            return None
+        content = chunk.choices[0].delta.content
+        buffer.append(content)
+        if "\n" in content or len(buffer) >= self.stream_flush_deltas:
+            text = "".join(buffer)
+            buffer.clear()
+            return text
+        return None
     
     def stream_ai_model(self, prompt: str):
         """Stream OpenAI API response token by token."""
@@ -174,26 +428,172 @@ class OpenAIProvider(AIProvider):
                 messages=[
                     {"role": "user", "content": prompt}
                 ],
-                max_tokens=1000,
-                temperature=0.7,
-                stream=True
+                max_tokens=self.max_tokens,
+                temperature=self.temperature,
+                stream=True,
+                stream_options={"include_usage": True}
             )
             
+            buffer: List[str] = []
             for chunk in response:
-                if chunk.choices and chunk.choices[0].delta.content:
-                    yield chunk.choices[0].delta.content
+                text = self._consume_stream_chunk(chunk, buffer)
+                if text:
+                    yield text
+            if buffer:
+                yield "".join(buffer)
                     
         except Exception as e:
-            raise RuntimeError(f"OpenAI streaming failed: {str(e)}")
+            raise RuntimeError(f"OpenAI streaming failed: {str(e)}") from e
+    
+    @acached_response
+    @retry_async
+    async def _acall_ai_model(self, prompt: str) -> str:
+        """Call OpenAI API asynchronously with the given prompt."""
+        if not self.is_available():
+            raise RuntimeError("OpenAI provider not available. Check API key and dependencies.")
+        
+        try:
+            if self.aclient is None:
+                raise RuntimeError("OpenAI async client not initialized")
+            
+            response = await self.aclient.chat.completions.create(
+                model=self.model_name,
+                messages=[
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=self.max_tokens,
+                temperature=self.temperature
+            )
+            
+            self._record_usage(response)
+            if response.choices and response.choices[0].message.content:
+                return str(response.choices[0].message.content).strip()
+            else:
+                raise RuntimeError("No response content received from OpenAI")
+                
+        except Exception as e:
+            raise RuntimeError(f"OpenAI API call failed: {str(e)}") from e
+    
+    async def _astream_ai_model(self, prompt: str) -> AsyncIterator[str]:
+        """Stream OpenAI API response asynchronously."""
+        if not self.is_available():
+            raise RuntimeError("OpenAI provider not available. Check API key and dependencies.")
+        
+        try:
+            if self.aclient is None:
+                raise RuntimeError("OpenAI async client not initialized")
+            
+            response = await self.aclient.chat.completions.create(
+                model=self.model_name,
+                messages=[
+                    {"role": "user", "content": prompt}
+                ],
+                max_tokens=self.max_tokens,
+                temperature=self.temperature,
+                stream=True,
+                stream_options={"include_usage": True}
+            )
+            
+            buffer: List[str] = []
+            async for chunk in response:
+                text = self._consume_stream_chunk(chunk, buffer)
+                if text:
+                    yield text
+            if buffer:
+                yield "".join(buffer)
+                    
+        except Exception as e:
+            raise RuntimeError(f"OpenAI streaming failed: {str(e)}") from e
+    
+    def batch_call_ai_model(self, prompts: List[str], poll_interval: float = BATCH_POLL_INITIAL) -> List[str]:
+        """Run prompts through the Batch API (half price, up to 24h) and return responses in order."""
+        if not self.is_available():
+            raise RuntimeError("OpenAI provider not available. Check API key and dependencies.")
+        
+        try:
+            client = self.client
+            if client is None:
+                raise RuntimeError("OpenAI client not initialized")
+            
+            lines = [
+                orjson.dumps({
+                    "custom_id": f"req-{i}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": self.model_name,
+                        "messages": [{"role": "user", "content": prompt}],
+                        "max_tokens": self.max_tokens,
+                        "temperature": self.temperature,
+                    },
+                })
+                for i, prompt in enumerate(prompts)
+            ]
+            batch_file = client.files.create(
+                file=("batch.jsonl", b"\n".join(lines)),
+                purpose="batch"
+            )
+            batch = client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            batch = _wait_for_batch(
+                lambda: client.batches.retrieve(batch.id),
+                lambda job: job.status in ("completed", "failed", "expired", "cancelled"),
+                poll_interval,
+            )
+            if batch.status != "completed" or not batch.output_file_id:
+                raise RuntimeError(f"batch {batch.id} ended with status {batch.status}")
+            
+            results: Dict[str, str] = {}
+            for line in client.files.content(batch.output_file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                record = orjson.loads(line)
+                response = record.get("response") or {}
+                if record.get("error") or response.get("status_code") != 200:
+                    raise RuntimeError(f"request {record['custom_id']} failed: {record.get('error') or response}")
+                results[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"].strip()
+            
+            return [results[f"req-{i}"] for i in range(len(prompts))]
+        except Exception as e:
+            raise RuntimeError(f"OpenAI batch call failed: {str(e)}") from e
     
     def is_available(self) -> bool:
         """Check if OpenAI is available."""
-        return OPENAI_AVAILABLE and self.api_key is not None and self.client is not None
+        return self.api_key is not None and self.client is not None
 
 
 class MockProvider(AIProvider):
     """Mock provider for testing without API keys."""
     
+    provider_name = "mock"
+    default_temperature = 0.0
+    
+    def __init__(
+        self,
+        stream_delay: float = 0.0,
+        stream_chunk_words: int = 4,
+        max_concurrency: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        cache: Optional[LLMCache] = default_cache,
+    ):
+        super().__init__(max_concurrency, max_retries, temperature, max_tokens, cache)
+        # Seconds to pause between streamed chunks; set > 0 for demos
+        self.stream_delay = stream_delay
+        self.stream_chunk_words = max(stream_chunk_words, 1)
+    
+    def _stream_chunks(self, response: str) -> Iterator[str]:
+        """Split a response into chunks of stream_chunk_words words."""
+        words = response.split()
+        step = self.stream_chunk_words
+        for i in range(0, len(words), step):
+            chunk = " ".join(words[i:i + step])
+            yield chunk if i == 0 else f" {chunk}"
+    
     def call_ai_model(self, prompt: str) -> str:
         """Return a mock response."""
         responses = [
@@ -215,17 +615,22 @@ class MockProvider(AIProvider):
             return f"{responses[1]} {prompt[:50]}{'...' if len(prompt) > 50 else ''}"
     
     def stream_ai_model(self, prompt: str):
-        """Stream mock response word by word for demonstration."""
-        import time
-        response = self.call_ai_model(prompt)
-        words = response.split()
-        
-        for i, word in enumerate(words):
-            if i == 0:
-                yield word
-            else:
-                yield f" {word}"
-            time.sleep(0.05)  # Simulate streaming delay
+        """Stream mock response a few words at a time."""
+        for chunk in self._stream_chunks(self.call_ai_model(prompt)):
+            yield chunk
+            if self.stream_delay:
+                time.sleep(self.stream_delay)  # Simulate streaming delay
+    
+    async def _acall_ai_model(self, prompt: str) -> str:
+        """Return a mock response without leaving the event loop."""
+        return self.call_ai_model(prompt)
+    
+    async def _astream_ai_model(self, prompt: str) -> AsyncIterator[str]:
+        """Stream mock response a few words at a time without blocking the loop."""
+        for chunk in self._stream_chunks(self.call_ai_model(prompt)):
+            yield chunk
+            if self.stream_delay:
+                await asyncio.sleep(self.stream_delay)  # Simulate streaming delay
     
     def is_available(self) -> bool:
         """Mock provider is always available."""
@@ -235,17 +640,80 @@ class MockProvider(AIProvider):
 class ClaudeProvider(AIProvider):
     """Anthropic Claude AI provider."""
     
-    def __init__(self, api_key: Optional[str] = None, model: str = "claude-3-haiku-20240307"):
+    provider_name = "claude"
+    default_max_tokens = 1000
+    
+    def _message_options(self) -> Dict[str, Any]:
+        """Sampling options for the messages API; temperature only when set."""
+        options: Dict[str, Any] = {"max_tokens": self.max_tokens}
+        if self.temperature is not None:
+            options["temperature"] = self.temperature
+        return options
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: str = "claude-3-haiku-20240307",
+        max_concurrency: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        cache: Optional[LLMCache] = default_cache,
+    ):
+        super().__init__(max_concurrency, max_retries, temperature, max_tokens, cache)
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         self.model_name = model
         self.client: Optional[Any] = None
         
-        if self.api_key and CLAUDE_AVAILABLE and anthropic is not None:
+        anthropic = _import_sdk("anthropic") if self.api_key else None
+        if anthropic is not None:
             try:
-                self.client = anthropic.Anthropic(api_key=self.api_key)
+                self.client = anthropic.Anthropic(
+                    api_key=self.api_key, http_client=shared_http_client()
+                )
+                self._aclient_factory = functools.partial(
+                    anthropic.AsyncAnthropic, api_key=self.api_key
+                )
             except Exception as e:
                 print(f"Failed to initialize Claude client: {e}")
                 self.client = None
+                self._aclient_factory = None
+    
+    @cached_response
+    @retry_sync
+    def _create_message(self, prompt: str) -> Any:
+        """Send a single-turn request to the Claude messages API."""
+        if self.client is None:
+            raise RuntimeError("Claude client not initialized")
+        # Claude API expects messages format
+        return self.client.messages.create(
+            model=self.model_name,
+            **self._message_options(),
+            messages=[
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ]
+        )
+    
+    @acached_response
+    @retry_async
+    async def _acreate_message(self, prompt: str) -> Any:
+        """Async counterpart of _create_message."""
+        aclient = self.aclient
+        if aclient is None:
+            raise RuntimeError("Claude async client not initialized")
+        return await aclient.messages.create(
+            model=self.model_name,
+            **self._message_options(),
+            messages=[
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ]
+        )
     
     def call_ai_model(self, prompt: str) -> str:
         """Call Claude API with the given prompt."""
@@ -253,21 +721,11 @@ class ClaudeProvider(AIProvider):
             return "❌ Claude API not available. Please check your API key and internet connection."
         
         try:
-            # Claude API expects messages format
-            message = self.client.messages.create(
-                model=self.model_name,
-                max_tokens=1000,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ]
-            )
+            message = self._create_message(prompt)
             
             # Extract text from response
             if message.content and len(message.content) > 0:
-                return message.content[0].text
+                return str(message.content[0].text)
             else:
                 return "🤖 No response from Claude."
                 
@@ -284,7 +742,7 @@ class ClaudeProvider(AIProvider):
             # Claude streaming API
             stream = self.client.messages.create(
                 model=self.model_name,
-                max_tokens=1000,
+                **self._message_options(),
                 messages=[
                     {
                         "role": "user",
@@ -308,17 +766,100 @@ class ClaudeProvider(AIProvider):
         except Exception as e:
             yield f"❌ Claude streaming error: {str(e)}"
     
+    async def _acall_ai_model(self, prompt: str) -> str:
+        """Call Claude API asynchronously with the given prompt."""
+        if not self.aclient:
+            return "❌ Claude API not available. Please check your API key and internet connection."
+        
+        try:
+            message = await self._acreate_message(prompt)
+            
+            if message.content and len(message.content) > 0:
+                return str(message.content[0].text)
+            else:
+                return "🤖 No response from Claude."
+                
+        except Exception as e:
+            return f"❌ Claude API error: {str(e)}"
+    
+    async def _astream_ai_model(self, prompt: str) -> AsyncIterator[str]:
+        """Stream Claude API response asynchronously."""
+        if not self.aclient:
+            yield "❌ Claude API not available. Please check your API key and internet connection."
+            return
+        
+        try:
+            stream = await self.aclient.messages.create(
+                model=self.model_name,
+                **self._message_options(),
+                messages=[
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                stream=True
+            )
+            
+            async for chunk in stream:
+                if chunk.type == "content_block_delta":
+                    if hasattr(chunk, 'delta') and hasattr(chunk.delta, 'text'):
+                        yield chunk.delta.text
+                elif chunk.type == "content_block_stop":
+                    break
+                    
+        except Exception as e:
+            yield f"❌ Claude streaming error: {str(e)}"
+    
+    def batch_call_ai_model(self, prompts: List[str], poll_interval: float = BATCH_POLL_INITIAL) -> List[str]:
+        """Run prompts through the Message Batches API (half price) and return responses in order."""
+        if not self.client:
+            return ["❌ Claude API not available. Please check your API key and internet connection."] * len(prompts)
+        
+        try:
+            batches = self.client.messages.batches
+            batch = batches.create(
+                requests=[
+                    {
+                        "custom_id": f"req-{i}",
+                        "params": {
+                            "model": self.model_name,
+                            **self._message_options(),
+                            "messages": [{"role": "user", "content": prompt}],
+                        },
+                    }
+                    for i, prompt in enumerate(prompts)
+                ]
+            )
+            _wait_for_batch(
+                lambda: batches.retrieve(batch.id),
+                lambda job: job.processing_status == "ended",
+                poll_interval,
+            )
+            
+            results: Dict[str, str] = {}
+            for entry in batches.results(batch.id):
+                if entry.result.type == "succeeded" and entry.result.message.content:
+                    results[entry.custom_id] = entry.result.message.content[0].text
+                elif entry.result.type == "succeeded":
+                    results[entry.custom_id] = "🤖 No response from Claude."
+                else:
+                    results[entry.custom_id] = f"❌ Claude API error: batch request {entry.result.type}"
+            
+            return [results.get(f"req-{i}", "🤖 No response from Claude.") for i in range(len(prompts))]
+        except Exception as e:
+            return [f"❌ Claude API error: {str(e)}"] * len(prompts)
+    
     def is_available(self) -> bool:
         """Check if Claude provider is available."""
         return (
-            CLAUDE_AVAILABLE and 
             self.api_key is not None and 
             self.client is not None
         )
 
 
-def get_provider(provider_name: str, **kwargs) -> AIProvider:
-    """Factory function to get an AI provider by name."""
+def _build_provider(provider_name: str, **kwargs: Any) -> AIProvider:
+    """Construct a provider by name; it may be unavailable."""
     providers = {
         "gemini": GeminiProvider,
         "openai": OpenAIProvider,
@@ -329,11 +870,57 @@ def get_provider(provider_name: str, **kwargs) -> AIProvider:
     if provider_name not in providers:
         raise ValueError(f"Unknown provider: {provider_name}. Available: {list(providers.keys())}")
     
-    provider_class = providers[provider_name]
-    provider = provider_class(**kwargs)
+    provider: AIProvider = providers[provider_name](**kwargs)
+    return provider
+
+
+# Available providers keyed on name and sorted kwargs; mock fallbacks are
+# never stored so a provider configured later is picked up
+_provider_cache: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], AIProvider] = {}
+
+
+def get_provider(provider_name: str, **kwargs: Any) -> AIProvider:
+    """Factory function to get an AI provider by name.
+    
+    Identical arguments return the same instance, so clients, semaphores and
+    caches are shared between callers. Falls back to mock when the provider
+    is unavailable.
+    """
+    key = (provider_name, tuple(sorted(kwargs.items())))
+    try:
+        cached = _provider_cache.get(key)
+        memoizable = True
+    except TypeError:
+        # Unhashable kwargs cannot be memoized
+        cached, memoizable = None, False
+    if cached is not None:
+        return cached
     
+    provider = _build_provider(provider_name, **kwargs)
     if not provider.is_available():
-        print(f"⚠️  {provider_name} provider not available, falling back to mock provider")
+        logger.warning(f"{provider_name} provider not available, falling back to mock provider")
         return MockProvider()
     
+    if memoizable:
+        _provider_cache[key] = provider
     return provider
+
+
+def clear_provider_cache() -> None:
+    """Forget memoized providers so the next get_provider call rebuilds them."""
+    _provider_cache.clear()
+
+
+async def batch_call(provider: AIProvider, prompts: List[str]) -> List[str]:
+    """Send several prompts concurrently and return responses in prompt order."""
+    return await asyncio.gather(*(provider.acall_ai_model(prompt) for prompt in prompts))
+
+
+async def compare_call(providers: List[AIProvider], prompt: str) -> List[Any]:
+    """Send one prompt to several providers concurrently, in provider order.
+    
+    A failing provider yields its exception instead of cancelling the others.
+    """
+    return await asyncio.gather(
+        *(provider.acall_ai_model(prompt) for provider in providers), return_exceptions=True
+    )
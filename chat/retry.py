@@ -0,0 +1,100 @@
+"""Exponential-backoff retries for transient AI provider errors."""
+
+import asyncio
+import functools
+import random
+import time
+from typing import Any, Callable, Optional, TypeVar, cast
+
+# Exception class names (from the OpenAI, Anthropic and Google SDKs) that
+# signal throttling or a transient server-side failure. Matched by name so
+# this module does not need to import any SDK.
+RETRYABLE_ERRORS = frozenset({
+    "RateLimitError",
+    "APITimeoutError",
+    "APIConnectionError",
+    "InternalServerError",
+    "OverloadedError",
+    "ResourceExhausted",
+    "ServiceUnavailable",
+    "DeadlineExceeded",
+})
+
+DEFAULT_MAX_RETRIES = 5
+BASE_DELAY = 0.5
+MAX_DELAY = 30.0
+
+
+def _root_error(exc: BaseException) -> BaseException:
+    """Providers wrap SDK errors in RuntimeError; look through to the cause."""
+    while isinstance(exc, RuntimeError) and exc.__cause__ is not None:
+        exc = exc.__cause__
+    return exc
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Whether an error (or the SDK error it wraps) is worth retrying."""
+    root = _root_error(exc)
+    return any(cls.__name__ in RETRYABLE_ERRORS for cls in type(root).__mro__)
+
+
+def _server_delay(exc: BaseException) -> Optional[float]:
+    """Delay requested by the server via Retry-After style headers, if any.
+    
+    x-ratelimit-reset is deliberately ignored: depending on the vendor it is
+    an epoch timestamp or a duration string, not a number of seconds.
+    """
+    response = getattr(_root_error(exc), "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    for header, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+        value = headers.get(header)
+        if value is None:
+            continue
+        try:
+            return max(float(value) * scale, 0.0)
+        except ValueError:
+            continue
+    return None
+
+
+def backoff_delay(attempt: int, exc: BaseException) -> float:
+    """Seconds to wait before retry number attempt (0-based)."""
+    delay = _server_delay(exc)
+    if delay is None:
+        delay = BASE_DELAY * 2 ** attempt + random.uniform(0, 1)
+    return min(delay, MAX_DELAY)
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def retry_sync(func: F) -> F:
+    """Retry a provider method on transient errors, up to self.max_retries times."""
+    @functools.wraps(func)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        max_retries = getattr(self, "max_retries", DEFAULT_MAX_RETRIES)
+        for attempt in range(max_retries + 1):
+            try:
+                return func(self, *args, **kwargs)
+            except Exception as e:
+                if attempt >= max_retries or not is_retryable(e):
+                    raise
+                time.sleep(backoff_delay(attempt, e))
+    return cast(F, wrapper)
+
+
+def retry_async(func: F) -> F:
+    """Async counterpart of retry_sync."""
+    @functools.wraps(func)
+    async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        max_retries = getattr(self, "max_retries", DEFAULT_MAX_RETRIES)
+        for attempt in range(max_retries + 1):
+            try:
+                return await func(self, *args, **kwargs)
+            except Exception as e:
+                if attempt >= max_retries or not is_retryable(e):
+                    raise
+                await asyncio.sleep(backoff_delay(attempt, e))
+    return cast(F, wrapper)
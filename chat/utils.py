@@ -1,8 +1,11 @@
 """Utility functions for chat interface."""
 
 import re
+from collections import Counter
+from functools import lru_cache
 from datetime import datetime, timezone
-from typing import Optional, List
+from types import MappingProxyType
+from typing import Dict, Mapping, NamedTuple, Optional, List, Tuple
 
 
 def format_timestamp(dt: Optional[datetime] = None) -> str:
@@ -12,38 +15,104 @@ def format_timestamp(dt: Optional[datetime] = None) -> str:
     return dt.strftime("%Y-%m-%d %H:%M:%S UTC")
 
 
-def analyze_emotion(text: str) -> Optional[str]:
-    """Simple emotion analysis based on text content."""
-    text_lower = text.lower()
-    
-    # Positive emotions
-    positive_keywords = [
-        "happy", "joy", "excited", "great", "awesome", "amazing", 
-        "wonderful", "fantastic", "love", "like", "good", "excellent"
-    ]
-    
-    # Negative emotions
-    negative_keywords = [
-        "sad", "angry", "frustrated", "disappointed", "upset", 
-        "annoyed", "hate", "dislike", "bad", "terrible", "awful"
-    ]
-    
-    # Neutral/analytical emotions
-    analytical_keywords = [
-        "think", "analyze", "consider", "understand", "process", 
-        "evaluate", "assess", "examine", "study"
-    ]
-    
-    # Question/curious emotions
-    question_keywords = [
-        "wonder", "curious", "question", "what", "how", "why", 
-        "when", "where", "confused", "uncertain"
-    ]
-    
-    positive_count = sum(1 for keyword in positive_keywords if keyword in text_lower)
-    negative_count = sum(1 for keyword in negative_keywords if keyword in text_lower)
-    analytical_count = sum(1 for keyword in analytical_keywords if keyword in text_lower)
-    curious_count = sum(1 for keyword in question_keywords if keyword in text_lower)
+_WORD_RE = re.compile(r"[a-z']+")
+
+# Emotion keywords
+POSITIVE_KEYWORDS = frozenset({
+    "happy", "joy", "excited", "great", "awesome", "amazing",
+    "wonderful", "fantastic", "love", "like", "good", "excellent",
+})
+NEGATIVE_KEYWORDS = frozenset({
+    "sad", "angry", "frustrated", "disappointed", "upset",
+    "annoyed", "hate", "dislike", "bad", "terrible", "awful",
+})
+ANALYTICAL_KEYWORDS = frozenset({
+    "think", "analyze", "consider", "understand", "process",
+    "evaluate", "assess", "examine", "study",
+})
+CURIOUS_KEYWORDS = frozenset({
+    "wonder", "curious", "question", "what", "how", "why",
+    "when", "where", "confused", "uncertain",
+})
+
+# Importance boosters
+IMPORTANT_KEYWORDS = frozenset({
+    "important", "critical", "urgent", "significant", "key",
+    "essential", "crucial", "major", "primary", "main",
+})
+QUESTION_KEYWORDS = frozenset({"what", "how", "why", "when", "where", "which"})
+DECISION_KEYWORDS = frozenset({
+    "decide", "choose", "select", "determine", "conclude",
+    "resolution", "solution", "answer",
+})
+
+# Topic tags: single words are matched against tokens, phrases as substrings
+TOPIC_PATTERNS = {
+    "programming": frozenset({"code", "programming", "python", "software", "development", "bug", "function"}),
+    "science": frozenset({"science", "research", "study", "experiment", "data", "analysis"}),
+    "technology": frozenset({"technology", "tech", "computer", "ai", "artificial intelligence", "machine learning"}),
+    "education": frozenset({"learn", "teaching", "education", "knowledge", "understand", "explain"}),
+    "question": QUESTION_KEYWORDS,
+    "greeting": frozenset({"hello", "hi", "good morning", "good afternoon", "good evening"}),
+    "conversation": frozenset({"chat", "talk", "discuss", "conversation", "speaking"}),
+}
+TOPIC_PHRASES = {
+    tag: tuple(keyword for keyword in keywords if " " in keyword)
+    for tag, keywords in TOPIC_PATTERNS.items()
+}
+
+
+def _build_keyword_index() -> Dict[str, Tuple[str, ...]]:
+    """Map every single-word keyword to the categories it counts towards."""
+    categories = {
+        "positive": POSITIVE_KEYWORDS,
+        "negative": NEGATIVE_KEYWORDS,
+        "analytical": ANALYTICAL_KEYWORDS,
+        "curious": CURIOUS_KEYWORDS,
+        "important": IMPORTANT_KEYWORDS,
+        "question": QUESTION_KEYWORDS,
+        "decision": DECISION_KEYWORDS,
+    }
+    categories.update((f"topic:{tag}", keywords) for tag, keywords in TOPIC_PATTERNS.items())
+    index: Dict[str, List[str]] = {}
+    for category, keywords in categories.items():
+        for keyword in keywords:
+            if " " not in keyword:
+                index.setdefault(keyword, []).append(category)
+    return {keyword: tuple(cats) for keyword, cats in index.items()}
+
+
+# Built once at import; one lookup per distinct word covers every category
+KEYWORD_INDEX = _build_keyword_index()
+
+
+class MessageFeatures(NamedTuple):
+    """Emotion, importance and tags derived from one message."""
+    emotion: Optional[str]
+    importance: float
+    tags: Tuple[str, ...]
+
+
+@lru_cache(maxsize=1024)
+def _keyword_hits(text_lower: str) -> Mapping[str, int]:
+    """Distinct keyword hits per category, from a single pass over the text.
+    
+    Cached, so the result is a read-only view; missing categories read as 0.
+    """
+    hits: Counter = Counter()
+    for word in set(_WORD_RE.findall(text_lower)):
+        hits.update(KEYWORD_INDEX.get(word, ()))
+    for tag, phrases in TOPIC_PHRASES.items():
+        hits[f"topic:{tag}"] += sum(1 for phrase in phrases if phrase in text_lower)
+    return MappingProxyType(hits)
+
+
+def _emotion(hits: Mapping[str, int], has_question_mark: bool) -> Optional[str]:
+    """Dominant emotion from keyword hits."""
+    positive_count = hits["positive"]
+    negative_count = hits["negative"]
+    analytical_count = hits["analytical"]
+    curious_count = hits["curious"]
     
     # Determine dominant emotion
     if positive_count > max(negative_count, analytical_count, curious_count):
@@ -54,50 +123,36 @@ def analyze_emotion(text: str) -> Optional[str]:
         return "curious"
     elif analytical_count > 0:
         return "analytical"
-    elif "?" in text:
+    elif has_question_mark:
         return "questioning"
     else:
         return "neutral"
 
 
-def calculate_importance(text: str, is_ai_response: bool = False) -> float:
-    """Calculate importance score for a message."""
+def _importance(hits: Mapping[str, int], length: int, has_question_mark: bool, is_ai_response: bool) -> float:
+    """Importance score from length and keyword hits."""
     base_score = 0.3  # Default base importance
     
     # Length factor (longer messages tend to be more important)
-    length_factor = min(len(text) / 500, 0.3)  # Max 0.3 boost for length
-    
-    # Keyword importance boosters
-    important_keywords = [
-        "important", "critical", "urgent", "significant", "key", 
-        "essential", "crucial", "major", "primary", "main"
-    ]
-    
-    question_keywords = ["?", "what", "how", "why", "when", "where", "which"]
-    decision_keywords = [
-        "decide", "choose", "select", "determine", "conclude", 
-        "resolution", "solution", "answer"
-    ]
-    
-    text_lower = text.lower()
+    length_factor = min(length / 500, 0.3)  # Max 0.3 boost for length
     
     # Boost for important keywords
-    importance_boost = sum(0.1 for keyword in important_keywords if keyword in text_lower)
+    importance_boost = 0.1 * hits["important"]
     importance_boost = min(importance_boost, 0.4)  # Cap at 0.4
     
     # Boost for questions (user asking questions)
     if not is_ai_response:
-        question_boost = sum(0.05 for keyword in question_keywords if keyword in text_lower)
-        question_boost = min(question_boost, 0.2)  # Cap at 0.2
+        question_hits = hits["question"] + int(has_question_mark)
+        question_boost = min(0.05 * question_hits, 0.2)  # Cap at 0.2
     else:
-        question_boost = 0
+        question_boost = 0.0
     
     # Boost for decisions/solutions (AI providing answers)
     if is_ai_response:
-        decision_boost = sum(0.05 for keyword in decision_keywords if keyword in text_lower)
+        decision_boost = 0.05 * hits["decision"]
         decision_boost = min(decision_boost, 0.2)  # Cap at 0.2
     else:
-        decision_boost = 0
+        decision_boost = 0.0
     
     # Calculate final score
     final_score = base_score + length_factor + importance_boost + question_boost + decision_boost
@@ -106,51 +161,88 @@ def calculate_importance(text: str, is_ai_response: bool = False) -> float:
     return min(max(final_score, 0.1), 1.0)
 
 
-def extract_tags(text: str, is_ai_response: bool = False) -> List[str]:
-    """Extract relevant tags from text content."""
-    tags = []
-    text_lower = text.lower()
+def _tags(hits: Mapping[str, int], length: int, has_question_mark: bool, is_ai_response: bool) -> Tuple[str, ...]:
+    """Topic, role and length tags from keyword hits."""
+    tags: Dict[str, None] = {}
     
     # Common topic tags
-    topic_patterns = {
-        "programming": ["code", "programming", "python", "software", "development", "bug", "function"],
-        "science": ["science", "research", "study", "experiment", "data", "analysis"],
-        "technology": ["technology", "tech", "computer", "AI", "artificial intelligence", "machine learning"],
-        "education": ["learn", "teaching", "education", "knowledge", "understand", "explain"],
-        "question": ["?", "what", "how", "why", "when", "where", "which"],
-        "greeting": ["hello", "hi", "good morning", "good afternoon", "good evening"],
-        "conversation": ["chat", "talk", "discuss", "conversation", "speaking"],
-    }
-    
-    for tag, keywords in topic_patterns.items():
-        if any(keyword in text_lower for keyword in keywords):
-            tags.append(tag)
+    for tag in TOPIC_PATTERNS:
+        if hits[f"topic:{tag}"]:
+            tags[tag] = None
+    if has_question_mark:
+        tags["question"] = None
     
     # Add role-based tags
     if is_ai_response:
-        tags.append("ai-response")
+        tags["ai-response"] = None
     else:
-        tags.append("user-input")
+        tags["user-input"] = None
     
     # Add length-based tags
-    if len(text) > 200:
-        tags.append("long-form")
-    elif len(text) < 50:
-        tags.append("short-form")
+    if length > 200:
+        tags["long-form"] = None
+    elif length < 50:
+        tags["short-form"] = None
+    
+    # Keys are unique and keep insertion order
+    return tuple(tags)
+
+
+@lru_cache(maxsize=1024)
+def extract_features(text: str, is_ai_response: bool = False) -> MessageFeatures:
+    """Emotion, importance and tags for a message from one shared keyword scan."""
+    # Lowercase, measure and look for "?" once; every feature reuses them
+    hits = _keyword_hits(text.lower())
+    length = len(text)
+    has_question_mark = "?" in text
+    return MessageFeatures(
+        emotion=_emotion(hits, has_question_mark),
+        importance=_importance(hits, length, has_question_mark, is_ai_response),
+        tags=_tags(hits, length, has_question_mark, is_ai_response),
+    )
+
+
+def analyze_emotion(text: str) -> Optional[str]:
+    """Simple emotion analysis based on text content.
+    
+    Prefer extract_features when more than one feature is needed.
+    """
+    return extract_features(text).emotion
+
+
+def calculate_importance(text: str, is_ai_response: bool = False) -> float:
+    """Calculate importance score for a message.
+    
+    Prefer extract_features when more than one feature is needed.
+    """
+    return extract_features(text, is_ai_response).importance
+
+
+def extract_tags(text: str, is_ai_response: bool = False) -> List[str]:
+    """Extract relevant tags from text content.
     
-    # Remove duplicates and return
-    return list(set(tags))
+    Prefer extract_features when more than one feature is needed.
+    """
+    return list(extract_features(text, is_ai_response).tags)
+
+
+_WHITESPACE_RE = re.compile(r'\s+')
+# Bold, italic and inline code in one alternation so the text is scanned once
+_MARKDOWN_RE = re.compile(r'\*\*(.*?)\*\*|\*(.*?)\*|`(.*?)`')
+
+
+def _strip_markdown(match: "re.Match[str]") -> str:
+    """Replacement callback keeping whichever group matched."""
+    return next(group for group in match.groups() if group is not None)
 
 
 def clean_ai_response(response: str) -> str:
     """Clean and format AI response text."""
     # Remove excessive whitespace
-    response = re.sub(r'\s+', ' ', response.strip())
+    response = _WHITESPACE_RE.sub(' ', response.strip())
     
     # Remove markdown if present (simple cleanup)
-    response = re.sub(r'\*\*(.*?)\*\*', r'\1', response)  # Bold
-    response = re.sub(r'\*(.*?)\*', r'\1', response)      # Italic
-    response = re.sub(r'`(.*?)`', r'\1', response)        # Code
+    response = _MARKDOWN_RE.sub(_strip_markdown, response)
     
     # Ensure proper sentence ending
     if response and not response.endswith(('.', '!', '?')):
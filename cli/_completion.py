@@ -0,0 +1,45 @@
+"""Static choices for CLI validation and shell completion.
+
+Kept free of project imports so completers stay cheap on every TAB press.
+"""
+
+from typing import List
+
+# Ordered names for display and completion; frozensets for O(1) membership
+COMMON_CATEGORY_NAMES = (
+    "reflection", "idea", "todo", "goal", "observation", "insight", "question", "memory",
+)
+COMMON_CATEGORIES = frozenset(COMMON_CATEGORY_NAMES)
+FILTER_CATEGORY_NAMES = ("perception", "reflection", "decision", "tick", "error")
+FILTER_CATEGORIES = frozenset(FILTER_CATEGORY_NAMES)
+PROVIDER_NAMES = ("gemini", "openai", "claude", "mock")
+EMOTION_NAMES = (
+    "happy", "sad", "excited", "anxious", "calm", "frustrated", "motivated", "confused", "confident", "neutral",
+)
+EXPORT_FORMATS = ("json", "csv")
+
+# Built once and returned as-is; callers (Typer, Rich prompts) only read them
+_CATEGORY_CHOICES = list(COMMON_CATEGORY_NAMES)
+_PROVIDER_CHOICES = list(PROVIDER_NAMES)
+_EMOTION_CHOICES = list(EMOTION_NAMES)
+_EXPORT_FORMAT_CHOICES = list(EXPORT_FORMATS)
+
+
+def complete_categories() -> List[str]:
+    """Return available thought categories for auto-completion."""
+    return _CATEGORY_CHOICES
+
+
+def complete_providers() -> List[str]:
+    """Return available AI providers for auto-completion."""
+    return _PROVIDER_CHOICES
+
+
+def complete_emotions() -> List[str]:
+    """Return available emotions for auto-completion."""
+    return _EMOTION_CHOICES
+
+
+def complete_export_formats() -> List[str]:
+    """Return available export formats for auto-completion."""
+    return _EXPORT_FORMAT_CHOICES
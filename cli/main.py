@@ -1,9 +1,17 @@
+import contextlib
+import csv
+import functools
+import itertools
 import logging
-import asyncio
+import sys
+import time
 from datetime import datetime
-from typing import List, Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
 from uuid import UUID
 
+import orjson
+from pydantic import ValidationError
 import typer
 from rich.console import Console
 from rich.prompt import Prompt, Confirm
@@ -15,14 +23,26 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from config import settings
-from db import db_manager, init_database
-from db.models import ThoughtModel
-from models.thought import ThoughtCreate, ThoughtQuery, ThoughtUpdate
-from services import thought_formatter
-from services.logger import ThoughtLogger
-from chat.interface import create_chat_interface
-from services.nlp_analyzer import EnhancedThoughtScorer
-from sqlalchemy import String
+from models.thought import RECENT_THOUGHTS_QUERY, ThoughtCreate, ThoughtQuery, ThoughtUpdate
+from cli._completion import (
+    COMMON_CATEGORIES,
+    COMMON_CATEGORY_NAMES,
+    FILTER_CATEGORIES,
+    FILTER_CATEGORY_NAMES,
+    PROVIDER_NAMES,
+    complete_categories,
+    complete_emotions,
+    complete_export_formats,
+    complete_providers,
+)
+
+# SQLAlchemy, the service layer and the chat stack are imported inside the
+# commands that use them so --help and shell completion start quickly.
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+    from db.session import DatabaseManager
+    from models.thought import Thought
+    from services.logger import ThoughtLogger
 
 app = typer.Typer(
     name="corelogger",
@@ -37,22 +57,79 @@ logging.basicConfig(
     format=settings.log_format,
 )
 
-# Auto-completion helpers
-def complete_categories():
-    """Return available thought categories for auto-completion."""
-    return ["reflection", "idea", "todo", "goal", "observation", "insight", "question", "memory"]
 
-def complete_providers():
-    """Return available AI providers for auto-completion."""
-    return ["gemini", "openai", "claude", "mock"]
+def _thought_logger() -> "ThoughtLogger":
+    """The process-wide ThoughtLogger, imported on first use."""
+    from services.logger import thought_logger
+    return thought_logger
+
+
+@functools.lru_cache(maxsize=1)
+def _ensure_db() -> "DatabaseManager":
+    """Create the schema on first database use and return the shared db_manager."""
+    from sqlalchemy.pool import NullPool
+    from db import db_manager, init_database
+    # A CLI run is one short-lived process: open connections on demand
+    # instead of keeping a server-sized QueuePool
+    db_manager.poolclass = NullPool
+    try:
+        init_database()
+    except Exception as e:
+        console.print(f"[red]Error initializing database: {e}[/red]")
+        raise typer.Exit(1)
+    return db_manager
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_session() -> "Session":
+    """The one Session reused by every database command in this process."""
+    return _ensure_db().SessionLocal()
+
+
+@contextlib.contextmanager
+def _cli_session() -> Iterator["Session"]:
+    """Lend out the shared session, expiring its state afterwards so the next use rereads."""
+    session = _shared_session()
+    try:
+        yield session
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.expire_all()
+
+
+def _confirm_logged(thought: "Thought", message: str) -> None:
+    """Show a logged thought as a panel on a terminal; print only its id when piped."""
+    if not console.is_terminal:
+        print(thought.id)
+        return
+    from services.formatter import thought_formatter
+    console.print(message)
+    console.print(thought_formatter.format_thought(thought, detailed=True))
+
+
+def _parse_uuid(value: str) -> UUID:
+    """Parse the canonical 36-char form we print, rejecting other lengths up front."""
+    if len(value) != 36:
+        raise ValueError(f"badly formed UUID string: {value!r}")
+    return UUID(hex=value)
+
 
-def complete_emotions():
-    """Return available emotions for auto-completion."""
-    return ["happy", "sad", "excited", "anxious", "calm", "frustrated", "motivated", "confused", "confident", "neutral"]
+CSV_HEADER = ("ID", "Category", "Content", "Tags", "Emotion", "Importance", "Timestamp")
 
-def complete_export_formats():
-    """Return available export formats for auto-completion."""
-    return ["json", "csv"]
+
+def _csv_row(thought: "Thought") -> tuple:
+    """One thought as a CSV row matching CSV_HEADER."""
+    return (
+        str(thought.id),
+        thought.category,
+        thought.content,
+        ",".join(thought.tags) if thought.tags else "",
+        thought.emotion or "",
+        thought.importance or "",
+        thought.timestamp.isoformat(),
+    )
 
 
 @app.command()
@@ -83,6 +160,11 @@ def chat(
         False,
         "--stream",
         help="Enable real-time streaming responses (token-by-token)"
+    ),
+    compare: Optional[str] = typer.Option(
+        None,
+        "--compare",
+        help="Comma-separated providers to query concurrently with each prompt (e.g. gemini,openai,claude)"
     )
 ):
     """Start an interactive chat session with an AI model.
@@ -96,11 +178,28 @@ def chat(
         corelogger chat --model gemini     # Use Google Gemini (requires API key)
         corelogger chat --model openai     # Use OpenAI GPT (requires API key)
         corelogger chat --no-logging       # Chat without logging to database
+        corelogger chat --compare gemini,openai,claude  # Side-by-side answers
     """
+    if compare:
+        names = list(dict.fromkeys(name.strip().lower() for name in compare.split(",") if name.strip()))
+        unknown = [name for name in names if name not in PROVIDER_NAMES]
+        if unknown or not names:
+            raise typer.BadParameter(
+                f"Unknown provider(s): {', '.join(unknown)}. Available: {', '.join(PROVIDER_NAMES)}",
+                param_hint="--compare",
+            )
+        import asyncio
+        try:
+            asyncio.run(_compare_session(names, log=not no_logging))
+        except KeyboardInterrupt:
+            console.print("\n👋 Chat session ended.")
+        return
+    
+    from chat.interface import create_chat_interface
     console.print("🚀 Starting CoreLogger Chat Interface...\n")
     
-    # Determine database URL
-    database_url = None if no_logging else db_manager.database_url
+    # Determine database URL; --no-logging never touches the database
+    database_url = None if no_logging else _ensure_db().database_url
     
     try:
         # Provide API key hint if needed
@@ -109,15 +208,14 @@ def chat(
             console.print(f"💡 [dim]Tip: Set {env_var} environment variable or use --api-key flag[/dim]")
         
         # Create and start chat interface
-        chat_interface = create_chat_interface(
+        with create_chat_interface(
             provider_name=model,
             database_url=database_url,
             api_key=api_key,
             enable_history=history,
             enable_streaming=stream
-        )
-        
-        chat_interface.start_conversation()
+        ) as chat_interface:
+            chat_interface.start_conversation()
         
     except KeyboardInterrupt:
         console.print("\n👋 Chat session ended.")
@@ -126,6 +224,57 @@ def chat(
         raise typer.Exit(1)
 
 
+async def _compare_session(names: List[str], log: bool = True) -> None:
+    """Prompt loop sending each message to every provider at once and tabulating the answers."""
+    from chat.providers import compare_call, get_provider
+    from chat.utils import clean_ai_response, extract_features
+    
+    providers = [get_provider(name) for name in names]
+    db_manager = _ensure_db() if log else None
+    console.print(f"⚖️  Comparing {', '.join(names)} (type 'quit' to exit)")
+    
+    while True:
+        # The loop only awaits provider calls, so blocking on input is fine
+        prompt = Prompt.ask("\n[bold cyan]You[/bold cyan]").strip()
+        if not prompt:
+            continue
+        if prompt.lower() in _QUIT_COMMANDS:
+            break
+        
+        started = time.perf_counter()
+        results = await compare_call(providers, prompt)
+        elapsed = time.perf_counter() - started
+        
+        result_table = Table(title=f"Responses ({elapsed:.2f}s total)", show_lines=True)
+        result_table.add_column("Provider", style="cyan", no_wrap=True)
+        result_table.add_column("Response", style="white")
+        thoughts = [
+            ThoughtCreate(category="perception", content=prompt, tags=["compare"], emotion=None, importance=None)
+        ]
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                result_table.add_row(name, f"[red]Error: {result}[/red]")
+                continue
+            response = clean_ai_response(result)
+            result_table.add_row(name, response)
+            features = extract_features(response, True)
+            thoughts.append(ThoughtCreate(
+                category="reflection",
+                content=response,
+                tags=[*features.tags, "compare", name],
+                emotion=features.emotion,
+                importance=features.importance
+            ))
+        console.print(result_table)
+        
+        if db_manager is not None:
+            try:
+                with db_manager.get_session() as session:
+                    _thought_logger().create_thoughts_bulk(session, thoughts)
+            except Exception as e:
+                console.print(f"⚠️  Logging error: {e}", style="red dim")
+
+
 @app.callback()
 def main(
     ctx: typer.Context,
@@ -133,20 +282,19 @@ def main(
     database_url: Optional[str] = typer.Option(None, "--db", help="Database URL override"),
 ):
     """CoreLogger CLI - Log and manage AI thoughts and reflections."""
+    # Shell completion and --help never touch the database; commands that do
+    # create the schema lazily through _ensure_db()
+    if ctx.resilient_parsing or "--help" in sys.argv[1:]:
+        return
+    
     if verbose:
         logging.getLogger().setLevel(logging.DEBUG)
         console.print("[dim]Verbose mode enabled[/dim]")
     
     if database_url:
+        from db import db_manager
         db_manager.database_url = database_url
         console.print(f"[dim]Using database: {database_url}[/dim]")
-    
-    # Initialize database if needed
-    try:
-        init_database()
-    except Exception as e:
-        console.print(f"[red]Error initializing database: {e}[/red]")
-        raise typer.Exit(1)
 
 
 @app.command()
@@ -177,11 +325,11 @@ def log(
     ),
 ):
     """Log a new thought or reflection."""
+    db_manager = _ensure_db()
     
     # Validate category - now more flexible
-    valid_categories = complete_categories()
-    if category not in valid_categories:
-        console.print(f"[yellow]Warning: Uncommon category '{category}'. Valid options: {', '.join(valid_categories)}[/yellow]")
+    if category not in COMMON_CATEGORIES:
+        console.print(f"[yellow]Warning: Uncommon category '{category}'. Valid options: {', '.join(COMMON_CATEGORY_NAMES)}[/yellow]")
         if not Confirm.ask("Continue with this category?"):
             raise typer.Exit(1)
     
@@ -195,11 +343,10 @@ def log(
         )
         
         with db_manager.get_session() as session:
-            logger = ThoughtLogger()
+            logger = _thought_logger()
             thought = logger.create_thought(session, thought_data)
         
-        console.print("[green]Thought logged successfully![/green]")
-        console.print(thought_formatter.format_thought(thought, detailed=True))
+        _confirm_logged(thought, "[green]Thought logged successfully![/green]")
         
     except Exception as e:
         console.print(f"[red]Error logging thought: {e}[/red]")
@@ -214,16 +361,16 @@ def perception(
     importance: Optional[float] = typer.Option(None, "--importance", "-i", min=0.0, max=1.0),
 ):
     """Log a perception thought."""
+    db_manager = _ensure_db()
     
     try:
         with db_manager.get_session() as session:
-            logger = ThoughtLogger()
+            logger = _thought_logger()
             thought = logger.log_perception(
                 session, content, tags=tags or [], emotion=emotion, importance=importance
             )
         
-        console.print("[green]Perception logged![/green]")
-        console.print(thought_formatter.format_thought(thought, detailed=True))
+        _confirm_logged(thought, "[green]Perception logged![/green]")
         
     except Exception as e:
         console.print(f"[red]Error logging perception: {e}[/red]")
@@ -238,16 +385,16 @@ def reflect(
     importance: Optional[float] = typer.Option(None, "--importance", "-i", min=0.0, max=1.0),
 ):
     """Log a reflection thought."""
+    db_manager = _ensure_db()
     
     try:
         with db_manager.get_session() as session:
-            logger = ThoughtLogger()
+            logger = _thought_logger()
             thought = logger.log_reflection(
                 session, content, tags=tags or [], emotion=emotion, importance=importance
             )
         
-        console.print("[green]Reflection logged![/green]")
-        console.print(thought_formatter.format_thought(thought, detailed=True))
+        _confirm_logged(thought, "[green]Reflection logged![/green]")
         
     except Exception as e:
         console.print(f"[red]Error logging reflection: {e}[/red]")
@@ -262,16 +409,16 @@ def decide(
     importance: Optional[float] = typer.Option(None, "--importance", "-i", min=0.0, max=1.0),
 ):
     """Log a decision thought."""
+    db_manager = _ensure_db()
     
     try:
         with db_manager.get_session() as session:
-            logger = ThoughtLogger()
+            logger = _thought_logger()
             thought = logger.log_decision(
                 session, content, tags=tags or [], emotion=emotion, importance=importance
             )
         
-        console.print("[green]Decision logged![/green]")
-        console.print(thought_formatter.format_thought(thought, detailed=True))
+        _confirm_logged(thought, "[green]Decision logged![/green]")
         
     except Exception as e:
         console.print(f"[red]Error logging decision: {e}[/red]")
@@ -285,16 +432,16 @@ def tick(
     importance: Optional[float] = typer.Option(None, "--importance", "-i", min=0.0, max=1.0),
 ):
     """Log a system tick thought."""
+    db_manager = _ensure_db()
     
     try:
         with db_manager.get_session() as session:
-            logger = ThoughtLogger()
+            logger = _thought_logger()
             thought = logger.log_tick(
                 session, content, tags=tags or [], importance=importance
             )
         
-        console.print("[green]System tick logged![/green]")
-        console.print(thought_formatter.format_thought(thought, detailed=True))
+        _confirm_logged(thought, "[green]System tick logged![/green]")
         
     except Exception as e:
         console.print(f"[red]Error logging tick: {e}[/red]")
@@ -308,22 +455,119 @@ def error(
     importance: Optional[float] = typer.Option(None, "--importance", "-i", min=0.0, max=1.0),
 ):
     """Log an error thought."""
+    db_manager = _ensure_db()
     
     try:
         with db_manager.get_session() as session:
-            logger = ThoughtLogger()
+            logger = _thought_logger()
             thought = logger.log_error(
                 session, content, tags=tags or [], importance=importance
             )
         
-        console.print("[red]Error logged![/red]")
-        console.print(thought_formatter.format_thought(thought, detailed=True))
+        _confirm_logged(thought, "[red]Error logged![/red]")
         
     except Exception as e:
         console.print(f"[red]Error logging error: {e}[/red]")
         raise typer.Exit(1)
 
 
+def _read_batch_records(path: Path, format_type: str) -> Iterator[Dict[str, Any]]:
+    """Yield raw thought dicts from a JSONL or CSV file, or stdin for '-'."""
+    stream = sys.stdin if str(path) == "-" else open(path, newline="", encoding="utf-8")
+    try:
+        if format_type == "csv":
+            for row in csv.DictReader(stream):
+                record: Dict[str, Any] = {k: v for k, v in row.items() if v not in (None, "")}
+                if "tags" in record:
+                    record["tags"] = [t for t in record["tags"].replace(";", ",").split(",") if t.strip()]
+                yield record
+        else:
+            for line in stream:
+                line = line.strip()
+                if not line:
+                    continue
+                # Plain text lines are taken as content
+                yield orjson.loads(line) if line.startswith("{") else {"content": line}
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+@app.command(name="log-batch")
+def log_batch(
+    path: Path = typer.Argument(Path("-"), help="JSONL or CSV file to import ('-' for stdin)"),
+    category: str = typer.Option(
+        "reflection",
+        "--category",
+        "-c",
+        help="Category for records that do not set one",
+        autocompletion=complete_categories
+    ),
+    format_type: Optional[str] = typer.Option(
+        None,
+        "--format",
+        "-f",
+        help="Input format: jsonl or csv (default: from file extension, else jsonl)"
+    ),
+    chunk_size: int = typer.Option(1000, "--chunk-size", min=1, help="Rows per INSERT transaction"),
+) -> None:
+    """Log many thoughts at once from a JSONL or CSV stream.
+    
+    Each JSONL line is an object with content and optional category, tags,
+    emotion and importance (plain text lines are taken as content). CSV files
+    use the same column names, with tags separated by ',' or ';'.
+    
+    Examples:
+        corelogger log-batch thoughts.jsonl
+        cat notes.txt | corelogger log-batch - --category observation
+    """
+    db_manager = _ensure_db()
+    if format_type is None:
+        format_type = "csv" if path.suffix.lower() == ".csv" else "jsonl"
+    if format_type not in ("jsonl", "csv"):
+        console.print(f"[red]Unsupported format '{format_type}'. Use jsonl or csv.[/red]")
+        raise typer.Exit(1)
+    
+    logger = _thought_logger()
+    logged = 0
+    skipped = 0
+    buffer: List[ThoughtCreate] = []
+    
+    def flush() -> None:
+        nonlocal logged
+        if buffer:
+            with db_manager.get_session() as session:
+                logger.create_thoughts_bulk(session, buffer)
+            logged += len(buffer)
+            buffer.clear()
+    
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    try:
+        with Progress(
+            SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console
+        ) as progress:
+            task = progress.add_task("Logging thoughts...", total=None)
+            for line_no, record in enumerate(_read_batch_records(path, format_type), start=1):
+                record.setdefault("category", category)
+                try:
+                    buffer.append(ThoughtCreate(**record))
+                except Exception as e:
+                    skipped += 1
+                    progress.console.print(f"[yellow]Skipping record {line_no}: {e}[/yellow]")
+                    continue
+                if len(buffer) >= chunk_size:
+                    flush()
+                    progress.update(task, description=f"Logged {logged} thoughts...")
+            flush()
+    except Exception as e:
+        console.print(f"[red]Error logging batch after {logged} thoughts: {e}[/red]")
+        raise typer.Exit(1)
+    
+    console.print(f"[green]Logged {logged} thoughts.[/green]")
+    if skipped:
+        console.print(f"[yellow]Skipped {skipped} invalid records.[/yellow]")
+
+
 @app.command(name="list")
 def list_thoughts(
     category: Optional[str] = typer.Option(
@@ -343,12 +587,13 @@ def list_thoughts(
     stats: bool = typer.Option(False, "--stats", help="Show statistics"),
 ):
     """List thoughts with optional filtering."""
+    db_manager = _ensure_db()
+    from services.formatter import thought_formatter
     
     # Validate category if provided
     if category is not None:
-        valid_categories = ["perception", "reflection", "decision", "tick", "error"]
-        if category not in valid_categories:
-            console.print(f"[red]Invalid category. Must be one of: {', '.join(valid_categories)}[/red]")
+        if category not in FILTER_CATEGORIES:
+            console.print(f"[red]Invalid category. Must be one of: {', '.join(FILTER_CATEGORY_NAMES)}[/red]")
             raise typer.Exit(1)
     
     try:
@@ -364,11 +609,16 @@ def list_thoughts(
         )
         
         with db_manager.get_session() as session:
-            logger = ThoughtLogger()
+            logger = _thought_logger()
             response = logger.list_thoughts(session, query)
         
         if stats:
             console.print(thought_formatter.format_stats_summary(response))
+        elif not console.is_terminal:
+            # Piped output: machine-readable CSV instead of Rich rendering
+            writer = csv.writer(sys.stdout)
+            writer.writerow(CSV_HEADER)
+            writer.writerows(_csv_row(thought) for thought in response.thoughts)
         elif table:
             console.print(thought_formatter.format_thoughts_table(response))
         else:
@@ -384,12 +634,14 @@ def show(
     thought_id: str = typer.Argument(..., help="Thought ID to display"),
 ):
     """Show a specific thought by ID."""
+    db_manager = _ensure_db()
+    from services.formatter import thought_formatter
     
     try:
-        thought_uuid = UUID(thought_id)
+        thought_uuid = _parse_uuid(thought_id)
         
         with db_manager.get_session() as session:
-            logger = ThoughtLogger()
+            logger = _thought_logger()
             thought = logger.get_thought(session, thought_uuid)
         
         if thought:
@@ -420,56 +672,43 @@ def update(
     importance: Optional[float] = typer.Option(None, "--importance", min=0.0, max=1.0),
 ):
     """Update an existing thought."""
-    
-    # Validate category if provided
-    if category is not None:
-        valid_categories = ["perception", "reflection", "decision", "tick", "error"]
-        if category not in valid_categories:
-            console.print(f"[red]Invalid category. Must be one of: {', '.join(valid_categories)}[/red]")
-            raise typer.Exit(1)
+    db_manager = _ensure_db()
+    from services.formatter import thought_formatter
     
     try:
-        thought_uuid = UUID(thought_id)
+        thought_uuid = _parse_uuid(thought_id)
         
-        # Get current thought
+        # Prepare update data
+        update_dict: Dict[str, Any] = {}
+        
+        if content is not None:
+            update_dict["content"] = content
+        if category is not None:
+            update_dict["category"] = category  # type: ignore
+        if emotion is not None:
+            update_dict["emotion"] = emotion
+        if importance is not None:
+            update_dict["importance"] = importance
+        
+        update_data = ThoughtUpdate(**update_dict)
+        
+        # One UPDATE ... RETURNING; added tags are merged in the same transaction
         with db_manager.get_session() as session:
-            logger = ThoughtLogger()
-            current_thought = logger.get_thought(session, thought_uuid)
-            if not current_thought:
-                console.print(f"[red]Thought with ID {thought_id} not found[/red]")
-                raise typer.Exit(1)
-            
-            # Prepare update data
-            update_dict = {}
-            
-            if content is not None:
-                update_dict["content"] = content
-            if category is not None:
-                update_dict["category"] = category  # type: ignore
-            if add_tags is not None:
-                # Merge with existing tags  
-                existing_tags_set = set(current_thought.tags)
-                new_tags_set = set(add_tags)
-                combined_tags_set = existing_tags_set.union(new_tags_set)
-                merged_tags = list(combined_tags_set)
-                update_dict["tags"] = merged_tags
-            if emotion is not None:
-                update_dict["emotion"] = emotion
-            if importance is not None:
-                update_dict["importance"] = importance
-            
-            update_data = ThoughtUpdate(**update_dict)
-            
-            # Update thought
-            updated_thought = logger.update_thought(session, thought_uuid, update_data)
+            updated_thought = _thought_logger().update_thought_atomic(
+                session, thought_uuid, update_data, add_tags=add_tags
+            )
             
             if updated_thought:
                 console.print("[green]Thought updated successfully![/green]")
                 console.print(thought_formatter.format_thought(updated_thought, detailed=True))
             else:
-                console.print(f"[red]Failed to update thought {thought_id}[/red]")
+                console.print(f"[red]Thought with ID {thought_id} not found[/red]")
                 raise typer.Exit(1)
         
+    except ValidationError as e:
+        # ThoughtUpdate validates the category; must precede ValueError, its base class
+        error = e.errors()[0]
+        raise typer.BadParameter(error["msg"], param_hint=f"--{error['loc'][0]}")
     except ValueError:
         console.print(f"[red]Invalid UUID format: {thought_id}[/red]")
         raise typer.Exit(1)
@@ -484,13 +723,15 @@ def delete(
     force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation"),
 ):
     """Delete a thought by ID."""
+    db_manager = _ensure_db()
+    from services.formatter import thought_formatter
     
     try:
-        thought_uuid = UUID(thought_id)
+        thought_uuid = _parse_uuid(thought_id)
         
         # Show thought before deletion
         with db_manager.get_session() as session:
-            logger = ThoughtLogger()
+            logger = _thought_logger()
             thought = logger.get_thought(session, thought_uuid)
             if not thought:
                 console.print(f"[red]Thought with ID {thought_id} not found[/red]")
@@ -582,31 +823,25 @@ def export(
         corelogger export --tag programming --days 7   # Export programming thoughts from last week
         corelogger export --output my_thoughts.json    # Export to specific file
     """
-    from services.exporter import ThoughtExporter
+    db_manager = _ensure_db()
+    from services.exporter import EXPORT_BUFFER_SIZE, ThoughtExporter, nest_json
     from datetime import timedelta
     
     console.print("📦 Exporting thoughts...\n")
     
     try:
-        # Build query filters
-        query_filters = ThoughtQuery(
-            page=1, 
-            size=10000,
+        # Build query filters; export streams every match, so no page or size
+        query_filters = ThoughtQuery(  # type: ignore[call-arg]
             min_importance=0.0,
             max_importance=1.0,
             order_by="timestamp",
-            order_desc=True
+            order_desc=True,
+            category=category or None,
+            tag=tag or None,
+            emotion=emotion or None,
+            created_after=datetime.now() - timedelta(days=days) if days else None,
         )
         
-        if category:
-            query_filters.category = category
-        if tag:
-            query_filters.tag = tag
-        if emotion:
-            query_filters.emotion = emotion
-        if days:
-            query_filters.created_after = datetime.now() - timedelta(days=days)
-        
         # Generate output filename if not provided
         if not output:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -618,85 +853,73 @@ def export(
         
         # Export thoughts - using synchronous approach
         with db_manager.get_session() as session:
-            logger = ThoughtLogger()
-            
-            # Get thoughts using our synchronous logger
-            thoughts_response = logger.get_thoughts(session, query_filters)
-            thoughts = thoughts_response.thoughts if hasattr(thoughts_response, 'thoughts') else []
+            logger = _thought_logger()
             
-            if not thoughts:
+            # Stream matching thoughts in chunks rather than loading them all
+            rows = logger.iter_thoughts(session, query_filters)
+            first = next(rows, None)
+            if first is None:
                 console.print("[yellow]No thoughts found matching the criteria[/yellow]")
                 return
             
-            # Simple export implementation
-            import json
-            import csv
+            exported = 0
             
-            if format_type.lower() == "json":
-                export_data = []
+            def counted(thoughts: Iterator["Thought"]) -> Iterator["Thought"]:
+                """Pass thoughts through while counting them."""
+                nonlocal exported
                 for thought in thoughts:
-                    export_data.append({
-                        "id": str(thought.id),
-                        "category": thought.category,
-                        "content": thought.content,
-                        "tags": thought.tags,
-                        "emotion": thought.emotion,
-                        "importance": thought.importance,
-                        "timestamp": thought.timestamp.isoformat()
-                    })
-                
-                with open(output, 'w', encoding='utf-8') as f:
-                    json.dump(export_data, f, indent=2, ensure_ascii=False)
+                    exported += 1
+                    yield thought
+            
+            thoughts = counted(itertools.chain([first], rows))
+            
+            if format_type.lower() == "json":
+                # Stream one orjson-encoded object per thought in the
+                # json.dump(indent=2) layout; orjson writes UUIDs and
+                # datetimes natively and emits UTF-8 bytes
+                with open(output, 'wb', buffering=EXPORT_BUFFER_SIZE) as f:
+                    f.write(b"[")
+                    for i, thought in enumerate(thoughts):
+                        f.write(b",\n  " if i else b"\n  ")
+                        f.write(nest_json({
+                            "id": thought.id,
+                            "category": thought.category,
+                            "content": thought.content,
+                            "tags": thought.tags,
+                            "emotion": thought.emotion,
+                            "importance": thought.importance,
+                            "timestamp": thought.timestamp
+                        }, 1))
+                    f.write(b"\n]")
                     
             elif format_type.lower() == "csv":
-                with open(output, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.writer(f)
-                    writer.writerow(["ID", "Category", "Content", "Tags", "Emotion", "Importance", "Timestamp"])
-                    for thought in thoughts:
-                        writer.writerow([
-                            str(thought.id),
-                            thought.category,
-                            thought.content,
-                            ",".join(thought.tags) if thought.tags else "",
-                            thought.emotion or "",
-                            thought.importance or "",
-                            thought.timestamp.isoformat()
-                        ])
+                with open(output, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as csv_file:
+                    writer = csv.writer(csv_file, quoting=csv.QUOTE_MINIMAL)
+                    writer.writerow(CSV_HEADER)
+                    writer.writerows(_csv_row(thought) for thought in thoughts)
             
-            console.print(f"✅ [green]Exported {len(thoughts)} thoughts to {output}[/green]")
+            console.print(f"✅ [green]Exported {exported} thoughts to {output}[/green]")
             
             # Show statistics if requested
-            if stats and len(thoughts) > 0:
+            if stats and exported > 0:
+                # Unscored and 0.0 thoughts stay out of the average, as before
+                summary = logger.aggregate_stats(session, query_filters, skip_zero_importance=True)
                 console.print("\n📊 Export Statistics:")
-                console.print(f"  Total thoughts: {len(thoughts)}")
+                console.print(f"  Total thoughts: {summary['total']}")
                 
                 # Category breakdown
-                categories = {}
-                emotions = {}
-                total_importance = 0
-                importance_count = 0
-                
-                for thought in thoughts:
-                    categories[thought.category] = categories.get(thought.category, 0) + 1
-                    if thought.emotion:
-                        emotions[thought.emotion] = emotions.get(thought.emotion, 0) + 1
-                    if thought.importance:
-                        total_importance += thought.importance
-                        importance_count += 1
-                
-                if categories:
+                if summary["categories"]:
                     console.print("  Categories:")
-                    for cat, count in categories.items():
+                    for cat, count in summary["categories"].items():
                         console.print(f"    {cat}: {count}")
                 
-                if emotions:
+                if summary["emotions"]:
                     console.print("  Emotions:")
-                    for emotion, count in list(emotions.items())[:5]:
+                    for emotion, count in list(summary["emotions"].items())[:5]:
                         console.print(f"    {emotion}: {count}")
                 
-                if importance_count > 0:
-                    avg_importance = total_importance / importance_count
-                    console.print(f"  Average importance: {avg_importance:.2f}")
+                if summary["average_importance"] is not None:
+                    console.print(f"  Average importance: {summary['average_importance']:.2f}")
             
     except Exception as e:
         console.print(f"[red]Export error: {e}[/red]")
@@ -709,35 +932,36 @@ def interactive():
     console.print("[bold blue]🧠 CoreLogger Interactive Mode[/bold blue]")
     console.print("Type 'help' for commands, 'quit' to exit\n")
     
-    init_database()
-    session = db_manager.SessionLocal()
-    logger = ThoughtLogger()
+    logger = _thought_logger()
     
     try:
-        while True:
-            command = Prompt.ask("[bold cyan]CoreLogger[/bold cyan]").strip().lower()
-            
-            if command in ['quit', 'exit', 'q']:
-                console.print("👋 Goodbye!")
-                break
-            elif command == 'help':
-                show_interactive_help()
-            elif command == 'log':
-                interactive_log_thought(session, logger)
-            elif command == 'list':
-                interactive_list_thoughts(session, logger)
-            elif command == 'stats':
-                interactive_show_stats(session, logger)
-            elif command == 'nlp':
-                interactive_nlp_analysis(session, logger)
-            else:
-                console.print(f"[red]Unknown command: {command}[/red]")
-                console.print("Type 'help' for available commands")
-                
+        with _cli_session() as session:
+            _interactive_loop(session, logger)
     except KeyboardInterrupt:
         console.print("\n👋 Goodbye!")
-    finally:
-        session.close()
+
+
+def _interactive_loop(session: "Session", logger: "ThoughtLogger") -> None:
+    """Read and dispatch commands until the user quits, all on one session."""
+    while True:
+        command = Prompt.ask("[bold cyan]CoreLogger[/bold cyan]").strip().lower()
+        
+        if command in _QUIT_COMMANDS:
+            console.print("👋 Goodbye!")
+            break
+        handler = _INTERACTIVE_COMMANDS.get(command)
+        if handler:
+            # One transaction (and one commit) per command; the session
+            # itself stays open for the whole loop
+            try:
+                with session.begin():
+                    handler(session, logger)
+            except Exception as e:
+                console.print(f"[red]Database error: {e}[/red]")
+            session.expire_all()
+        else:
+            console.print(f"[red]Unknown command: {command}[/red]")
+            console.print("Type 'help' for available commands")
 
 
 def show_interactive_help():
@@ -747,7 +971,7 @@ def show_interactive_help():
     help_table.add_column("Description", style="white")
     
     help_table.add_row("log", "Log a new thought interactively")
-    help_table.add_row("list", "Show recent thoughts")
+    help_table.add_row("list/ls", "Show recent thoughts")
     help_table.add_row("stats", "Show thought statistics")
     help_table.add_row("nlp", "Analyze a thought with NLP")
     help_table.add_row("help", "Show this help")
@@ -796,7 +1020,7 @@ def interactive_log_thought(session, logger):
             importance=importance
         )
         
-        thought = logger.create_thought(session, thought_data)
+        thought = logger.create_thought(session, thought_data, commit=False)
         console.print(f"✅ [green]Thought logged with ID: {thought.id}[/green]")
         
         # Show NLP analysis if auto-importance was used
@@ -814,28 +1038,22 @@ def interactive_list_thoughts(session, logger):
     """Interactive thought listing."""
     limit = int(Prompt.ask("📊 How many recent thoughts?", default="10"))
     
-    query = ThoughtQuery(
-        page=1, 
-        size=limit,
-        min_importance=0.0,
-        max_importance=1.0,
-        order_by="timestamp",
-        order_desc=True
-    )
-    thoughts = logger.list_thoughts(session, query)
+    # Rows stream from the database straight into the table; no page size cap
+    rows = logger.iter_thoughts(session, chunk_size=500, limit=limit)
+    first = next(rows, None)
     
-    if thoughts.thoughts:
+    if first is not None:
         table = Table(title=f"Recent {limit} Thoughts")
         table.add_column("ID", style="dim")
         table.add_column("Category", style="cyan")
         table.add_column("Content", style="white")
         table.add_column("Importance", style="yellow")
         
-        for thought in thoughts.thoughts:
-            content_preview = thought.content[:50] + "..." if len(thought.content) > 50 else thought.content
-            importance_str = f"{thought.importance:.2f}" if thought.importance else "N/A"
+        for thought in itertools.chain([first], rows):
+            content_preview = thought.content[:50] + ("..." if len(thought.content) > 50 else "")
+            importance_str = format(thought.importance, ".2f") if thought.importance is not None else "N/A"
             table.add_row(
-                str(thought.id)[:8],
+                thought.id.hex[:8],  # same 8 chars as str(id), without formatting the full UUID
                 thought.category,
                 content_preview,
                 importance_str
@@ -852,15 +1070,7 @@ def interactive_show_stats(session, logger):
     console.print(f"📊 Total thoughts: {total}")
     
     if total > 0:
-        recent_query = ThoughtQuery(
-            page=1, 
-            size=5,
-            min_importance=0.0,
-            max_importance=1.0,
-            order_by="timestamp",
-            order_desc=True
-        )
-        recent = logger.list_thoughts(session, recent_query)
+        recent = logger.list_thoughts(session, RECENT_THOUGHTS_QUERY)
         
         console.print(f"📅 Most recent: {recent.thoughts[0].timestamp if recent.thoughts else 'None'}")
         
@@ -874,17 +1084,15 @@ def interactive_nlp_analysis(session, logger):
     thought_id_input = Prompt.ask("🔍 Enter thought ID (first 8 characters)")
     
     try:
-        # Find thought by partial ID
-        thoughts = session.query(ThoughtModel)\
-            .filter(ThoughtModel.id.cast(String).like(f"{thought_id_input}%"))\
-            .all()
+        # Find thought by partial ID; two rows are enough to detect ambiguity
+        thoughts = logger.find_thoughts_by_id_prefix(session, thought_id_input, limit=2)
         
         if not thoughts:
             console.print("[red]No thought found with that ID[/red]")
             return
         
         if len(thoughts) > 1:
-            console.print(f"[yellow]Multiple thoughts found ({len(thoughts)}), using first match[/yellow]")
+            console.print("[yellow]Multiple thoughts found, using first match[/yellow]")
         
         thought = thoughts[0]
         # The thought.id from database is already a UUID
@@ -909,82 +1117,96 @@ def interactive_nlp_analysis(session, logger):
         console.print(f"[red]Error: {e}[/red]")
 
 
+# Interactive mode commands; every handler takes (session, logger)
+_INTERACTIVE_COMMANDS = {
+    "log": interactive_log_thought,
+    "list": interactive_list_thoughts,
+    "ls": interactive_list_thoughts,
+    "stats": interactive_show_stats,
+    "nlp": interactive_nlp_analysis,
+    "help": lambda *_: show_interactive_help(),
+}
+_QUIT_COMMANDS = frozenset({"quit", "exit", "q"})
+
+
 @app.command()
 def analyze(
     thought_id: str = typer.Argument(..., help="Thought ID to analyze"),
     detailed: bool = typer.Option(False, "--detailed", "-d", help="Show detailed metrics")
 ):
     """Analyze a thought with enhanced NLP."""
-    init_database()
-    session = db_manager.SessionLocal()
-    logger = ThoughtLogger()
+    logger = _thought_logger()
     
     try:
-        # Find thought by partial ID
-        thoughts = session.query(ThoughtModel)\
-            .filter(ThoughtModel.id.cast(String).like(f"{thought_id}%"))\
-            .all()
+        with _cli_session() as session:
+            _print_analysis(session, logger, thought_id, detailed)
+    except typer.Exit:
+        raise
+    except Exception as e:
+        console.print(f"[red]Analysis error: {e}[/red]")
+        raise typer.Exit(1)
+
+
+def _print_analysis(session: "Session", logger: "ThoughtLogger", thought_id: str, detailed: bool) -> None:
+    """Look up a thought by ID prefix and print its NLP analysis."""
+    # Find thought by partial ID; two rows are enough to detect ambiguity
+    thoughts = logger.find_thoughts_by_id_prefix(session, thought_id, limit=2)
+    
+    if not thoughts:
+        console.print(f"[red]No thought found with ID starting with: {thought_id}[/red]")
+        raise typer.Exit(1)
+    
+    if len(thoughts) > 1:
+        console.print("[yellow]Multiple thoughts found, using first match[/yellow]")
+    
+    thought = thoughts[0]
+    # GUID columns load as uuid.UUID, so the id is passed through as-is
+    # (as interactive_nlp_analysis does) rather than re-parsed from str
+    analysis = logger.get_nlp_analysis(session, thought.id)
+    
+    if analysis:
+        # Basic analysis
+        console.print(f"[bold blue]📝 Thought Analysis[/bold blue]")
+        console.print(f"ID: {thought.id}")
+        console.print(f"Content: {thought.content}")
+        console.print(f"Category: {thought.category}")
+        console.print(f"Created: {thought.timestamp}")
+        console.print()
         
-        if not thoughts:
-            console.print(f"[red]No thought found with ID starting with: {thought_id}[/red]")
-            raise typer.Exit(1)
+        # NLP Metrics
+        console.print(f"[bold green]🧠 NLP Metrics[/bold green]")
+        console.print(f"⭐ Importance Score: {analysis['importance_score']:.3f}")
+        console.print(f"🎭 Sentiment: {analysis['sentiment']} ({analysis['sentiment_score']:.2f})")
+        console.print(f"🔄 Novelty Score: {analysis['novelty_score']:.3f}")
+        console.print(f"🧩 Complexity Score: {analysis['complexity_score']:.3f}")
+        console.print(f"📊 Information Entropy: {analysis['entropy']:.2f}")
+        console.print(f"🔁 Repetition Score: {analysis['repetition_score']:.3f}")
+        console.print()
         
-        if len(thoughts) > 1:
-            console.print(f"[yellow]Multiple thoughts found ({len(thoughts)}), using first match[/yellow]")
+        # Content Statistics
+        console.print(f"[bold yellow]📈 Content Statistics[/bold yellow]")
+        console.print(f"Word Count: {analysis['word_count']}")
+        console.print(f"Character Count: {analysis['char_count']}")
+        console.print(f"Keywords: {', '.join(analysis['keywords'][:10])}")
+        console.print()
         
-        thought = thoughts[0]
-        # Get analysis using the actual UUID from the database model
-        analysis = logger.get_nlp_analysis(session, UUID(str(thought.id)))
-        
-        if analysis:
-            # Basic analysis
-            console.print(f"[bold blue]📝 Thought Analysis[/bold blue]")
-            console.print(f"ID: {thought.id}")
-            console.print(f"Content: {thought.content}")
-            console.print(f"Category: {thought.category}")
-            console.print(f"Created: {thought.timestamp}")
-            console.print()
-            
-            # NLP Metrics
-            console.print(f"[bold green]🧠 NLP Metrics[/bold green]")
-            console.print(f"⭐ Importance Score: {analysis['importance_score']:.3f}")
-            console.print(f"🎭 Sentiment: {analysis['sentiment']} ({analysis['sentiment_score']:.2f})")
-            console.print(f"🔄 Novelty Score: {analysis['novelty_score']:.3f}")
-            console.print(f"🧩 Complexity Score: {analysis['complexity_score']:.3f}")
-            console.print(f"📊 Information Entropy: {analysis['entropy']:.2f}")
-            console.print(f"🔁 Repetition Score: {analysis['repetition_score']:.3f}")
+        if detailed and 'importance_metrics' in analysis:
+            console.print(f"[bold cyan]🔍 Detailed Importance Breakdown[/bold cyan]")
+            metrics = analysis['importance_metrics']
+            console.print(f"Length Factor: {metrics['length_factor']:.3f}")
+            console.print(f"Complexity Factor: {metrics['complexity_factor']:.3f}")
+            console.print(f"Novelty Factor: {metrics['novelty_factor']:.3f}")
+            console.print(f"Sentiment Factor: {metrics['sentiment_factor']:.3f}")
+            console.print(f"Entropy Factor: {metrics['entropy_factor']:.3f}")
             console.print()
             
-            # Content Statistics
-            console.print(f"[bold yellow]📈 Content Statistics[/bold yellow]")
-            console.print(f"Word Count: {analysis['word_count']}")
-            console.print(f"Character Count: {analysis['char_count']}")
-            console.print(f"Keywords: {', '.join(analysis['keywords'][:10])}")
-            console.print()
-            
-            if detailed and 'importance_metrics' in analysis:
-                console.print(f"[bold cyan]🔍 Detailed Importance Breakdown[/bold cyan]")
-                metrics = analysis['importance_metrics']
-                console.print(f"Length Factor: {metrics['length_factor']:.3f}")
-                console.print(f"Complexity Factor: {metrics['complexity_factor']:.3f}")
-                console.print(f"Novelty Factor: {metrics['novelty_factor']:.3f}")
-                console.print(f"Sentiment Factor: {metrics['sentiment_factor']:.3f}")
-                console.print(f"Entropy Factor: {metrics['entropy_factor']:.3f}")
-                console.print()
-                
-                if analysis['keyword_density']:
-                    console.print(f"[bold magenta]🏷️  Keyword Density[/bold magenta]")
-                    for keyword, density in list(analysis['keyword_density'].items())[:5]:
-                        console.print(f"{keyword}: {density:.3f}")
-        else:
-            console.print("[red]Could not generate NLP analysis[/red]")
-            raise typer.Exit(1)
-            
-    except Exception as e:
-        console.print(f"[red]Analysis error: {e}[/red]")
+            if analysis['keyword_density']:
+                console.print(f"[bold magenta]🏷️  Keyword Density[/bold magenta]")
+                for keyword, density in list(analysis['keyword_density'].items())[:5]:
+                    console.print(f"{keyword}: {density:.3f}")
+    else:
+        console.print("[red]Could not generate NLP analysis[/red]")
         raise typer.Exit(1)
-    finally:
-        session.close()
 
 
 @app.command()
@@ -998,20 +1220,17 @@ def recalculate_importance(
             console.print("Cancelled.")
             raise typer.Exit(0)
     
-    init_database()
-    session = db_manager.SessionLocal()
-    logger = ThoughtLogger()
+    logger = _thought_logger()
     
     try:
-        console.print("🔄 Recalculating importance scores...")
-        updated_count = logger.recalculate_importance_bulk(session, limit)
-        console.print(f"✅ [green]Updated {updated_count} thoughts[/green]")
+        with _cli_session() as session:
+            console.print("🔄 Recalculating importance scores...")
+            updated_count = logger.recalculate_importance_bulk(session, limit)
+            console.print(f"✅ [green]Updated {updated_count} thoughts[/green]")
         
     except Exception as e:
         console.print(f"[red]Recalculation error: {e}[/red]")
         raise typer.Exit(1)
-    finally:
-        session.close()
 
 
 if __name__ == "__main__":
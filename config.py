@@ -1,4 +1,5 @@
 import os
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
@@ -11,6 +12,11 @@ class Settings(BaseSettings):
     # Database
     database_url: str = "sqlite:///./corelogger.db"
     database_echo: bool = False
+    database_pool_size: int = 20
+    database_max_overflow: int = 10
+    database_pool_timeout: int = 30
+    database_pool_recycle: int = 3600
+    database_query_cache_size: int = 1200  # compiled SQL statements kept per engine
     
     # API
     api_host: str = "localhost"
@@ -46,8 +52,50 @@ class Settings(BaseSettings):
     }
 
 
+@dataclass(frozen=True, slots=True)
+class _FrozenSettings:
+    """Immutable snapshot of Settings; field names must match Settings."""
+    
+    # Database
+    database_url: str
+    database_echo: bool
+    database_pool_size: int
+    database_max_overflow: int
+    database_pool_timeout: int
+    database_pool_recycle: int
+    database_query_cache_size: int
+    
+    # API
+    api_host: str
+    api_port: int
+    api_reload: bool
+    api_title: str
+    api_description: str
+    api_version: str
+    
+    # Logging
+    log_level: str
+    log_format: str
+    
+    # Storage
+    data_dir: Path
+    backup_dir: Optional[Path]
+    
+    # Features
+    enable_emotions: bool
+    enable_importance_scoring: bool
+    max_content_length: int
+    default_importance: float
+    
+    # AI API Keys
+    gemini_api_key: Optional[str]
+    openai_api_key: Optional[str]
+
+
+# Settings is only used to parse the environment once; the rest of the app
+# reads from the frozen snapshot of the result
 # Global settings instance
-settings = Settings()
+settings = _FrozenSettings(**Settings().model_dump())
 
 # Ensure data directory exists
 settings.data_dir.mkdir(exist_ok=True)
@@ -1,6 +1,6 @@
 """Database models and session management."""
 
-from .models import Base, ThoughtModel
+from .models import Base, ThoughtModel, ThoughtTagModel
 from .session import (
     DatabaseManager,
     db_manager,
@@ -12,6 +12,7 @@ from .session import (
 __all__ = [
     "Base",
     "ThoughtModel",
+    "ThoughtTagModel",
     "DatabaseManager",
     "db_manager",
     "get_db",
@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import List
 from uuid import uuid4
 
-from sqlalchemy import JSON, Column, DateTime, Float, String, Text
+from sqlalchemy import JSON, Column, DateTime, Float, ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import UUID as PostgresUUID
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.types import TypeDecorator, CHAR
@@ -29,13 +29,12 @@ class GUID(TypeDecorator):
     def process_bind_param(self, value, dialect):
         if value is None:
             return value
-        elif dialect.name == 'postgresql':
+        if isinstance(value, uuid.UUID) or dialect.name == 'postgresql':
             return str(value)
-        else:
-            if not isinstance(value, uuid.UUID):
-                return str(uuid.UUID(value))
-            else:
-                return str(value)
+        # Canonical lowercase strings are stored as-is; anything else is normalized
+        if len(value) == 36 and value[8] == '-' and value.islower():
+            return value
+        return str(uuid.UUID(value))
 
     def process_result_value(self, value, dialect):
         if value is None:
@@ -73,3 +72,31 @@ class ThoughtModel(Base):
             "emotion": self.emotion,
             "importance": self.importance,
         }
+
+
+# Serves the common listing: filter by category, newest first, importance
+# range, without a separate sort step
+Index(
+    "ix_thoughts_category_timestamp_importance",
+    ThoughtModel.category,
+    ThoughtModel.timestamp.desc(),
+    ThoughtModel.importance,
+)
+
+
+class ThoughtTagModel(Base):
+    """One row per (tag, thought) pair; the indexed lookup behind tag filters.
+    
+    ThoughtModel.tags stays the stored list that reads return; this table
+    mirrors it so filtering by tag is an index seek instead of a JSON scan.
+    """
+    
+    __tablename__ = "thought_tags"
+
+    tag = Column(String(100), primary_key=True)
+    thought_id = Column(
+        GUID(), ForeignKey("thoughts.id", ondelete="CASCADE"), primary_key=True, index=True
+    )
+
+    def __repr__(self) -> str:
+        return f"<ThoughtTagModel(tag={self.tag}, thought_id={self.thought_id})>"
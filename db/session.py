@@ -1,32 +1,121 @@
+import threading
 from contextlib import contextmanager
-from typing import Generator, Optional
+from functools import cached_property
+from typing import Any, Generator, Optional
 
-from sqlalchemy import create_engine
+import orjson
+from sqlalchemy import create_engine, event, insert, inspect, select
+from sqlalchemy.engine import Engine, Result
 from sqlalchemy.orm import Session, sessionmaker
 
 from config import settings
-from db.models import Base
+from db.models import Base, ThoughtModel, ThoughtTagModel
+
+
+def _json_dumps(value: Any) -> str:
+    """orjson encoder for JSON columns; drivers expect text, not bytes."""
+    return orjson.dumps(value).decode()
 
 
 class DatabaseManager:
-    """Database connection and session management."""
+    """Database connection and session management.
+    
+    The engine is created on first use, so database_url and poolclass can
+    still be changed after construction (e.g. by CLI options).
+    """
     
-    def __init__(self, database_url: Optional[str] = None):
+    def __init__(self, database_url: Optional[str] = None, poolclass: Optional[type] = None):
         self.database_url = database_url or settings.database_url
-        self.engine = create_engine(
+        self.poolclass = poolclass
+        self._tables_created = False
+        self._tables_lock = threading.Lock()
+        
+    @cached_property
+    def engine(self) -> Engine:
+        """SQLAlchemy engine, built on first access."""
+        engine = create_engine(
             self.database_url,
             echo=settings.database_echo,
-            connect_args={"check_same_thread": False} if "sqlite" in self.database_url else {}
+            query_cache_size=settings.database_query_cache_size,
+            json_serializer=_json_dumps,
+            json_deserializer=orjson.loads,
+            connect_args={"check_same_thread": False} if "sqlite" in self.database_url else {},
+            **self._pool_options(self.database_url, self.poolclass),
         )
-        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        if self.database_url.startswith("sqlite") and ":memory:" not in self.database_url:
+            event.listen(engine, "connect", self._set_sqlite_pragmas)
+        return engine
+        
+    @cached_property
+    def SessionLocal(self) -> sessionmaker[Session]:
+        """Session factory bound to the engine."""
+        return sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        
+    @staticmethod
+    def _set_sqlite_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+        """WAL + synchronous=NORMAL: one fsync per checkpoint rather than per commit."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
+        
+    @staticmethod
+    def _pool_options(database_url: str, poolclass: Optional[type] = None) -> dict:
+        """QueuePool sizing unless a poolclass is given; in-memory SQLite uses a singleton pool."""
+        if poolclass is not None:
+            return {"poolclass": poolclass}
+        if ":memory:" in database_url:
+            return {}
+        return {
+            "pool_size": settings.database_pool_size,
+            "max_overflow": settings.database_max_overflow,
+            "pool_timeout": settings.database_pool_timeout,
+            "pool_recycle": settings.database_pool_recycle,
+            # A local SQLite file cannot go stale; ping only networked servers
+            "pool_pre_ping": not database_url.startswith("sqlite"),
+        }
         
     def create_tables(self) -> None:
-        """Create all database tables."""
+        """Create all database tables, plus any indexes added since they were created."""
+        had_tag_table = inspect(self.engine).has_table(ThoughtTagModel.__tablename__)
         Base.metadata.create_all(bind=self.engine)
+        # create_all skips existing tables entirely, including their new indexes
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(bind=self.engine, checkfirst=True)
+        if not had_tag_table:
+            self._backfill_thought_tags()
+        self._tables_created = True
+        
+    def _backfill_thought_tags(self, chunk_size: int = 5000) -> None:
+        """Populate thought_tags from the stored tag lists of existing thoughts."""
+        with self.engine.begin() as connection:
+            rows: Result = connection.execute(
+                select(ThoughtModel.id, ThoughtModel.tags).execution_options(yield_per=chunk_size)
+            )
+            for chunk in rows.partitions():
+                tag_rows = [
+                    {"tag": tag, "thought_id": thought_id}
+                    for thought_id, tags in chunk
+                    for tag in dict.fromkeys(tags or [])
+                ]
+                if tag_rows:
+                    connection.execute(insert(ThoughtTagModel), tag_rows)
+        
+    def ensure_tables(self) -> None:
+        """Create the tables once per manager; later calls return immediately."""
+        if self._tables_created:
+            return
+        with self._tables_lock:
+            if not self._tables_created:
+                self.create_tables()
         
     def drop_tables(self) -> None:
         """Drop all database tables."""
         Base.metadata.drop_all(bind=self.engine)
+        self._tables_created = False
         
     @contextmanager
     def get_session(self) -> Generator[Session, None, None]:
@@ -60,8 +149,8 @@ def get_db() -> Generator[Session, None, None]:
 
 
 def init_database() -> None:
-    """Initialize the database with tables."""
-    db_manager.create_tables()
+    """Initialize the database with tables (once per process)."""
+    db_manager.ensure_tables()
 
 
 def reset_database() -> None:
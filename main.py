@@ -7,15 +7,14 @@ Eidos OS Logging Module REST API Server
 import logging
 from contextlib import asynccontextmanager
 
+import anyio.to_thread
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
 
 from api import router
 from config import settings
 from db import init_database
-from web.routes import router as web_router
 
 # Configure logging
 logging.basicConfig(
@@ -37,6 +36,10 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to initialize database: {e}")
         raise
     
+    # Sync routes run in the threadpool; size it to the DB connection pool
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = settings.database_pool_size + settings.database_max_overflow
+    
     yield
     
     # Shutdown
@@ -45,12 +48,17 @@ async def lifespan(app: FastAPI):
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
+    # The dashboard stack (templates, static files) is only needed once an
+    # app is actually built
+    from fastapi.staticfiles import StaticFiles
+    from web.routes import router as web_router
     
     app = FastAPI(
         title=settings.api_title,
         description=settings.api_description,
         version=settings.api_version,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
         docs_url="/docs",
         redoc_url="/redoc",
     )
@@ -1,6 +1,7 @@
 """Pydantic models for CoreLogger."""
 
 from .thought import (
+    RECENT_THOUGHTS_QUERY,
     Thought,
     ThoughtBase,
     ThoughtCreate,
@@ -18,4 +19,5 @@ __all__ = [
     "ThoughtResponse",
     "ThoughtsListResponse",
     "ThoughtQuery",
+    "RECENT_THOUGHTS_QUERY",
 ]
@@ -1,8 +1,34 @@
 from datetime import datetime, timezone
-from typing import List, Literal, Optional
+from typing import Annotated, Dict, List, Literal, Optional
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from pydantic import AfterValidator, BaseModel, Field, field_validator, ConfigDict
+
+# Categories accepted by ThoughtUpdate; validated by pydantic-core, no Python-side scan
+ThoughtCategory = Literal["perception", "reflection", "decision", "tick", "error"]
+
+
+def _clean_tags(v: List[str]) -> List[str]:
+    """Strip, lowercase and deduplicate tags in first-seen order, dropping empty ones."""
+    cleaned: Dict[str, None] = {}
+    for tag in v:
+        tag = tag.strip()
+        if tag:
+            cleaned[tag.lower()] = None
+    return list(cleaned)
+
+
+def _clean_emotion(v: Optional[str]) -> Optional[str]:
+    """Strip and lowercase an emotion; blank becomes None."""
+    if v is None:
+        return None
+    emotion = v.strip().lower()
+    return emotion if emotion else None
+
+
+# Shared field types: one validator definition reused by every model
+CleanTags = Annotated[List[str], AfterValidator(_clean_tags)]
+CleanEmotion = Annotated[Optional[str], AfterValidator(_clean_emotion)]
 
 
 class ThoughtBase(BaseModel):
@@ -14,35 +40,16 @@ class ThoughtBase(BaseModel):
     content: str = Field(
         ..., min_length=1, max_length=10000, description="Content of the thought"
     )
-    tags: List[str] = Field(
+    tags: CleanTags = Field(
         default_factory=list, description="Tags associated with the thought"
     )
-    emotion: Optional[str] = Field(
+    emotion: CleanEmotion = Field(
         None, description="Emotional state or label"
     )
     importance: Optional[float] = Field(
         None, ge=0.0, le=1.0, description="Importance score between 0 and 1"
     )
 
-    @field_validator("tags")
-    @classmethod
-    def validate_tags(cls, v: List[str]) -> List[str]:
-        """Validate and clean tags."""
-        if not v:
-            return []
-        # Remove duplicates and clean whitespace
-        cleaned_tags = list(set(tag.strip().lower() for tag in v if tag.strip()))
-        return cleaned_tags
-
-    @field_validator("emotion")
-    @classmethod
-    def validate_emotion(cls, v: Optional[str]) -> Optional[str]:
-        """Validate emotion field."""
-        if v is None:
-            return None
-        emotion = v.strip().lower()
-        return emotion if emotion else None
-
 
 class ThoughtCreate(BaseModel):
     """Schema for creating a new thought."""
@@ -53,34 +60,15 @@ class ThoughtCreate(BaseModel):
     content: str = Field(
         ..., min_length=1, max_length=10000, description="Content of the thought"
     )
-    tags: List[str] = Field(
+    tags: CleanTags = Field(
         default_factory=list, description="Tags associated with the thought"
     )
-    emotion: Optional[str] = Field(
+    emotion: CleanEmotion = Field(
         None, description="Emotional state or label"
     )
     importance: Optional[float] = Field(
         None, ge=0.0, le=1.0, description="Importance score between 0 and 1"
     )
-
-    @field_validator("tags")
-    @classmethod
-    def validate_tags(cls, v: List[str]) -> List[str]:
-        """Validate and clean tags."""
-        if not v:
-            return []
-        # Remove duplicates and clean whitespace
-        cleaned_tags = list(set(tag.strip().lower() for tag in v if tag.strip()))
-        return cleaned_tags
-
-    @field_validator("emotion")
-    @classmethod
-    def validate_emotion(cls, v: Optional[str]) -> Optional[str]:
-        """Validate emotion field."""
-        if v is None:
-            return None
-        emotion = v.strip().lower()
-        return emotion if emotion else None
     
     model_config = ConfigDict(
         json_schema_extra={
@@ -98,30 +86,12 @@ class ThoughtCreate(BaseModel):
 class ThoughtUpdate(BaseModel):
     """Schema for updating an existing thought."""
     
-    category: Optional[Literal["perception", "reflection", "decision", "tick", "error"]] = None
+    category: Optional[ThoughtCategory] = None
     content: Optional[str] = Field(None, min_length=1, max_length=10000)
-    tags: Optional[List[str]] = None
-    emotion: Optional[str] = None
+    tags: Optional[CleanTags] = None
+    emotion: CleanEmotion = None
     importance: Optional[float] = Field(None, ge=0.0, le=1.0)
 
-    @field_validator("tags")
-    @classmethod
-    def validate_tags(cls, v: Optional[List[str]]) -> Optional[List[str]]:
-        """Validate and clean tags."""
-        if v is None:
-            return None
-        cleaned_tags = list(set(tag.strip().lower() for tag in v if tag.strip()))
-        return cleaned_tags
-
-    @field_validator("emotion")
-    @classmethod
-    def validate_emotion(cls, v: Optional[str]) -> Optional[str]:
-        """Validate emotion field."""
-        if v is None:
-            return None
-        emotion = v.strip().lower()
-        return emotion if emotion else None
-
 
 class Thought(ThoughtBase):
     """Complete thought model with all fields."""
@@ -153,6 +123,7 @@ class ThoughtsListResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    next_cursor: Optional[str] = None  # Keyset cursor for the following page
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -162,7 +133,7 @@ class ThoughtQuery(BaseModel):
     
     # Basic filters
     category: Optional[str] = None  # Made more flexible for web interface
-    tags: Optional[List[str]] = None
+    tags: Optional[CleanTags] = None
     tag: Optional[str] = None  # Single tag for web interface
     emotion: Optional[str] = None
     min_importance: Optional[float] = Field(None, ge=0.0, le=1.0)
@@ -175,6 +146,7 @@ class ThoughtQuery(BaseModel):
     # Pagination
     page: int = Field(1, ge=1)
     size: int = Field(10, ge=1, le=100)
+    cursor: Optional[str] = None  # Keyset cursor; takes precedence over page
     
     # Ordering
     order_by: Optional[str] = Field("timestamp", description="Field to order by")
@@ -184,14 +156,9 @@ class ThoughtQuery(BaseModel):
     created_after: Optional[datetime] = None
     created_before: Optional[datetime] = None
 
-    @field_validator("tags")
-    @classmethod
-    def validate_tags(cls, v: Optional[List[str]]) -> Optional[List[str]]:
-        """Validate and clean tags."""
-        if v is None:
-            return None
-        return [tag.strip().lower() for tag in v if tag.strip()]
-    
+    # Immutable so shared instances (e.g. RECENT_THOUGHTS_QUERY) are safe to reuse
+    model_config = ConfigDict(frozen=True)
+
     @field_validator("category")
     @classmethod
     def validate_category(cls, v: Optional[str]) -> Optional[str]:
@@ -199,3 +166,14 @@ class ThoughtQuery(BaseModel):
         if v is None:
             return None
         return v.strip().lower() if v.strip() else None
+
+
+# Five most recent thoughts; validated once at import and reused
+RECENT_THOUGHTS_QUERY = ThoughtQuery(
+    page=1,
+    size=5,
+    min_importance=0.0,
+    max_importance=1.0,
+    order_by="timestamp",
+    order_desc=True,
+)
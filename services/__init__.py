@@ -1,9 +1,11 @@
 """Service layer for CoreLogger."""
 
+from .cache import TTLCache
 from .formatter import ThoughtFormatter, thought_formatter
 from .logger import ThoughtLogger, thought_logger
 
 __all__ = [
+    "TTLCache",
     "ThoughtLogger",
     "thought_logger",
     "ThoughtFormatter",
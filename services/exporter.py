@@ -1,22 +1,144 @@
 """Export functionality for thoughts to various formats."""
 
-import json
+import asyncio
 import csv
-from typing import List, Optional, Dict, Any
+import itertools
+from collections import Counter
+from operator import attrgetter
+from statistics import fmean
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 from datetime import datetime
 from pathlib import Path
 
+import orjson
+
+from sqlalchemy import Select, desc, func, select
 from sqlalchemy.orm import Session
 
+from db.models import ThoughtModel, ThoughtTagModel
+
 from models.thought import ThoughtQuery
-from services.logger import ThoughtLogger
+from services.logger import thought_logger
+
+
+def _isoformat(value: Optional[datetime]) -> str:
+    """ISO timestamp for a CSV cell, or '' when missing."""
+    return value.isoformat() if value else ''
+
+
+# 1 MiB write buffers: large exports reach the kernel in few, big write()
+# calls, and the page cache overlaps write-back with encoding the next rows
+EXPORT_BUFFER_SIZE = 1 << 20
+
+
+def nest_json(value: Any, depth: int) -> bytes:
+    """orjson-encode value as json.dump(indent=2) would lay it out at this nesting depth.
+    
+    The first line is left unindented for the caller to place. JSON strings
+    never contain raw newlines, so shifting every line break is safe.
+    """
+    encoded = orjson.dumps(value, option=orjson.OPT_INDENT_2)
+    return encoded.replace(b"\n", b"\n" + b"  " * depth)
+
+
+EXPORT_FIELDS = (
+    'id', 'category', 'content', 'tags', 'emotion',
+    'importance', 'novelty_score', 'created_at', 'updated_at'
+)
+
+_CORE_FIELDS = attrgetter(*EXPORT_FIELDS[:6])
+_OPTIONAL_FIELDS = EXPORT_FIELDS[6:]
+_NO_OPTIONAL_FIELDS = (None,) * len(_OPTIONAL_FIELDS)
+
+
+def _optional_fields_reader(thought: Any) -> Callable[[Any], tuple]:
+    """Reader for the optional fields, chosen once from a sample thought.
+    
+    Neither Thought nor ThoughtModel has them, so the common case returns a
+    constant rather than paying for three failed lookups on every row.
+    """
+    present = [hasattr(thought, name) for name in _OPTIONAL_FIELDS]
+    if all(present):
+        return attrgetter(*_OPTIONAL_FIELDS)
+    if not any(present):
+        return lambda _: _NO_OPTIONAL_FIELDS
+    return lambda t: tuple(getattr(t, name, None) for name in _OPTIONAL_FIELDS)
+
+
+def _export_values(thoughts: Iterable[Any]) -> Iterator[tuple]:
+    """EXPORT_FIELDS values for each thought, read with one attrgetter call per row."""
+    read_optional = None
+    for thought in thoughts:
+        if read_optional is None:
+            read_optional = _optional_fields_reader(thought)
+        yield _CORE_FIELDS(thought) + read_optional(thought)
+
+
+def _csv_row(values: tuple) -> tuple:
+    """CSV cells for one thought's EXPORT_FIELDS values."""
+    id_, category, content, tags, emotion, importance, novelty_score, created_at, updated_at = values
+    return (
+        str(id_),
+        category,
+        content,
+        ','.join(tags) if tags else '',
+        emotion or '',
+        importance or '',
+        novelty_score,
+        _isoformat(created_at),
+        _isoformat(updated_at),
+    )
+
+
+def _write_json_sync(thoughts: Iterable[Any], output_file: Path) -> int:
+    """Write thoughts as a JSON export document; returns how many were written."""
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    
+    exported_at = datetime.now()
+    exported_count = 0
+    
+    # Written incrementally, one orjson-encoded thought at a time, in the
+    # json.dump(indent=2) layout, with the metadata (which needs the final
+    # count) after the list. orjson encodes UUIDs and datetimes itself and
+    # emits UTF-8 bytes (non-ASCII kept as-is, like ensure_ascii=False)
+    with open(output_file, 'wb', buffering=EXPORT_BUFFER_SIZE) as f:
+        f.write(b'{\n  "thoughts": [')
+        for values in _export_values(thoughts):
+            f.write(b',\n    ' if exported_count else b'\n    ')
+            f.write(nest_json(dict(zip(EXPORT_FIELDS, values)), 2))
+            exported_count += 1
+        f.write(b'\n  ],\n  "export_metadata": ' if exported_count else b'],\n  "export_metadata": ')
+        f.write(nest_json({
+            "format": "json",
+            "exported_at": exported_at,
+            "total_thoughts": exported_count,
+            "source": "CoreLogger"
+        }, 1))
+        f.write(b'\n}')
+    return exported_count
+
+
+def _write_csv_sync(thoughts: Iterable[Any], output_file: Path) -> int:
+    """Write thoughts as CSV rows under EXPORT_FIELDS; returns how many were written."""
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    
+    with open(output_file, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(EXPORT_FIELDS)
+        
+        # writerows drives the loop in C; zip stops before advancing
+        # the counter past the last thought, so next() is the row count
+        counter = itertools.count()
+        writer.writerows(_csv_row(values) for values, _ in zip(_export_values(thoughts), counter))
+        exported_count = next(counter)
+    return exported_count
 
 
 class ThoughtExporter:
     """Handles exporting thoughts to different formats."""
     
-    def __init__(self):
-        self.thought_logger = ThoughtLogger()
+    def __init__(self) -> None:
+        self.thought_logger = thought_logger
     
     async def export_thoughts(
         self,
@@ -27,41 +149,18 @@ class ThoughtExporter:
     ) -> Dict[str, Any]:
         """Export thoughts to specified format."""
         
-        # Get thoughts based on filters
-        if query_filters is None:
-            query_filters = ThoughtQuery(
-                page=1, 
-                size=10000,
-                min_importance=None,
-                max_importance=None,
-                order_by="timestamp",
-                order_desc=True
-            )  # Get all
-        else:
-            # Create a new query with updated size for export
-            query_dict = query_filters.model_dump()
-            query_dict['size'] = 10000
-            query_filters = ThoughtQuery(**query_dict)
-        
-        thoughts_response = self.thought_logger.get_thoughts(db, query_filters)
-        
-        # Extract thoughts from response
-        if hasattr(thoughts_response, 'thoughts'):
-            thoughts = thoughts_response.thoughts
-        else:
-            thoughts = thoughts_response
-            
-        # Convert to list if needed
-        if not isinstance(thoughts, list):
-            thoughts = [thoughts] if thoughts else []
-        
-        if not thoughts:
+        # A LIMIT 1 probe settles the empty case without sorting or fetching rows
+        if not await asyncio.to_thread(self.thought_logger.exists, db, query_filters):
             return {
                 "success": False,
                 "message": "No thoughts found matching the criteria",
                 "exported_count": 0
             }
         
+        # Stream every matching thought (pagination fields are ignored) so
+        # memory stays flat however many rows match
+        thoughts = self.thought_logger.iter_thoughts(db, query_filters)
+        
         # Export based on format
         if format_type.lower() == "json":
             return await self._export_to_json(thoughts, output_path)
@@ -74,47 +173,18 @@ class ThoughtExporter:
                 "exported_count": 0
             }
     
-    async def _export_to_json(self, thoughts: List[Any], output_path: str) -> Dict[str, Any]:
+    async def _export_to_json(self, thoughts: Iterable[Any], output_path: str) -> Dict[str, Any]:
         """Export thoughts to JSON format."""
         try:
-            # Convert thoughts to serializable format
-            thoughts_data = []
-            for thought in thoughts:
-                thought_dict = {
-                    "id": str(thought.id),
-                    "category": thought.category,
-                    "content": thought.content,
-                    "tags": thought.tags,
-                    "emotion": thought.emotion,
-                    "importance": thought.importance,
-                    "novelty_score": getattr(thought, 'novelty_score', None),
-                    "created_at": thought.created_at.isoformat() if thought.created_at else None,
-                    "updated_at": thought.updated_at.isoformat() if thought.updated_at else None
-                }
-                thoughts_data.append(thought_dict)
-            
-            # Create export metadata
-            export_data = {
-                "export_metadata": {
-                    "format": "json",
-                    "exported_at": datetime.now().isoformat(),
-                    "total_thoughts": len(thoughts_data),
-                    "source": "CoreLogger"
-                },
-                "thoughts": thoughts_data
-            }
-            
-            # Write to file
             output_file = Path(output_path)
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            # File writes (and the row fetches feeding them) run in a worker
+            # thread so the event loop stays free during long exports
+            exported_count = await asyncio.to_thread(_write_json_sync, thoughts, output_file)
             
             return {
                 "success": True,
-                "message": f"Successfully exported {len(thoughts_data)} thoughts to {output_path}",
-                "exported_count": len(thoughts_data),
+                "message": f"Successfully exported {exported_count} thoughts to {output_path}",
+                "exported_count": exported_count,
                 "output_path": str(output_file.absolute())
             }
             
@@ -125,40 +195,16 @@ class ThoughtExporter:
                 "exported_count": 0
             }
     
-    async def _export_to_csv(self, thoughts: List[Any], output_path: str) -> Dict[str, Any]:
+    async def _export_to_csv(self, thoughts: Iterable[Any], output_path: str) -> Dict[str, Any]:
         """Export thoughts to CSV format."""
         try:
             output_file = Path(output_path)
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = [
-                    'id', 'category', 'content', 'tags', 'emotion', 
-                    'importance', 'novelty_score', 'created_at', 'updated_at'
-                ]
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                
-                # Write header
-                writer.writeheader()
-                
-                # Write thoughts
-                for thought in thoughts:
-                    writer.writerow({
-                        'id': str(thought.id),
-                        'category': thought.category,
-                        'content': thought.content,
-                        'tags': ','.join(thought.tags) if thought.tags else '',
-                        'emotion': thought.emotion or '',
-                        'importance': thought.importance or '',
-                        'novelty_score': getattr(thought, 'novelty_score', ''),
-                        'created_at': thought.created_at.isoformat() if thought.created_at else '',
-                        'updated_at': thought.updated_at.isoformat() if thought.updated_at else ''
-                    })
+            exported_count = await asyncio.to_thread(_write_csv_sync, thoughts, output_file)
             
             return {
                 "success": True,
-                "message": f"Successfully exported {len(thoughts)} thoughts to {output_path}",
-                "exported_count": len(thoughts),
+                "message": f"Successfully exported {exported_count} thoughts to {output_path}",
+                "exported_count": exported_count,
                 "output_path": str(output_file.absolute())
             }
             
@@ -169,62 +215,68 @@ class ThoughtExporter:
                 "exported_count": 0
             }
     
+    def get_export_statistics_sql(
+        self, db: Session, query_filters: Optional[ThoughtQuery] = None
+    ) -> Dict[str, Any]:
+        """get_export_statistics for the thoughts matching query_filters, aggregated in SQL."""
+        apply_filters = self.thought_logger._apply_filters
+        summary = self.thought_logger.aggregate_stats(db, query_filters)
+        
+        ranges: Select = select(
+            func.min(ThoughtModel.importance),
+            func.max(ThoughtModel.importance),
+            func.min(ThoughtModel.timestamp),
+            func.max(ThoughtModel.timestamp),
+        )
+        tag_counts: Select = select(ThoughtTagModel.tag, func.count())\
+            .join(ThoughtModel, ThoughtModel.id == ThoughtTagModel.thought_id)\
+            .group_by(ThoughtTagModel.tag)\
+            .order_by(desc(func.count()), ThoughtTagModel.tag)
+        if query_filters:
+            ranges = apply_filters(ranges, query_filters)
+            tag_counts = apply_filters(tag_counts, query_filters)
+        min_importance, max_importance, earliest, latest = db.execute(ranges).one()
+        
+        return {
+            "total": summary["total"],
+            "categories": summary["categories"],
+            "emotions": summary["emotions"],
+            "tags": {tag: count for tag, count in db.execute(tag_counts)},
+            "date_range": {
+                "earliest": earliest.isoformat() if earliest else None,
+                "latest": latest.isoformat() if latest else None
+            },
+            "importance": {
+                "average": summary["average_importance"] or 0.0,
+                "min": min_importance,
+                "max": max_importance
+            }
+        }
+    
     def get_export_statistics(self, thoughts: List[Any]) -> Dict[str, Any]:
-        """Generate statistics about the thoughts being exported."""
+        """Generate statistics about the thoughts being exported (already-loaded list)."""
         if not thoughts:
             return {"total": 0}
         
+        importance_values = [t.importance for t in thoughts if t.importance is not None]
+        # Thoughts are homogeneous, so one check decides for the whole list
+        has_created_at = hasattr(thoughts[0], 'created_at')
+        dates = [t.created_at for t in thoughts if t.created_at] if has_created_at else []
+        
         stats = {
             "total": len(thoughts),
-            "categories": {},
-            "emotions": {},
-            "tags": {},
+            "categories": dict(Counter(t.category for t in thoughts)),
+            "emotions": dict(Counter(t.emotion for t in thoughts if t.emotion)),
+            "tags": dict(Counter(itertools.chain.from_iterable(t.tags for t in thoughts if t.tags))),
             "date_range": {
-                "earliest": None,
-                "latest": None
+                "earliest": min(dates).isoformat() if dates else None,
+                "latest": max(dates).isoformat() if dates else None
             },
             "importance": {
-                "average": 0.0,
-                "min": None,
-                "max": None
+                "average": fmean(importance_values) if importance_values else 0.0,
+                "min": min(importance_values, default=None),
+                "max": max(importance_values, default=None)
             }
         }
         
-        importance_values = []
-        dates = []
-        
-        for thought in thoughts:
-            # Categories
-            category = thought.category
-            stats["categories"][category] = stats["categories"].get(category, 0) + 1
-            
-            # Emotions
-            if thought.emotion:
-                emotion = thought.emotion
-                stats["emotions"][emotion] = stats["emotions"].get(emotion, 0) + 1
-            
-            # Tags
-            if thought.tags:
-                for tag in thought.tags:
-                    stats["tags"][tag] = stats["tags"].get(tag, 0) + 1
-            
-            # Importance
-            if thought.importance is not None:
-                importance_values.append(thought.importance)
-            
-            # Dates
-            if thought.created_at:
-                dates.append(thought.created_at)
-        
-        # Calculate importance stats
-        if importance_values:
-            stats["importance"]["average"] = sum(importance_values) / len(importance_values)
-            stats["importance"]["min"] = min(importance_values)
-            stats["importance"]["max"] = max(importance_values)
-        
-        # Calculate date range
-        if dates:
-            stats["date_range"]["earliest"] = min(dates).isoformat()
-            stats["date_range"]["latest"] = max(dates).isoformat()
-        
         return stats
@@ -1,3 +1,4 @@
+from collections import Counter
 from datetime import datetime
 from typing import List, Optional, Union
 
@@ -9,6 +10,25 @@ from rich.text import Text
 from models.thought import Thought, ThoughtsListResponse
 
 
+# Importance markup by fifth of the 0-1 range: <0.4 dim, <0.6 green, <0.8 yellow, else red
+_IMPORTANCE_COLORS = ("dim", "dim", "green", "yellow", "red")
+_IMPORTANCE_MARKUP = tuple(f"[{color}]{{:.2f}}[/{color}]" for color in _IMPORTANCE_COLORS)
+
+
+SEPARATOR = "-" * 80
+
+
+def _format_timestamp(timestamp: datetime) -> str:
+    """'YYYY-MM-DD HH:MM:SS' via isoformat, which skips strftime's format parsing."""
+    # Slicing drops any UTC offset isoformat appends for aware datetimes
+    return timestamp.isoformat(" ", "seconds")[:19]
+
+
+def _importance_bucket(importance: float) -> int:
+    """Index into the importance lookup tables."""
+    return max(0, min(int(importance * 5), 4))
+
+
 class ThoughtFormatter:
     """Service for formatting thoughts for display."""
     
@@ -19,24 +39,7 @@ class ThoughtFormatter:
         """Format a single thought for display."""
         
         # Format timestamp
-        timestamp_str = thought.timestamp.strftime("%Y-%m-%d %H:%M:%S")
-        
-        # Create basic info
-        info_parts = [
-            f"ID: {thought.id}",
-            f"Time: {timestamp_str}",
-            f"Category: {thought.category.upper()}",
-        ]
-        
-        if thought.importance is not None:
-            info_parts.append(f"Importance: {thought.importance:.2f}")
-        
-        if thought.emotion:
-            info_parts.append(f"Emotion: {thought.emotion}")
-        
-        if thought.tags:
-            tags_str = ", ".join(thought.tags)
-            info_parts.append(f"Tags: {tags_str}")
+        timestamp_str = _format_timestamp(thought.timestamp)
         
         # Create formatted output
         if detailed:
@@ -49,9 +52,8 @@ class ThoughtFormatter:
             ]
             
             if thought.importance is not None:
-                importance_color = self._get_importance_color(thought.importance)
                 content_lines.append(
-                    f"[bold]Importance:[/bold] [{importance_color}]{thought.importance:.2f}[/{importance_color}]"
+                    "[bold]Importance:[/bold] " + self._format_importance(thought.importance)
                 )
             
             if thought.emotion:
@@ -67,10 +69,17 @@ class ThoughtFormatter:
             
             return Panel("\n".join(content_lines), title=panel_title, expand=False)
         else:
-            # Simple text format
-            info_str = " | ".join(info_parts)
+            # Simple text format, built as one string without a parts list
+            importance_str = (
+                f" | Importance: {thought.importance:.2f}" if thought.importance is not None else ""
+            )
+            emotion_str = f" | Emotion: {thought.emotion}" if thought.emotion else ""
+            tags_str = f" | Tags: {', '.join(thought.tags)}" if thought.tags else ""
             content_preview = self._truncate_content(thought.content, 100)
-            return f"{info_str}\n{content_preview}\n{'-' * 80}"
+            return (
+                f"ID: {thought.id} | Time: {timestamp_str} | Category: {thought.category.upper()}"
+                f"{importance_str}{emotion_str}{tags_str}\n{content_preview}\n{SEPARATOR}"
+            )
     
     def format_thoughts_list(self, response: ThoughtsListResponse) -> str:
         """Format a list of thoughts for display."""
@@ -106,7 +115,7 @@ class ThoughtFormatter:
         
         for thought in response.thoughts:
             # Format timestamp
-            time_str = thought.timestamp.strftime("%m-%d %H:%M:%S")
+            time_str = _format_timestamp(thought.timestamp)[5:]  # MM-DD HH:MM:SS
             
             # Format content preview
             content_preview = self._truncate_content(thought.content, 45)
@@ -119,8 +128,7 @@ class ThoughtFormatter:
             # Format importance with color
             importance_str = ""
             if thought.importance is not None:
-                color = self._get_importance_color(thought.importance)
-                importance_str = f"[{color}]{thought.importance:.2f}[/{color}]"
+                importance_str = self._format_importance(thought.importance)
             
             table.add_row(
                 time_str,
@@ -140,23 +148,13 @@ class ThoughtFormatter:
             return "No thoughts to analyze."
         
         # Calculate statistics
-        categories = {}
-        emotions = {}
-        total_importance = 0
-        importance_count = 0
-        
-        for thought in response.thoughts:
-            # Count categories
-            categories[thought.category] = categories.get(thought.category, 0) + 1
-            
-            # Count emotions
-            if thought.emotion:
-                emotions[thought.emotion] = emotions.get(thought.emotion, 0) + 1
-            
-            # Sum importance
-            if thought.importance is not None:
-                total_importance += thought.importance
-                importance_count += 1
+        categories = Counter(thought.category for thought in response.thoughts)
+        emotions = Counter(thought.emotion for thought in response.thoughts if thought.emotion)
+        importances = [
+            thought.importance for thought in response.thoughts if thought.importance is not None
+        ]
+        total_importance = sum(importances)
+        importance_count = len(importances)
         
         # Format statistics
         stats = [
@@ -193,14 +191,11 @@ class ThoughtFormatter:
     
     def _get_importance_color(self, importance: float) -> str:
         """Get color based on importance level."""
-        if importance >= 0.8:
-            return "red"
-        elif importance >= 0.6:
-            return "yellow"
-        elif importance >= 0.4:
-            return "green"
-        else:
-            return "dim"
+        return _IMPORTANCE_COLORS[_importance_bucket(importance)]
+    
+    def _format_importance(self, importance: float) -> str:
+        """Importance as colored rich markup, from the precomputed templates."""
+        return _IMPORTANCE_MARKUP[_importance_bucket(importance)].format(importance)
 
 
 # Global formatter instance
@@ -1,23 +1,94 @@
+import base64
+import binascii
 import logging
+import operator
 from datetime import datetime
-from typing import List, Optional
-from uuid import UUID
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from uuid import UUID, uuid4
 
-from sqlalchemy import and_, desc, or_
+from sqlalchemy import Float, Select, and_, case, column, delete, desc, func, insert, lambda_stmt, or_, select, update, values
 from sqlalchemy.orm import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from config import settings
-from db.models import ThoughtModel
+from db.models import GUID, ThoughtModel, ThoughtTagModel
 from models.thought import (
     Thought,
     ThoughtCreate,
     ThoughtQuery,
-    ThoughtResponse,
     ThoughtsListResponse,
     ThoughtUpdate,
 )
 from services.nlp_analyzer import EnhancedThoughtScorer
 
+# Declarative scalar filters: (ThoughtQuery field, column, comparison).
+# Every filter is compiled into the WHERE clause so the indexed columns
+# do the work instead of Python.
+FILTER_SPEC: Tuple[Tuple[str, Any, Callable[[Any, Any], Any]], ...] = (
+    ("category", ThoughtModel.category, operator.eq),
+    ("emotion", ThoughtModel.emotion, operator.eq),
+    ("min_importance", ThoughtModel.importance, operator.ge),
+    ("max_importance", ThoughtModel.importance, operator.le),
+    ("start_date", ThoughtModel.timestamp, operator.ge),
+    ("end_date", ThoughtModel.timestamp, operator.le),
+    ("created_after", ThoughtModel.timestamp, operator.ge),
+    ("created_before", ThoughtModel.timestamp, operator.le),
+)
+
+# Rows per UPDATE ... FROM (VALUES ...) statement; two bound parameters each
+IMPORTANCE_UPDATE_CHUNK = 5000
+
+# Columns accepted by ThoughtQuery.order_by
+SORTABLE_COLUMNS: Dict[str, Any] = {
+    "timestamp": ThoughtModel.timestamp,
+    "category": ThoughtModel.category,
+    "importance": ThoughtModel.importance,
+    "emotion": ThoughtModel.emotion,
+}
+
+
+def encode_cursor(timestamp: datetime, thought_id: UUID) -> str:
+    """Encode a (timestamp, id) keyset position as an opaque cursor."""
+    raw = f"{timestamp.isoformat()}|{thought_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Decode a cursor produced by encode_cursor; raises ValueError if malformed."""
+    try:
+        timestamp, thought_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(timestamp), UUID(thought_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+# Hot lookups as lambda statements: SQLAlchemy builds and cache-keys each
+# statement once and afterwards only re-binds the captured values
+def _thought_by_id(thought_id: UUID) -> StatementLambdaElement:
+    """SELECT of one thought by primary key."""
+    return lambda_stmt(lambda: select(ThoughtModel).where(ThoughtModel.id == thought_id))
+
+
+def _thoughts_in_id_range(low: UUID, high: UUID) -> StatementLambdaElement:
+    """SELECT of thoughts whose primary key lies in [low, high], in key order."""
+    return lambda_stmt(
+        lambda: select(ThoughtModel)
+        .where(ThoughtModel.id >= low, ThoughtModel.id <= high)
+        .order_by(ThoughtModel.id)
+    )
+
+
+def id_prefix_bounds(prefix: str) -> Optional[Tuple[UUID, UUID]]:
+    """Smallest and largest UUID starting with a hex prefix, or None if it cannot match.
+    
+    Canonical UUID text sorts like its hex digits, so the range is index-seekable
+    on both the CHAR(36) and native UUID column types.
+    """
+    digits = prefix.strip().lower().replace("-", "")
+    if len(digits) > 32 or any(c not in "0123456789abcdef" for c in digits):
+        return None
+    return UUID(digits.ljust(32, "0")), UUID(digits.ljust(32, "f"))
+
 
 class ThoughtLogger:
     """Service for logging and managing thoughts."""
@@ -26,8 +97,13 @@ class ThoughtLogger:
         self.logger = logging.getLogger(__name__)
         self.nlp_scorer = EnhancedThoughtScorer()
         
-    def create_thought(self, session: Session, thought_data: ThoughtCreate) -> Thought:
-        """Create a new thought entry with enhanced NLP analysis."""
+    def create_thought(
+        self, session: Session, thought_data: ThoughtCreate, commit: bool = True
+    ) -> Thought:
+        """Create a new thought entry with enhanced NLP analysis.
+        
+        With commit=False the row is only flushed, leaving the commit to the caller's transaction.
+        """
         self.logger.info(f"Creating thought with category: {thought_data.category}")
         
         # Get existing content for novelty analysis (last 10 thoughts)
@@ -59,8 +135,14 @@ class ThoughtLogger:
         )
         
         session.add(db_thought)
-        session.commit()
-        session.refresh(db_thought)
+        if thought_data.tags:
+            session.flush()  # assigns the id the tag rows reference
+            self._insert_tag_rows(session, [(db_thought.id, thought_data.tags)])
+        if commit:
+            session.commit()
+            session.refresh(db_thought)
+        else:
+            session.flush()
         
         # Convert to Pydantic model
         thought = self._db_to_pydantic(db_thought)
@@ -68,18 +150,77 @@ class ThoughtLogger:
         
         return thought
     
+    def create_thoughts_bulk(
+        self, session: Session, thoughts_data: List[ThoughtCreate]
+    ) -> List[Thought]:
+        """Create many thoughts with a single multi-row INSERT and one commit."""
+        if not thoughts_data:
+            return []
+        self.logger.info(f"Bulk creating {len(thoughts_data)} thoughts")
+        
+        # Novelty window: last 10 stored thoughts, then slide over the batch
+        existing_thoughts: List[Any] = session.query(ThoughtModel.content)\
+            .order_by(desc(ThoughtModel.timestamp))\
+            .limit(10)\
+            .all()
+        existing_content = [t.content for t in reversed(existing_thoughts)]
+        
+        now = datetime.utcnow()
+        rows: List[Dict[str, Any]] = []
+        for thought_data in thoughts_data:
+            importance = thought_data.importance
+            if importance is None and settings.enable_importance_scoring:
+                importance, _ = self.nlp_scorer.calculate_enhanced_importance(
+                    thought_data.content,
+                    existing_content=existing_content[-10:]
+                )
+            elif importance is None:
+                importance = settings.default_importance
+            existing_content.append(thought_data.content)
+            
+            rows.append({
+                "id": uuid4(),
+                "timestamp": now,
+                "category": thought_data.category,
+                "content": thought_data.content,
+                "tags": thought_data.tags,
+                "emotion": thought_data.emotion if settings.enable_emotions else None,
+                "importance": importance,
+            })
+        
+        session.execute(insert(ThoughtModel), rows)
+        self._insert_tag_rows(session, [(row["id"], row["tags"]) for row in rows])
+        session.commit()
+        
+        self.logger.info(f"Bulk created {len(rows)} thoughts")
+        return [Thought(**row) for row in rows]
+    
     def get_thought(self, session: Session, thought_id: UUID) -> Optional[Thought]:
         """Retrieve a thought by ID."""
-        db_thought = session.query(ThoughtModel).filter(ThoughtModel.id == thought_id).first()
+        db_thought = session.scalars(_thought_by_id(thought_id)).first()
         if db_thought:
             return self._db_to_pydantic(db_thought)
         return None
     
+    def find_thoughts_by_id_prefix(
+        self, session: Session, prefix: str, limit: Optional[int] = None
+    ) -> List[Thought]:
+        """Thoughts whose ID starts with prefix, via a range scan on the primary key."""
+        bounds = id_prefix_bounds(prefix)
+        if bounds is None:
+            return []
+        low, high = bounds
+        stmt = _thoughts_in_id_range(low, high)
+        if limit is not None:
+            stmt += lambda s: s.limit(limit)
+        db_thoughts = session.scalars(stmt).all()
+        return [self._db_to_pydantic(db_thought) for db_thought in db_thoughts]
+    
     def update_thought(
         self, session: Session, thought_id: UUID, update_data: ThoughtUpdate
     ) -> Optional[Thought]:
         """Update an existing thought."""
-        db_thought = session.query(ThoughtModel).filter(ThoughtModel.id == thought_id).first()
+        db_thought = session.scalars(_thought_by_id(thought_id)).first()
         if not db_thought:
             return None
             
@@ -89,6 +230,8 @@ class ThoughtLogger:
             if field == "emotion" and not settings.enable_emotions:
                 continue
             setattr(db_thought, field, value)
+        if "tags" in update_dict:
+            self._replace_tag_rows(session, thought_id, update_dict["tags"])
         
         session.commit()
         session.refresh(db_thought)
@@ -96,10 +239,58 @@ class ThoughtLogger:
         self.logger.info(f"Updated thought with ID: {thought_id}")
         return self._db_to_pydantic(db_thought)
     
+    def update_thought_atomic(
+        self,
+        session: Session,
+        thought_id: UUID,
+        update_data: ThoughtUpdate,
+        add_tags: Optional[List[str]] = None,
+    ) -> Optional[Thought]:
+        """Update a thought with one UPDATE ... RETURNING, merging add_tags in the same transaction."""
+        update_values = update_data.model_dump(exclude_unset=True)
+        if not settings.enable_emotions:
+            update_values.pop("emotion", None)
+        
+        if add_tags:
+            # Read-merge-write under a row lock (a no-op on SQLite, whose writers are serialized)
+            current_tags = session.execute(
+                select(ThoughtModel.tags).where(ThoughtModel.id == thought_id).with_for_update()
+            ).scalar_one_or_none()
+            if current_tags is None:
+                return None
+            new_tags = [tag.strip().lower() for tag in add_tags if tag.strip()]
+            update_values["tags"] = list(dict.fromkeys([*update_values.get("tags", current_tags), *new_tags]))
+        
+        if not session.get_bind().dialect.update_returning:
+            # Engines without RETURNING take the fetch-then-update path
+            return self.update_thought(session, thought_id, ThoughtUpdate(**update_values))
+        
+        if not update_values:
+            return self.get_thought(session, thought_id)
+        
+        db_thought = session.scalars(
+            update(ThoughtModel)
+            .where(ThoughtModel.id == thought_id)
+            .values(**update_values)
+            .returning(ThoughtModel)
+        ).one_or_none()
+        if db_thought is None:
+            session.rollback()
+            return None
+        thought = self._db_to_pydantic(db_thought)
+        if "tags" in update_values:
+            self._replace_tag_rows(session, thought_id, update_values["tags"])
+        session.commit()
+        
+        self.logger.info(f"Updated thought with ID: {thought_id}")
+        return thought
+    
     def delete_thought(self, session: Session, thought_id: UUID) -> bool:
         """Delete a thought by ID."""
-        db_thought = session.query(ThoughtModel).filter(ThoughtModel.id == thought_id).first()
+        db_thought = session.scalars(_thought_by_id(thought_id)).first()
         if db_thought:
+            # SQLite does not enforce the ON DELETE CASCADE by default
+            session.execute(delete(ThoughtTagModel).where(ThoughtTagModel.thought_id == thought_id))
             session.delete(db_thought)
             session.commit()
             self.logger.info(f"Deleted thought with ID: {thought_id}")
@@ -135,6 +326,61 @@ class ThoughtLogger:
         
         return db_query.count()
     
+    def exists(self, session: Session, query: Optional[ThoughtQuery] = None) -> bool:
+        """Whether any thought matches the query's filters; stops at the first match."""
+        stmt: Select = select(ThoughtModel.id)
+        if query:
+            stmt = self._apply_filters(stmt, query)
+        return session.execute(stmt.limit(1)).first() is not None
+    
+    def count_by_tag(
+        self, session: Session, tags: List[str], recent: Optional[int] = None
+    ) -> Dict[str, int]:
+        """Count thoughts carrying each of the given tags, aggregated in SQL.
+        
+        When recent is given, only the most recent N thoughts are considered.
+        """
+        stmt: Select = select(ThoughtTagModel.tag, func.count())\
+            .where(ThoughtTagModel.tag.in_(tags))\
+            .group_by(ThoughtTagModel.tag)
+        if recent:
+            recent_ids: Select = select(ThoughtModel.id).order_by(desc(ThoughtModel.timestamp)).limit(recent)
+            stmt = stmt.where(ThoughtTagModel.thought_id.in_(recent_ids.scalar_subquery()))
+        counts = {tag_name: 0 for tag_name in tags}
+        counts.update({tag_name: count for tag_name, count in session.execute(stmt)})
+        return counts
+    
+    def aggregate_stats(
+        self, session: Session, query: Optional[ThoughtQuery] = None, skip_zero_importance: bool = False
+    ) -> dict:
+        """Category/emotion counts and average importance, aggregated in SQL.
+        
+        With skip_zero_importance, thoughts scored 0.0 are left out of the
+        average along with unscored ones.
+        """
+        def grouped(column: Any) -> Dict[Any, int]:
+            stmt: Select = select(column, func.count()).where(column.is_not(None))
+            if query:
+                stmt = self._apply_filters(stmt, query)
+            stmt = stmt.group_by(column).order_by(desc(func.count()), column)
+            return {value: count for value, count in session.execute(stmt)}
+        
+        importance: Any = ThoughtModel.importance
+        if skip_zero_importance:
+            # AVG ignores the NULLs the CASE yields for zero scores
+            importance = case((ThoughtModel.importance > 0, ThoughtModel.importance))
+        totals = select(func.count(), func.avg(importance)).select_from(ThoughtModel)
+        if query:
+            totals = self._apply_filters(totals, query)
+        total, average_importance = session.execute(totals).one()
+        
+        return {
+            "total": total,
+            "categories": grouped(ThoughtModel.category),
+            "emotions": grouped(ThoughtModel.emotion),
+            "average_importance": average_importance,
+        }
+    
     def list_thoughts(
         self,
         session: Session,
@@ -160,14 +406,35 @@ class ThoughtLogger:
         order_by = getattr(query, 'order_by', 'timestamp') if query else 'timestamp'
         order_desc = getattr(query, 'order_desc', True) if query else True
         
+        order_column = SORTABLE_COLUMNS.get(order_by, ThoughtModel.timestamp)
+        keyset = order_column is ThoughtModel.timestamp
         if order_desc:
-            db_query = db_query.order_by(desc(getattr(ThoughtModel, order_by, ThoughtModel.timestamp)))
+            db_query = db_query.order_by(desc(order_column), desc(ThoughtModel.id))
         else:
-            db_query = db_query.order_by(getattr(ThoughtModel, order_by, ThoughtModel.timestamp))
+            db_query = db_query.order_by(order_column, ThoughtModel.id)
+        
+        # Apply pagination: seek past the cursor when given, else OFFSET
+        cursor = query.cursor if query else None
+        if cursor and keyset:
+            cursor_ts, cursor_id = decode_cursor(cursor)
+            if order_desc:
+                db_query = db_query.filter(or_(
+                    ThoughtModel.timestamp < cursor_ts,
+                    and_(ThoughtModel.timestamp == cursor_ts, ThoughtModel.id < cursor_id),
+                ))
+            else:
+                db_query = db_query.filter(or_(
+                    ThoughtModel.timestamp > cursor_ts,
+                    and_(ThoughtModel.timestamp == cursor_ts, ThoughtModel.id > cursor_id),
+                ))
+        else:
+            db_query = db_query.offset((page - 1) * page_size)
+        db_thoughts = db_query.limit(page_size).all()
         
-        # Apply pagination
-        offset = (page - 1) * page_size
-        db_thoughts = db_query.offset(offset).limit(page_size).all()
+        next_cursor = None
+        if keyset and len(db_thoughts) == page_size:
+            last = db_thoughts[-1]
+            next_cursor = encode_cursor(last.timestamp, last.id)
         
         # Convert to Pydantic models
         thoughts = [self._db_to_pydantic(db_thought) for db_thought in db_thoughts]
@@ -175,13 +442,44 @@ class ThoughtLogger:
         total_pages = (total + page_size - 1) // page_size
         
         return ThoughtsListResponse(
-            thoughts=[ThoughtResponse(**thought.model_dump()) for thought in thoughts],
+            thoughts=thoughts,
             total=total,
             page=page,
             page_size=page_size,
             total_pages=total_pages,
+            next_cursor=next_cursor,
         )
     
+    def iter_thoughts(
+        self,
+        session: Session,
+        query: Optional[ThoughtQuery] = None,
+        chunk_size: int = 1000,
+        limit: Optional[int] = None,
+    ) -> Iterator[ThoughtModel]:
+        """Stream every thought matching the query's filters and ordering.
+        
+        Pagination fields are ignored (use limit to cap the rows); rows are
+        fetched chunk_size at a time so memory stays flat regardless of how
+        many thoughts match.
+        """
+        stmt = select(ThoughtModel)
+        if query:
+            stmt = self._apply_filters(stmt, query)
+        
+        order_by = (query.order_by if query else None) or 'timestamp'
+        order_desc = query.order_desc if query else True
+        order_column = SORTABLE_COLUMNS.get(order_by, ThoughtModel.timestamp)
+        if order_desc:
+            stmt = stmt.order_by(desc(order_column), desc(ThoughtModel.id))
+        else:
+            stmt = stmt.order_by(order_column, ThoughtModel.id)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        
+        result = session.execute(stmt.execution_options(yield_per=chunk_size))
+        yield from result.scalars()
+    
     def log_perception(self, session: Session, content: str, **kwargs) -> Thought:
         """Convenience method for logging perceptions."""
         thought_data = ThoughtCreate(
@@ -229,39 +527,18 @@ class ThoughtLogger:
     
     def _apply_filters(self, query, filters: ThoughtQuery):
         """Apply query filters to the database query."""
-        if filters.category:
-            query = query.filter(ThoughtModel.category == filters.category)
-        
-        # Handle both tags (list) and tag (single) fields
-        if filters.tags:
-            # Filter thoughts that contain any of the specified tags
-            tag_conditions = []
-            for tag in filters.tags:
-                tag_conditions.append(ThoughtModel.tags.contains([tag]))
-            query = query.filter(or_(*tag_conditions))
-        elif filters.tag:
-            query = query.filter(ThoughtModel.tags.contains([filters.tag]))
-        
-        if filters.emotion:
-            query = query.filter(ThoughtModel.emotion == filters.emotion)
-        
-        if filters.min_importance is not None:
-            query = query.filter(ThoughtModel.importance >= filters.min_importance)
-        
-        if filters.max_importance is not None:
-            query = query.filter(ThoughtModel.importance <= filters.max_importance)
-        
-        if filters.start_date:
-            query = query.filter(ThoughtModel.timestamp >= filters.start_date)
-        
-        if filters.end_date:
-            query = query.filter(ThoughtModel.timestamp <= filters.end_date)
-        
-        if filters.created_after:
-            query = query.filter(ThoughtModel.timestamp >= filters.created_after)
-        
-        if filters.created_before:
-            query = query.filter(ThoughtModel.timestamp <= filters.created_before)
+        for field, column, op in FILTER_SPEC:
+            value = getattr(filters, field)
+            if value is not None and value != "":
+                query = query.filter(op(column, value))
+        
+        # Handle both tags (list) and tag (single) fields; thoughts carrying
+        # any of them, looked up through the thought_tags index
+        wanted_tags = filters.tags or ([filters.tag] if filters.tag else None)
+        if wanted_tags:
+            query = query.filter(ThoughtModel.id.in_(
+                select(ThoughtTagModel.thought_id).where(ThoughtTagModel.tag.in_(wanted_tags))
+            ))
         
         # Handle both search_term and search fields
         search_text = filters.search_term or filters.search
@@ -273,7 +550,7 @@ class ThoughtLogger:
     
     def get_nlp_analysis(self, session: Session, thought_id: UUID) -> Optional[dict]:
         """Get comprehensive NLP analysis for a thought."""
-        db_thought = session.query(ThoughtModel).filter(ThoughtModel.id == thought_id).first()
+        db_thought = session.scalars(_thought_by_id(thought_id)).first()
         if not db_thought:
             return None
         
@@ -289,24 +566,43 @@ class ThoughtLogger:
     
     def recalculate_importance_bulk(self, session: Session, limit: Optional[int] = None) -> int:
         """Recalculate importance scores for existing thoughts using enhanced NLP."""
-        query = session.query(ThoughtModel).order_by(desc(ThoughtModel.timestamp))
+        columns = (ThoughtModel.id, ThoughtModel.content, ThoughtModel.importance, ThoughtModel.timestamp)
+        query: Select = select(*columns).order_by(desc(ThoughtModel.timestamp))
         if limit:
             query = query.limit(limit)
-        
-        thoughts = query.all()
-        updated_count = 0
-        
-        for thought in thoughts:
-            # Get context for novelty calculation
-            context_thoughts = session.query(ThoughtModel.content)\
-                .filter(and_(
-                    ThoughtModel.id != thought.id,
-                    ThoughtModel.timestamp < thought.timestamp
-                ))\
-                .order_by(desc(ThoughtModel.timestamp))\
-                .limit(10)\
-                .all()
-            existing_content = [str(t.content) for t in context_thoughts] if context_thoughts else []
+        thoughts = session.execute(query).all()
+        if not thoughts:
+            return 0
+        
+        # Novelty context for each thought is the 10 strictly older thoughts,
+        # i.e. the rows following it in this ordering. One extra query covers
+        # the context of the oldest selected rows instead of one query per row.
+        timeline: Sequence[Any] = thoughts
+        if limit:
+            # Unselected rows tied with the oldest selected one, then 10 strictly older
+            cutoff = thoughts[-1].timestamp
+            selected_at_cutoff = [row.id for row in thoughts if row.timestamp == cutoff]
+            tied: Sequence[Any] = session.execute(
+                select(*columns).where(
+                    ThoughtModel.timestamp == cutoff, ThoughtModel.id.not_in(selected_at_cutoff)
+                )
+            ).all()
+            older_rows: Sequence[Any] = session.execute(
+                select(*columns)
+                .where(ThoughtModel.timestamp < cutoff)
+                .order_by(desc(ThoughtModel.timestamp))
+                .limit(10)
+            ).all()
+            timeline = [*thoughts, *tied, *older_rows]
+        changes: List[Tuple[UUID, float]] = []
+        
+        older = 0
+        for index, thought in enumerate(thoughts):
+            # Skip rows sharing this timestamp; they are not strictly older
+            older = max(older, index + 1)
+            while older < len(timeline) and timeline[older].timestamp >= thought.timestamp:
+                older += 1
+            existing_content = [str(row.content) for row in timeline[older:older + 10]]
             
             # Calculate new importance
             new_importance, _ = self.nlp_scorer.calculate_enhanced_importance(
@@ -315,8 +611,7 @@ class ThoughtLogger:
             )
             
             # Update if significantly different  
-            # Get the current importance value from the database object
-            current_importance = getattr(thought, 'importance', None)
+            current_importance = thought.importance
             if current_importance is None:
                 current_importance = 0.0
             else:
@@ -326,16 +621,55 @@ class ThoughtLogger:
                     current_importance = 0.0
                     
             if abs(new_importance - current_importance) > 0.1:
-                # Update the database field properly
-                session.query(ThoughtModel)\
-                    .filter(ThoughtModel.id == thought.id)\
-                    .update({'importance': new_importance})
-                updated_count += 1
+                changes.append((thought.id, new_importance))
         
+        self._write_importances(session, changes)
+        updated_count = len(changes)
         session.commit()
         self.logger.info(f"Updated importance scores for {updated_count} thoughts")
         return updated_count
     
+    def _insert_tag_rows(self, session: Session, tagged: List[Tuple[UUID, List[str]]]) -> None:
+        """Add thought_tags rows for (thought id, tags) pairs."""
+        rows = [
+            {"tag": tag, "thought_id": thought_id}
+            for thought_id, tags in tagged
+            for tag in dict.fromkeys(tags or [])
+        ]
+        if rows:
+            session.execute(insert(ThoughtTagModel), rows)
+    
+    def _replace_tag_rows(self, session: Session, thought_id: UUID, tags: List[str]) -> None:
+        """Make a thought's thought_tags rows match its new tag list."""
+        session.execute(delete(ThoughtTagModel).where(ThoughtTagModel.thought_id == thought_id))
+        self._insert_tag_rows(session, [(thought_id, tags)])
+    
+    def _write_importances(self, session: Session, changes: List[Tuple[UUID, float]]) -> None:
+        """Apply (id, importance) pairs with one UPDATE ... FROM (VALUES ...) per chunk.
+        
+        The VALUES form is only used on SQLite 3.33+, where it has been verified;
+        other backends get one executemany by primary key.
+        """
+        if not changes:
+            return
+        dialect = session.get_bind().dialect
+        if dialect.name != "sqlite" or (dialect.server_version_info or ()) < (3, 33):
+            session.execute(
+                update(ThoughtModel),
+                [{"id": thought_id, "importance": importance} for thought_id, importance in changes],
+            )
+            return
+        for start in range(0, len(changes), IMPORTANCE_UPDATE_CHUNK):
+            data = values(
+                column("id", GUID()), column("importance", Float), name="data"
+            ).data(changes[start:start + IMPORTANCE_UPDATE_CHUNK]).cte("data")
+            session.execute(
+                update(ThoughtModel)
+                .where(ThoughtModel.id == data.c.id)
+                .values(importance=data.c.importance)
+                .execution_options(synchronize_session=False)
+            )
+    
     def _db_to_pydantic(self, db_thought: ThoughtModel) -> Thought:
         """Convert database model to Pydantic model."""
         thought_dict = db_thought.to_dict()
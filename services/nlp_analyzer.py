@@ -1,9 +1,11 @@
 """Advanced NLP analysis for thought scoring and processing."""
 
+import copy
 import re
 import math
-from typing import Dict, List, Set, Tuple, Union, Optional
+from typing import Dict, FrozenSet, List, Sequence, Set, Tuple, Union, Optional
 from collections import Counter
+from functools import lru_cache
 import logging
 from datetime import datetime
 
@@ -25,6 +27,27 @@ except ImportError:
 from sqlalchemy.orm import Session
 
 
+@lru_cache(maxsize=4096)
+def _ngram_set(text: str, n: int) -> FrozenSet[str]:
+    """Distinct word n-grams; memoized since each text is novelty context for up to 10 others."""
+    words = text.lower().split()
+    # zip over n staggered views yields each window without Python-level slicing
+    return frozenset(map(' '.join, zip(*(words[i:] for i in range(n)))))
+
+
+POSITIVE_WORDS = frozenset({
+    'good', 'great', 'excellent', 'amazing', 'wonderful', 'fantastic',
+    'love', 'like', 'enjoy', 'happy', 'excited', 'pleased', 'satisfied',
+    'awesome', 'brilliant', 'perfect', 'success', 'achievement', 'win'
+})
+
+NEGATIVE_WORDS = frozenset({
+    'bad', 'terrible', 'awful', 'horrible', 'hate', 'dislike', 'sad',
+    'angry', 'frustrated', 'disappointed', 'failed', 'failure', 'wrong',
+    'error', 'problem', 'issue', 'difficult', 'hard', 'struggle'
+})
+
+
 class NLPAnalyzer:
     """Advanced NLP analysis for thought content."""
     
@@ -115,26 +138,25 @@ class NLPAnalyzer:
     def calculate_novelty_score(
         self, 
         current_text: str, 
-        existing_texts: List[str],
+        existing_texts: Sequence[str],
         ngram_size: int = 3
     ) -> float:
         """Calculate novelty score based on n-gram overlap with existing content."""
         if not existing_texts:
             return 1.0  # Maximum novelty if no existing content
         
-        current_ngrams = set(self.extract_ngrams(current_text, ngram_size))
+        current_ngrams = _ngram_set(current_text, ngram_size)
         if not current_ngrams:
             return 0.5  # Neutral novelty for very short text
         
         # Calculate overlap with existing texts
         total_overlap = 0
+        current_count = len(current_ngrams)
         for existing_text in existing_texts:
-            existing_ngrams = set(self.extract_ngrams(existing_text, ngram_size))
+            existing_ngrams = _ngram_set(existing_text, ngram_size)
             if existing_ngrams:
-                overlap = len(current_ngrams.intersection(existing_ngrams))
-                max_possible = max(len(current_ngrams), len(existing_ngrams))
-                if max_possible > 0:
-                    total_overlap += overlap / max_possible
+                overlap = len(current_ngrams & existing_ngrams)
+                total_overlap += overlap / max(current_count, len(existing_ngrams))
         
         # Average overlap across all existing texts
         avg_overlap = total_overlap / len(existing_texts) if existing_texts else 0
@@ -145,21 +167,9 @@ class NLPAnalyzer:
     
     def analyze_sentiment_basic(self, text: str) -> Tuple[str, float]:
         """Basic sentiment analysis using keyword matching."""
-        positive_words = {
-            'good', 'great', 'excellent', 'amazing', 'wonderful', 'fantastic',
-            'love', 'like', 'enjoy', 'happy', 'excited', 'pleased', 'satisfied',
-            'awesome', 'brilliant', 'perfect', 'success', 'achievement', 'win'
-        }
-        
-        negative_words = {
-            'bad', 'terrible', 'awful', 'horrible', 'hate', 'dislike', 'sad',
-            'angry', 'frustrated', 'disappointed', 'failed', 'failure', 'wrong',
-            'error', 'problem', 'issue', 'difficult', 'hard', 'struggle'
-        }
-        
         words = set(text.lower().split())
-        positive_count = len(words.intersection(positive_words))
-        negative_count = len(words.intersection(negative_words))
+        positive_count = len(words.intersection(POSITIVE_WORDS))
+        negative_count = len(words.intersection(NEGATIVE_WORDS))
         
         total_sentiment_words = positive_count + negative_count
         if total_sentiment_words == 0:
@@ -183,7 +193,7 @@ class NLPAnalyzer:
         sentences = text.split('.')
         
         # Average word length
-        avg_word_length = sum(len(word) for word in words) / len(words) if words else 0
+        avg_word_length = sum(map(len, words)) / len(words) if words else 0
         
         # Average sentence length
         avg_sentence_length = len(words) / len(sentences) if sentences else 0
@@ -203,7 +213,7 @@ class NLPAnalyzer:
 class EnhancedThoughtScorer:
     """Enhanced thought scoring with NLP analysis."""
     
-    def __init__(self):
+    def __init__(self) -> None:
         self.nlp = NLPAnalyzer()
     
     def calculate_enhanced_importance(
@@ -214,7 +224,7 @@ class EnhancedThoughtScorer:
         novelty_weight: float = 0.3,
         sentiment_weight: float = 0.15,
         entropy_weight: float = 0.1,
-        existing_content: Optional[List[str]] = None
+        existing_content: Optional[Sequence[str]] = None
     ) -> Tuple[float, Dict[str, float]]:
         """Calculate enhanced importance score with detailed metrics."""
         
@@ -269,13 +279,18 @@ class EnhancedThoughtScorer:
     
     def get_enhanced_analysis(self, content: str, existing_content: Optional[List[str]] = None) -> Dict:
         """Get comprehensive NLP analysis of the content."""
+        # Cache entries are shared, so hand out a copy the caller may mutate
+        return copy.deepcopy(_cached_analysis(content, tuple(existing_content or ())))
+    
+    def _analyze(self, content: str, existing_content: Tuple[str, ...]) -> Dict:
+        """Uncached body of get_enhanced_analysis."""
         keywords = self.nlp.extract_keywords(content)
         keyword_density = self.nlp.calculate_keyword_density(content)
         repetition_score = self.nlp.calculate_repetition_score(content)
         entropy = self.nlp.calculate_entropy(content)
         sentiment, sentiment_score = self.nlp.analyze_sentiment_basic(content)
         complexity = self.nlp.calculate_complexity_score(content)
-        novelty = self.nlp.calculate_novelty_score(content, existing_content or [])
+        novelty = self.nlp.calculate_novelty_score(content, existing_content)
         importance, metrics = self.calculate_enhanced_importance(content, existing_content=existing_content)
         
         return {
@@ -292,3 +307,14 @@ class EnhancedThoughtScorer:
             'word_count': len(content.split()),
             'char_count': len(content)
         }
+
+
+# NLPAnalyzer holds no per-instance state, so analysis is a pure function of
+# (content, novelty context) and one module-level cache serves every scorer
+_analysis_scorer = EnhancedThoughtScorer()
+
+
+@lru_cache(maxsize=1024)
+def _cached_analysis(content: str, existing_content: Tuple[str, ...]) -> Dict:
+    """Memoized EnhancedThoughtScorer analysis; the shared result must not be mutated."""
+    return _analysis_scorer._analyze(content, existing_content)
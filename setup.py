@@ -0,0 +1,22 @@
+"""Optional ahead-of-time compilation for CPU-bound pure-Python modules.
+
+Project metadata lives in pyproject.toml. Set CORELOGGER_MYPYC=1 (with mypy
+installed) to compile the listed modules with mypyc; the compiled extension
+shadows the .py file, which stays in place as the fallback:
+
+    CORELOGGER_MYPYC=1 python setup.py build_ext --inplace
+"""
+
+import os
+
+from setuptools import setup
+
+MYPYC_MODULES = ["chat/utils.py"]
+
+ext_modules = []
+if os.getenv("CORELOGGER_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(["--explicit-package-bases", "--follow-imports=silent", *MYPYC_MODULES])
+
+setup(ext_modules=ext_modules)
@@ -15,6 +15,15 @@ class TestAPI:
         assert data["status"] == "healthy"
         assert "timestamp" in data
     
+    def test_health_check_repeated(self, client):
+        """Repeated health checks each get a complete JSON response."""
+        first = client.get("/api/v1/health")
+        second = client.get("/api/v1/health")
+        assert second.status_code == 200
+        assert second.headers["content-type"] == "application/json"
+        assert second.json()["status"] == "healthy"
+        assert second.headers["content-length"] == str(len(first.content))
+    
     def test_root_endpoint(self, client):
         """Test root endpoint."""
         response = client.get("/")
@@ -82,6 +91,27 @@ class TestAPI:
         response = client.post("/api/v1/thoughts", json=thought_data)
         assert response.status_code == 422  # Validation error
     
+    def test_create_thoughts_bulk(self, client):
+        """Test creating several thoughts in one request."""
+        thoughts_data = [
+            {"category": "tick", "content": "Bulk tick 1", "importance": 0.2},
+            {"category": "tick", "content": "Bulk tick 2", "tags": ["bulk"]},
+            {"category": "decision", "content": "Bulk decision"},
+        ]
+        
+        response = client.post("/api/v1/thoughts/bulk", json=thoughts_data)
+        assert response.status_code == 201
+        
+        data = response.json()
+        assert [t["content"] for t in data] == [t["content"] for t in thoughts_data]
+        assert data[0]["importance"] == 0.2
+        assert data[1]["tags"] == ["bulk"]
+        assert all(t["importance"] is not None for t in data)
+        
+        get_response = client.get(f"/api/v1/thoughts/{data[2]['id']}")
+        assert get_response.status_code == 200
+        assert get_response.json()["category"] == "decision"
+    
     def test_get_thought(self, client):
         """Test retrieving a thought by ID."""
         # Create a thought first
@@ -102,6 +132,25 @@ class TestAPI:
         assert data["id"] == thought_id
         assert data["content"] == "Test decision"
     
+    def test_get_thought_etag(self, client):
+        """Test conditional GET with ETag / If-None-Match."""
+        create_response = client.post(
+            "/api/v1/thoughts", json={"category": "perception", "content": "Etag me"}
+        )
+        thought_id = create_response.json()["id"]
+        
+        response = client.get(f"/api/v1/thoughts/{thought_id}")
+        etag = response.headers["ETag"]
+        
+        cached = client.get(f"/api/v1/thoughts/{thought_id}", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+        
+        client.put(f"/api/v1/thoughts/{thought_id}", json={"content": "Changed"})
+        changed = client.get(f"/api/v1/thoughts/{thought_id}", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etag
+    
     def test_get_nonexistent_thought(self, client):
         """Test retrieving a non-existent thought."""
         fake_id = str(uuid4())
@@ -133,6 +182,47 @@ class TestAPI:
         assert data["importance"] == 0.9
         assert data["category"] == "reflection"  # Unchanged
     
+    def test_get_thought_after_update(self, client):
+        """Test that a cached thought is refreshed after an update."""
+        create_response = client.post(
+            "/api/v1/thoughts", json={"category": "reflection", "content": "Before"}
+        )
+        thought_id = create_response.json()["id"]
+        
+        # Prime the cache
+        first = client.get(f"/api/v1/thoughts/{thought_id}")
+        assert first.json()["content"] == "Before"
+        
+        client.put(f"/api/v1/thoughts/{thought_id}", json={"content": "After"})
+        
+        response = client.get(f"/api/v1/thoughts/{thought_id}")
+        assert response.status_code == 200
+        assert response.json()["content"] == "After"
+        assert response.headers["ETag"] != first.headers["ETag"]
+    
+    def test_get_racing_update_is_not_cached(self, client, monkeypatch):
+        """Test that a read cached while an update is in flight is dropped afterwards."""
+        from api import routes
+        
+        create_response = client.post(
+            "/api/v1/thoughts", json={"category": "reflection", "content": "Before race"}
+        )
+        thought_id = create_response.json()["id"]
+        first = client.get(f"/api/v1/thoughts/{thought_id}")
+        original_update = routes.thought_logger.update_thought
+        
+        def update_with_racing_read(db, uuid, update_data):
+            # A concurrent GET re-caches the old row before the write commits
+            routes.thought_cache.set(uuid, routes.thought_logger.get_thought(db, uuid))
+            return original_update(db, uuid, update_data)
+        
+        monkeypatch.setattr(routes.thought_logger, "update_thought", update_with_racing_read)
+        client.put(f"/api/v1/thoughts/{thought_id}", json={"content": "After race"})
+        
+        response = client.get(f"/api/v1/thoughts/{thought_id}")
+        assert response.json()["content"] == "After race"
+        assert response.headers["ETag"] != first.headers["ETag"]
+    
     def test_delete_thought(self, client):
         """Test deleting a thought."""
         # Create a thought first
@@ -215,6 +305,25 @@ class TestAPI:
         assert data["page_size"] == 5
         assert len(data["thoughts"]) == 5
     
+    def test_list_thoughts_cursor_pagination(self, client):
+        """Test keyset pagination via next_cursor."""
+        for i in range(6):
+            client.post("/api/v1/thoughts", json={"category": "tick", "content": f"Cursor {i}"})
+        
+        first = client.get("/api/v1/thoughts?category=tick&page_size=3").json()
+        assert first["next_cursor"]
+        
+        second = client.get(
+            f"/api/v1/thoughts?category=tick&page_size=3&after={first['next_cursor']}"
+        ).json()
+        assert len(second["thoughts"]) == 3
+        first_ids = {t["id"] for t in first["thoughts"]}
+        assert not first_ids & {t["id"] for t in second["thoughts"]}
+        assert first["thoughts"][-1]["timestamp"] >= second["thoughts"][0]["timestamp"]
+        
+        response = client.get("/api/v1/thoughts?after=not-a-cursor")
+        assert response.status_code == 400
+    
     def test_convenience_endpoints(self, client):
         """Test convenience endpoints for different thought categories."""
         
@@ -81,3 +81,14 @@ def test_thought_query_with_filters():
     assert query.category == "reflection"
     assert query.tags == ["important"]
     assert query.search_term == "test"
+
+
+def test_frozen_settings_match_settings_fields():
+    """Test that the frozen settings snapshot declares every Settings field."""
+    from dataclasses import FrozenInstanceError, fields
+    
+    from config import Settings, settings
+    
+    assert [f.name for f in fields(settings)] == list(Settings.model_fields)
+    with pytest.raises(FrozenInstanceError):
+        settings.database_echo = True
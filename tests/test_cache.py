@@ -0,0 +1,97 @@
+import pytest
+
+from chat.cache import LLMCache, cached_response
+
+
+class CountingProvider:
+    """Provider double counting how often the underlying model is called."""
+    
+    provider_name = "fake"
+    model_name = "fake-model"
+    
+    def __init__(self, temperature=0.0, max_tokens=256, cache=None):
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        self.cache = cache
+        self.calls = 0
+    
+    @cached_response
+    def generate_response(self, prompt):
+        self.calls += 1
+        return f"response {self.calls} to {prompt}"
+
+
+class TestCachedResponse:
+    """Test cases for the cached_response decorator."""
+    
+    def test_zero_temperature_served_from_cache(self):
+        provider = CountingProvider(temperature=0.0, cache=LLMCache())
+        
+        first = provider.generate_response("hello")
+        second = provider.generate_response("hello")
+        
+        assert first == second == "response 1 to hello"
+        assert provider.calls == 1
+        assert len(provider.cache) == 1
+    
+    def test_different_prompts_are_separate_entries(self):
+        provider = CountingProvider(temperature=0.0, cache=LLMCache())
+        
+        provider.generate_response("hello")
+        provider.generate_response("goodbye")
+        
+        assert provider.calls == 2
+        assert len(provider.cache) == 2
+    
+    def test_positive_temperature_not_cached(self):
+        provider = CountingProvider(temperature=0.7, cache=LLMCache())
+        
+        first = provider.generate_response("hello")
+        second = provider.generate_response("hello")
+        
+        assert first != second
+        assert provider.calls == 2
+        assert len(provider.cache) == 0
+    
+    def test_no_cache_configured(self):
+        provider = CountingProvider(temperature=0.0, cache=None)
+        
+        provider.generate_response("hello")
+        provider.generate_response("hello")
+        
+        assert provider.calls == 2
+
+
+class TestLLMCache:
+    """Test cases for LLMCache."""
+    
+    def test_evicts_least_recently_used_at_maxsize(self):
+        cache = LLMCache(maxsize=2)
+        cache.set("a", "A")
+        cache.set("b", "B")
+        
+        # Touch "a" so "b" becomes the least recently used entry
+        assert cache.get("a") == "A"
+        cache.set("c", "C")
+        
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == "A"
+        assert cache.get("c") == "C"
+    
+    def test_evicted_call_hits_provider_again(self):
+        provider = CountingProvider(temperature=0.0, cache=LLMCache(maxsize=1))
+        
+        provider.generate_response("first")
+        provider.generate_response("second")
+        provider.generate_response("first")
+        
+        assert provider.calls == 3
+        assert len(provider.cache) == 1
+    
+    @pytest.mark.parametrize("field", ["model", "temperature", "max_tokens"])
+    def test_make_key_depends_on_request_parameters(self, field):
+        params = {"provider": "fake", "model": "m", "prompt": "p", "temperature": 0.0, "max_tokens": 10}
+        changed = dict(params, **{field: {"model": "other", "temperature": 0.5, "max_tokens": 20}[field]})
+        
+        assert LLMCache.make_key(**params) != LLMCache.make_key(**changed)
@@ -0,0 +1,93 @@
+import pytest
+from uuid import uuid4
+
+from typer.testing import CliRunner
+
+import cli.main
+from models.thought import ThoughtQuery
+from services.logger import thought_logger
+
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def cli_db(test_db_manager, monkeypatch):
+    """Point CLI commands at the test database."""
+    monkeypatch.setattr(cli.main, "_ensure_db", lambda: test_db_manager)
+    return test_db_manager
+
+
+@pytest.fixture
+def batch_tag():
+    """A tag unique to one test, so rows from other tests are not counted."""
+    return f"batch-{uuid4().hex[:8]}"
+
+
+def _batch_thoughts(db_session, tag):
+    return thought_logger.list_thoughts(db_session, ThoughtQuery(tags=[tag], size=100)).thoughts
+
+
+class TestLogBatch:
+    """Test cases for the log-batch command."""
+    
+    def test_log_batch_jsonl(self, cli_db, db_session, batch_tag, tmp_path):
+        """Test importing JSONL records, including a plain text line."""
+        path = tmp_path / "thoughts.jsonl"
+        path.write_text(
+            f'{{"content": "First batch thought", "tags": ["{batch_tag}", "alpha"]}}\n'
+            f'{{"content": "Second batch thought", "category": "observation", "tags": ["{batch_tag}"]}}\n'
+            "\n",
+            encoding="utf-8",
+        )
+        
+        result = runner.invoke(cli.main.app, ["log-batch", str(path), "--category", "reflection"])
+        
+        assert result.exit_code == 0, result.output
+        assert "Logged 2 thoughts." in result.output
+        thoughts = {t.content: t for t in _batch_thoughts(db_session, batch_tag)}
+        assert len(thoughts) == 2
+        assert thoughts["First batch thought"].category == "reflection"
+        assert sorted(thoughts["First batch thought"].tags) == sorted([batch_tag, "alpha"])
+        assert thoughts["Second batch thought"].category == "observation"
+        assert thoughts["Second batch thought"].tags == [batch_tag]
+    
+    def test_log_batch_csv(self, cli_db, db_session, batch_tag, tmp_path):
+        """Test importing CSV rows with ';'- and ','-separated tags."""
+        path = tmp_path / "thoughts.csv"
+        path.write_text(
+            "content,category,tags,importance\n"
+            f"CSV thought one,decision,{batch_tag};csv,0.8\n"
+            f'CSV thought two,,"{batch_tag},csv,extra",\n',
+            encoding="utf-8",
+        )
+        
+        result = runner.invoke(cli.main.app, ["log-batch", str(path), "--chunk-size", "1"])
+        
+        assert result.exit_code == 0, result.output
+        thoughts = {t.content: t for t in _batch_thoughts(db_session, batch_tag)}
+        assert len(thoughts) == 2
+        assert thoughts["CSV thought one"].category == "decision"
+        assert thoughts["CSV thought one"].importance == 0.8
+        assert sorted(thoughts["CSV thought one"].tags) == sorted([batch_tag, "csv"])
+        assert thoughts["CSV thought two"].category == "reflection"
+        assert sorted(thoughts["CSV thought two"].tags) == sorted([batch_tag, "csv", "extra"])
+    
+    def test_log_batch_skips_invalid_record(self, cli_db, db_session, batch_tag, tmp_path):
+        """Test that an invalid record is reported and skipped while the rest are logged."""
+        path = tmp_path / "thoughts.jsonl"
+        path.write_text(
+            f'{{"content": "Valid batch thought", "tags": ["{batch_tag}"]}}\n'
+            f'{{"content": "Out of range", "importance": 5, "tags": ["{batch_tag}"]}}\n'
+            f'{{"content": "Another valid thought", "tags": ["{batch_tag}"]}}\n',
+            encoding="utf-8",
+        )
+        
+        result = runner.invoke(cli.main.app, ["log-batch", str(path)])
+        
+        assert result.exit_code == 0, result.output
+        assert "Skipping record 2" in result.output
+        assert "Skipped 1 invalid records." in result.output
+        thoughts = _batch_thoughts(db_session, batch_tag)
+        assert sorted(t.content for t in thoughts) == ["Another valid thought", "Valid batch thought"]
+        assert all(t.tags == [batch_tag] for t in thoughts)
@@ -3,6 +3,7 @@ from datetime import datetime
 from uuid import uuid4
 
 from models.thought import ThoughtCreate, ThoughtQuery, ThoughtUpdate
+from services import nlp_analyzer
 from services.logger import ThoughtLogger
 
 
@@ -336,3 +337,159 @@ class TestThoughtLogger:
         # Test log_error
         error = self.logger.log_error(db_session, "An error occurred")
         assert error.category == "error"
+    
+    def test_count_by_tag(self, db_session):
+        """Test tag counts aggregated in SQL."""
+        self.logger.create_thoughts_bulk(db_session, [
+            ThoughtCreate(content="Tagged one", tags=["count-a", "count-b"]),
+            ThoughtCreate(content="Tagged two", tags=["count-a"]),
+            ThoughtCreate(content="Untagged"),
+        ])
+        
+        counts = self.logger.count_by_tag(db_session, ["count-a", "count-b", "count-c"])
+        
+        assert counts == {"count-a": 2, "count-b": 1, "count-c": 0}
+    
+    def test_exists(self, db_session):
+        """Test the LIMIT 1 existence probe."""
+        self.logger.create_thought(db_session, ThoughtCreate(content="Exists probe", tags=["exists-probe"]))
+        
+        assert self.logger.exists(db_session)
+        assert self.logger.exists(db_session, ThoughtQuery(tag="exists-probe"))
+        assert not self.logger.exists(db_session, ThoughtQuery(tag="exists-probe-missing"))
+    
+    def test_iter_thoughts(self, db_session):
+        """Test streaming every matching thought past the page size limit."""
+        self.logger.create_thoughts_bulk(db_session, [
+            ThoughtCreate(category="idea", content=f"Streamed idea {i}", importance=0.5)
+            for i in range(120)
+        ])
+        self.logger.create_thought(db_session, ThoughtCreate(category="goal", content="Not an idea"))
+        
+        query = ThoughtQuery(category="idea", size=10)
+        thoughts = list(self.logger.iter_thoughts(db_session, query, chunk_size=25))
+        
+        assert len(thoughts) == 120
+        assert all(thought.category == "idea" for thought in thoughts)
+        assert len(list(self.logger.iter_thoughts(db_session, query, chunk_size=25, limit=30))) == 30
+    
+    def test_aggregate_stats(self, db_session):
+        """Test category/emotion counts and average importance computed in SQL."""
+        self.logger.create_thoughts_bulk(db_session, [
+            ThoughtCreate(category="idea", content="Stats probe one", emotion="happy", importance=0.2),
+            ThoughtCreate(category="idea", content="Stats probe two", emotion="happy", importance=0.4),
+            ThoughtCreate(category="goal", content="Stats probe three", importance=0.6),
+        ])
+        
+        summary = self.logger.aggregate_stats(db_session, ThoughtQuery(search="Stats probe"))
+        
+        assert summary["total"] == 3
+        assert summary["categories"] == {"idea": 2, "goal": 1}
+        assert summary["emotions"] == {"happy": 2}
+        assert summary["average_importance"] == pytest.approx(0.4)
+    
+    def test_aggregate_stats_skip_zero_importance(self, db_session):
+        """Test that zero importance scores can be left out of the average."""
+        self.logger.create_thoughts_bulk(db_session, [
+            ThoughtCreate(category="idea", content="Zero probe one", importance=0.0),
+            ThoughtCreate(category="idea", content="Zero probe two", importance=0.6),
+        ])
+        query = ThoughtQuery(search="Zero probe")
+        
+        assert self.logger.aggregate_stats(db_session, query)["average_importance"] == pytest.approx(0.3)
+        summary = self.logger.aggregate_stats(db_session, query, skip_zero_importance=True)
+        assert summary["total"] == 2
+        assert summary["average_importance"] == pytest.approx(0.6)
+    
+    def test_create_thought_without_commit(self, db_session):
+        """Test that commit=False leaves the row to the caller's transaction."""
+        thought = self.logger.create_thought(
+            db_session, ThoughtCreate(category="idea", content="Uncommitted probe"), commit=False
+        )
+        assert self.logger.get_thought(db_session, thought.id) is not None
+        
+        db_session.rollback()
+        
+        assert self.logger.get_thought(db_session, thought.id) is None
+    
+    def test_update_thought_atomic(self, db_session):
+        """Test single-statement update with added tags merged in order."""
+        thought = self.logger.create_thought(
+            db_session, ThoughtCreate(category="reflection", content="Atomic probe", tags=["alpha"])
+        )
+        
+        updated = self.logger.update_thought_atomic(
+            db_session, thought.id, ThoughtUpdate(importance=0.9), add_tags=["Beta", "alpha"]
+        )
+        
+        assert updated is not None
+        assert updated.importance == 0.9
+        assert updated.tags == ["alpha", "beta"]
+        assert updated.content == "Atomic probe"
+        assert self.logger.get_thought(db_session, thought.id).tags == ["alpha", "beta"]
+        assert self.logger.update_thought_atomic(db_session, uuid4(), ThoughtUpdate(importance=0.1)) is None
+    
+    def test_find_thoughts_by_id_prefix(self, db_session):
+        """Test partial-ID lookup through a primary key range."""
+        thought = self.logger.create_thought(
+            db_session, ThoughtCreate(category="reflection", content="Prefix probe")
+        )
+        
+        matches = self.logger.find_thoughts_by_id_prefix(db_session, str(thought.id)[:8].upper())
+        
+        assert thought.id in [match.id for match in matches]
+        assert all(str(match.id).startswith(str(thought.id)[:8]) for match in matches)
+        full = self.logger.find_thoughts_by_id_prefix(db_session, str(thought.id))
+        assert [match.id for match in full] == [thought.id]
+        assert self.logger.find_thoughts_by_id_prefix(db_session, "not-hex") == []
+        assert len(self.logger.find_thoughts_by_id_prefix(db_session, "", limit=2)) == 2
+    
+    def test_get_nlp_analysis_is_cached(self, db_session):
+        """Test that repeat analysis of an unchanged thought is served from cache."""
+        thought = self.logger.create_thought(
+            db_session, ThoughtCreate(category="reflection", content="Cached analysis probe")
+        )
+        cache = nlp_analyzer._cached_analysis
+        
+        first = self.logger.get_nlp_analysis(db_session, thought.id)
+        hits = cache.cache_info().hits
+        first["importance_score"] = -1.0
+        first["keywords"].append("mutated")
+        first["importance_metrics"]["length_factor"] = -1.0
+        second = self.logger.get_nlp_analysis(db_session, thought.id)
+        
+        assert cache.cache_info().hits == hits + 1
+        assert second["importance_score"] != -1.0
+        assert "mutated" not in second["keywords"]
+        assert second["importance_metrics"]["length_factor"] != -1.0
+        assert second["word_count"] == 3
+    
+    def test_recalculate_importance_bulk(self, db_session):
+        """Test that rescored importances are written back in one batch."""
+        thought = self.logger.create_thought(
+            db_session, ThoughtCreate(category="reflection", content="Rescore probe", importance=1.0)
+        )
+        
+        updated_count = self.logger.recalculate_importance_bulk(db_session, limit=1)
+        
+        rescored = self.logger.get_thought(db_session, thought.id)
+        assert updated_count == 1
+        assert rescored.importance < 0.9
+    
+    def test_tag_filter_follows_tag_changes(self, db_session):
+        """Test that tag filters see every tag of a thought through updates and deletes."""
+        thought = self.logger.create_thought(
+            db_session, ThoughtCreate(category="reflection", content="Tag index probe", tags=["idx-first", "idx-second"])
+        )
+        
+        def matching(tag):
+            return [t.id for t in self.logger.list_thoughts(db_session, ThoughtQuery(tag=tag)).thoughts]
+        
+        assert matching("idx-second") == [thought.id]
+        
+        self.logger.update_thought(db_session, thought.id, ThoughtUpdate(tags=["idx-third"]))
+        assert matching("idx-second") == []
+        assert matching("idx-third") == [thought.id]
+        
+        self.logger.delete_thought(db_session, thought.id)
+        assert matching("idx-third") == []
@@ -103,6 +103,7 @@ class TestPydanticModels:
         assert len(thought.tags) == 2
         assert "test" in thought.tags
         assert "reflection" in thought.tags
+        assert thought.tags == ["test", "reflection"]  # First-seen order is kept
     
     def test_thought_emotion_validation(self):
         """Test emotion validation and cleaning."""
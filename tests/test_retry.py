@@ -0,0 +1,108 @@
+import pytest
+
+import chat.retry
+from chat.retry import backoff_delay, is_retryable, retry_sync
+
+
+class RateLimitError(Exception):
+    """Stand-in for an SDK rate-limit error, matched by class name."""
+    
+    def __init__(self, message="rate limited", headers=None):
+        super().__init__(message)
+        self.response = type("Response", (), {"headers": headers or {}})()
+
+
+class SubclassedRateLimitError(RateLimitError):
+    pass
+
+
+class FlakyProvider:
+    """Provider double whose call raises the queued errors before succeeding."""
+    
+    def __init__(self, errors, max_retries=2):
+        self.errors = list(errors)
+        self.max_retries = max_retries
+        self.calls = 0
+    
+    @retry_sync
+    def generate(self, prompt):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return f"reply to {prompt}"
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """Record backoff sleeps instead of waiting."""
+    sleeps = []
+    monkeypatch.setattr(chat.retry.time, "sleep", sleeps.append)
+    return sleeps
+
+
+class TestIsRetryable:
+    """Test cases for is_retryable."""
+    
+    def test_matches_by_class_name(self):
+        assert is_retryable(RateLimitError())
+        assert is_retryable(SubclassedRateLimitError())
+        assert not is_retryable(ValueError("bad request"))
+    
+    def test_looks_through_runtime_error_cause(self):
+        try:
+            try:
+                raise RateLimitError()
+            except RateLimitError as e:
+                raise RuntimeError("OpenAI API error") from e
+        except RuntimeError as wrapped:
+            assert is_retryable(wrapped)
+        
+        assert not is_retryable(RuntimeError("no cause"))
+
+
+class TestBackoffDelay:
+    """Test cases for backoff_delay."""
+    
+    def test_honours_retry_after(self):
+        assert backoff_delay(0, RateLimitError(headers={"retry-after": "3"})) == 3.0
+    
+    def test_honours_retry_after_ms(self):
+        assert backoff_delay(4, RateLimitError(headers={"retry-after-ms": "250"})) == 0.25
+    
+    def test_server_delay_is_capped(self):
+        assert backoff_delay(0, RateLimitError(headers={"retry-after": "600"})) == chat.retry.MAX_DELAY
+    
+    def test_ignores_ratelimit_reset(self):
+        delay = backoff_delay(0, RateLimitError(headers={"x-ratelimit-reset": "1760000000"}))
+        assert chat.retry.BASE_DELAY <= delay <= chat.retry.BASE_DELAY + 1
+    
+    def test_exponential_without_headers(self):
+        delay = backoff_delay(3, RateLimitError())
+        assert chat.retry.BASE_DELAY * 8 <= delay <= chat.retry.BASE_DELAY * 8 + 1
+
+
+class TestRetrySync:
+    """Test cases for retry_sync."""
+    
+    def test_retries_until_success(self, no_sleep):
+        provider = FlakyProvider([RateLimitError(), RateLimitError()], max_retries=2)
+        
+        assert provider.generate("hi") == "reply to hi"
+        assert provider.calls == 3
+        assert len(no_sleep) == 2
+    
+    def test_stops_at_max_retries(self, no_sleep):
+        provider = FlakyProvider([RateLimitError() for _ in range(5)], max_retries=2)
+        
+        with pytest.raises(RateLimitError):
+            provider.generate("hi")
+        assert provider.calls == 3
+        assert len(no_sleep) == 2
+    
+    def test_does_not_retry_other_errors(self, no_sleep):
+        provider = FlakyProvider([ValueError("bad request")], max_retries=2)
+        
+        with pytest.raises(ValueError):
+            provider.generate("hi")
+        assert provider.calls == 1
+        assert no_sleep == []
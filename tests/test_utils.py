@@ -0,0 +1,40 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+import chat.utils
+
+
+SAMPLES = [
+    "",
+    "How do I fix this python bug? It is critical",
+    "I love this, great work! **Really** happy with the `api` design.",
+    "We decided to analyze the database schema and compare the options carefully.",
+    "ugh, this is frustrating and annoying " * 20,
+]
+
+
+@pytest.fixture(scope="module")
+def pure_utils():
+    """Load chat/utils.py from source, bypassing any compiled extension."""
+    path = Path(chat.utils.__file__).with_name("utils.py")
+    spec = importlib.util.spec_from_file_location("_pure_chat_utils", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.parametrize("text", SAMPLES)
+@pytest.mark.parametrize("is_ai_response", [False, True])
+def test_extract_features_matches_pure_python(pure_utils, text, is_ai_response):
+    compiled = chat.utils.extract_features(text, is_ai_response)
+    pure = pure_utils.extract_features(text, is_ai_response)
+    
+    assert tuple(compiled) == tuple(pure)
+    assert chat.utils.extract_tags(text, is_ai_response) == pure_utils.extract_tags(text, is_ai_response)
+
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_clean_ai_response_matches_pure_python(pure_utils, text):
+    assert chat.utils.clean_ai_response(text) == pure_utils.clean_ai_response(text)
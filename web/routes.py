@@ -11,6 +11,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from fastapi import APIRouter, Request, Form, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.templating import Jinja2Templates
 from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
@@ -19,7 +20,7 @@ from pydantic import BaseModel
 
 from db.session import get_db
 from models.thought import ThoughtCreate, ThoughtQuery
-from services.logger import ThoughtLogger
+from services.logger import thought_logger
 
 # Try to import Gemini AI library with proper error handling
 GEMINI_AVAILABLE = False
@@ -70,10 +71,11 @@ async def health_check():
     }
 
 
+# Routes that query the database are plain (sync) functions so FastAPI runs
+# them in its threadpool instead of blocking the event loop on the Session
 @router.get("/dashboard", response_class=HTMLResponse)
-async def dashboard(request: Request, db: Session = Depends(get_db)):
+def dashboard(request: Request, db: Session = Depends(get_db)):
     """Main dashboard view with recent AI interactions and system stats."""
-    thought_logger = ThoughtLogger()
     
     # Get recent AI interactions (last 10)
     query = ThoughtQuery(
@@ -101,7 +103,7 @@ async def dashboard(request: Request, db: Session = Depends(get_db)):
 
 
 @router.get("/thoughts", response_class=HTMLResponse)
-async def thoughts_list(
+def thoughts_list(
     request: Request,
     page: int = 1,
     size: int = 20,
@@ -111,7 +113,6 @@ async def thoughts_list(
     db: Session = Depends(get_db)
 ):
     """Paginated AI interaction logs with filtering and analysis."""
-    thought_logger = ThoughtLogger()
     
     query = ThoughtQuery(
         page=page,
@@ -145,9 +146,8 @@ async def thoughts_list(
 
 
 @router.get("/thoughts/{thought_id}", response_class=HTMLResponse)
-async def thought_detail(request: Request, thought_id: str, db: Session = Depends(get_db)):
+def thought_detail(request: Request, thought_id: str, db: Session = Depends(get_db)):
     """Individual AI interaction detail view with metadata analysis."""
-    thought_logger = ThoughtLogger()
     
     try:
         ai_interaction = thought_logger.get_thought_by_id(db, thought_id)
@@ -195,7 +195,9 @@ async def chat_api(chat_request: ChatRequest, db: Session = Depends(get_db)):
             response_text = f"Mock response from {chat_request.provider}: This is a simulated response to '{chat_request.message}'"
         
         # Always log AI interactions to CoreLogger (this is the main purpose)
-        await log_ai_interaction(db, chat_request.message, response_text, chat_request.provider)
+        await run_in_threadpool(
+            log_ai_interaction, db, chat_request.message, response_text, chat_request.provider
+        )
         
         return ChatResponse(
             success=True,
@@ -244,7 +246,7 @@ async def call_gemini_api(message: str, show_thinking: bool = False) -> str:
             
             # Generate response with basic settings
             try:
-                response = model.generate_content(enhanced_prompt)
+                response = await run_in_threadpool(model.generate_content, enhanced_prompt)
                 
                 if response and hasattr(response, 'text') and response.text:
                     return response.text.strip()
@@ -267,11 +269,9 @@ async def call_gemini_api(message: str, show_thinking: bool = False) -> str:
         return f"⚠️ Unexpected Error: I encountered an unexpected issue while processing '{message}'. Here's a helpful response instead: Thank you for your question. While I can't provide AI-generated insights right now, I encourage you to reflect on this topic and log your own thoughts for future reference. Error details: {str(e)}"
 
 
-async def log_ai_interaction(db: Session, user_message: str, ai_response: str, provider: str = "gemini"):
+def log_ai_interaction(db: Session, user_message: str, ai_response: str, provider: str = "gemini"):
     """Log AI interaction to CoreLogger database with automatic metadata analysis."""
     try:
-        thought_logger = ThoughtLogger()
-        
         # Simple emotion detection based on keywords and sentiment
         user_emotion = detect_emotion(user_message)
         ai_emotion = detect_emotion(ai_response)